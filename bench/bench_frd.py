@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+bench_frd
+
+benchmark das coordenadas distância/radial (tipo 'D'): fórmula fechada (padrão), geodésica exata
+(Vincenty, v_frd_exact) e o antigo caminho pelo plano de referência (geo2xyz, soma d·cos/sin,
+xyz2geo), reconstruído aqui apenas para comparação
+
+uso: python bench/bench_frd.py [número de registros do lote]
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import collections
+import importlib.util
+import math
+import os
+import sys
+import timeit
+import types
+
+# numpy
+import numpy as np
+
+# raiz do repositório (pacote libs.coords)
+M_DIR_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# módulos importados pelo nome simples
+if M_DIR_ROOT not in sys.path:
+    sys.path.insert(0, M_DIR_ROOT)
+
+# pacote libs.coords apontando para a raiz do repositório (se não instalado)
+if importlib.util.find_spec("libs") is None:
+    l_spec = importlib.util.spec_from_file_location("libs.coords", os.path.join(M_DIR_ROOT, "__init__.py"),
+                                                    submodule_search_locations=[M_DIR_ROOT])
+    sys.modules["libs"] = types.ModuleType("libs")
+    sys.modules["libs"].__path__ = []
+    sys.modules["libs.coords"] = importlib.util.module_from_spec(l_spec)
+    sys.modules["libs"].coords = sys.modules["libs.coords"]
+    l_spec.loader.exec_module(sys.modules["libs.coords"])
+
+# libs
+import libs.coords.coord_conv as conv
+import libs.coords.coord_defs as cdefs
+import libs.coords.coord_geodesic as gdsc
+import libs.coords.coord_sys as csys
+
+# < module data >----------------------------------------------------------------------------------
+
+# dados de um fixo
+M_NT_FIX = collections.namedtuple("CFix", "v_fix_ok f_fix_lat f_fix_lng")
+
+# repetições (o tempo é o mínimo)
+M_REPEAT = 7
+
+# -------------------------------------------------------------------------------------------------
+def __flat(f_sys, ff_lat, ff_lng, ff_rad, ff_dst):
+    """
+    caminho antigo: fixo no plano de referência, soma d·cos/sin e volta para geográfica
+    """
+    l_ref = f_sys.ref_frame
+
+    lf_x, lf_y, _ = f_sys.geo2xyz(ff_lat, ff_lng, f_ref=l_ref)
+
+    lf_vd = ff_dst * cdefs.D_CNV_NM2M
+    lf_vr = math.radians(conv.azm2ang(ff_rad))
+
+    # return
+    return f_sys.xyz2geo(lf_x + lf_vd * math.cos(lf_vr), lf_y + lf_vd * math.sin(lf_vr), f_ref=l_ref)[:2]
+
+# -------------------------------------------------------------------------------------------------
+def __flat_vec(f_sys, fa_lat, fa_lng, fa_rad, fa_dst):
+    """
+    caminho antigo em lote
+    """
+    l_ref = f_sys.ref_frame
+
+    la_x, la_y, _ = f_sys.geo2xyz_vec(fa_lat, fa_lng, f_ref=l_ref)
+
+    la_vd = fa_dst * cdefs.D_CNV_NM2M
+    la_vr = np.radians(conv.azm2ang_vec(fa_rad))
+
+    # return
+    return f_sys.xyz2geo_vec(la_x + la_vd * np.cos(la_vr), la_y + la_vd * np.sin(la_vr), f_ref=l_ref)[:2]
+
+# -------------------------------------------------------------------------------------------------
+def __time(f_fn, fi_num):
+    """
+    tempo mínimo de uma chamada (s)
+    """
+    return min(timeit.repeat(f_fn, number=fi_num, repeat=M_REPEAT)) / fi_num
+
+# -------------------------------------------------------------------------------------------------
+def main(fi_len=20000):
+    """
+    executa o benchmark
+    """
+    l_sys = csys.CCoordSys(-22., -43., -21.)
+    l_sys.set_fix("ABC", M_NT_FIX(True, -20., -40.))
+
+    l_rng = np.random.default_rng(23)
+
+    la_rad = l_rng.uniform(0., 360., fi_len)
+    la_dst = l_rng.uniform(0., 100., fi_len)
+
+    la_lat = np.full(fi_len, -20.)
+    la_lng = np.full(fi_len, -40.)
+
+    # colunas de new_coord_vec
+    la_tipo = np.full(fi_len, "D", dtype=object)
+    la_cpo_a = np.full(fi_len, "ABC", dtype=object)
+    la_cpo_b = np.array([str(lf_val) for lf_val in la_dst], dtype=object)
+    la_cpo_c = np.array([str(lf_val) for lf_val in la_rad], dtype=object)
+
+    print("ponto (us)             plano    vincenty  fechada")
+    print("  destino             {:7.2f}  {:8.2f}  {:7.2f}".format(
+          __time(lambda: __flat(l_sys, -20., -40., 90., 50.), 20000) * 1e6,
+          __time(lambda: gdsc.direct(-20., -40., 90., 50.), 20000) * 1e6,
+          __time(lambda: gdsc.destination(-20., -40., 90., 50.), 20000) * 1e6))
+
+    lf_fch = __time(lambda: l_sys.new_coord('D', "ABC", "50", "90"), 20000)
+    l_sys.v_frd_exact = True
+    lf_vin = __time(lambda: l_sys.new_coord('D', "ABC", "50", "90"), 20000)
+    l_sys.v_frd_exact = False
+
+    print("  new_coord                    {:8.2f}  {:7.2f}".format(lf_vin * 1e6, lf_fch * 1e6))
+
+    print("lote de {} (ms)".format(fi_len))
+    print("  destino             {:7.2f}  {:8.2f}  {:7.2f}".format(
+          __time(lambda: __flat_vec(l_sys, la_lat, la_lng, la_rad, la_dst), 5) * 1e3,
+          __time(lambda: gdsc.direct_vec(la_lat, la_lng, la_rad, la_dst), 5) * 1e3,
+          __time(lambda: gdsc.destination_vec(la_lat, la_lng, la_rad, la_dst), 5) * 1e3))
+
+    lf_fch = __time(lambda: l_sys.new_coord_vec(la_tipo, la_cpo_a, la_cpo_b, la_cpo_c), 5)
+    l_sys.v_frd_exact = True
+    lf_vin = __time(lambda: l_sys.new_coord_vec(la_tipo, la_cpo_a, la_cpo_b, la_cpo_c), 5)
+    l_sys.v_frd_exact = False
+
+    print("  new_coord_vec                {:8.2f}  {:7.2f}".format(lf_vin * 1e3, lf_fch * 1e3))
+
+    # erro da fórmula fechada em relação à geodésica exata
+    la_lat_v, la_lng_v, _ = gdsc.direct_vec(la_lat, la_lng, la_rad, la_dst)
+    la_lat_f, la_lng_f = gdsc.destination_vec(la_lat, la_lng, la_rad, la_dst)
+
+    print("erro máximo da fórmula fechada até 100 NM: {:.2f} m".format(
+          np.max(gdsc.inverse_vec(la_lat_v, la_lng_v, la_lat_f, la_lng_f)[0]) * cdefs.D_CNV_NM2M))
+
+# -------------------------------------------------------------------------------------------------
+if "__main__" == __name__:
+    # executa o benchmark
+    main(*[int(ls_arg) for ls_arg in sys.argv[1:2]])
+
+# < the end >--------------------------------------------------------------------------------------
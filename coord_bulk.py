@@ -0,0 +1,327 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+coord_bulk
+
+conversão em massa de coordenadas com um pool de processos (ProcessPoolExecutor)
+
+a entrada (arrays ou arquivo texto) é dividida em blocos, cada bloco é convertido em um processo
+de trabalho já inicializado com a referência e as tabelas de fixos do sistema de coordenadas e os
+resultados são remontados na ordem de entrada
+
+com blocos em memória compartilhada (pos_shm), apenas o nome dos segmentos e os limites de cada
+bloco trafegam entre os processos: os processos de trabalho convertem direto no bloco de saída
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import collections
+import concurrent.futures
+import io
+import itertools
+import logging
+import os
+
+# numpy
+import numpy as np
+
+# libs
+import libs.coords.coord_geod as geod
+import libs.coords.coord_sys as csys
+import libs.coords.pos_shm as pshm
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+M_LOG = logging.getLogger(__name__)
+M_LOG.setLevel(logging.DEBUG)
+
+# tamanho padrão do bloco (pontos ou linhas)
+M_CHUNK = 1 << 18
+
+# blocos em processamento por processo de trabalho (limita a memória em uso)
+M_INFLIGHT = 2
+
+# operações do sistema de coordenadas (métodos em lote de CCoordSys)
+M_SET_OPS_SYS = frozenset(("decl_xyz_vec", "geo2xyz_vec", "new_coord_vec", "xyz2geo_vec"))
+
+# operações geodésicas (funções em lote de coord_geod)
+M_SET_OPS_GEOD = frozenset(("ecef2geod_vec", "geod2ecef_vec"))
+
+# operações com colunas de entrada texto (as demais são numéricas)
+M_SET_OPS_STR = frozenset(("new_coord_vec",))
+
+# fixo enviado aos processos de trabalho (os objetos originais podem não ser serializáveis)
+CFIX = collections.namedtuple("CFIX", "v_fix_ok f_fix_lat f_fix_lng")
+
+# sistema de coordenadas do processo de trabalho
+M_COORD_SYS = None
+
+# -------------------------------------------------------------------------------------------------
+def __apply(f_coord_sys, fs_op, ft_cols):
+    """
+    aplica a operação a um bloco de colunas
+
+    @return tupla de colunas de saída
+    """
+    # operação do sistema de coordenadas ?
+    if fs_op in M_SET_OPS_SYS:
+        return tuple(getattr(f_coord_sys, fs_op)(*ft_cols))
+
+    # senão, operação geodésica
+    return tuple(getattr(geod, fs_op)(*ft_cols))
+
+# -------------------------------------------------------------------------------------------------
+def convert_file(fs_op, fs_inp, fs_out, f_coord_sys, fi_workers=None, fi_chunk=M_CHUNK, fs_sep=",", fs_fmt="%.12g"):
+    """
+    converte um arquivo texto (uma coordenada por linha, campos separados por fs_sep). O arquivo
+    é lido e escrito em blocos, sem carregá-lo inteiro na memória
+
+    @param fs_op: operação (ver M_SET_OPS_SYS e M_SET_OPS_GEOD)
+    @param fs_inp: arquivo de entrada
+    @param fs_out: arquivo de saída
+    @param f_coord_sys: sistema de coordenadas (CCoordSys)
+    @param fi_workers: número de processos (None = número de CPUs, 1 = no próprio processo)
+    @param fi_chunk: linhas por bloco
+    @param fs_sep: separador de campos
+    @param fs_fmt: formato dos campos reais da saída
+
+    @return número de linhas convertidas
+    """
+    li_lin = 0
+
+    with io.open(fs_inp, "r") as lfh_inp, io.open(fs_out, "w") as lfh_out:
+        # blocos de linhas
+        l_blks = iter(lambda: list(itertools.islice(lfh_inp, fi_chunk)), [])
+
+        # converte os blocos (na ordem de entrada)
+        for ls_blk in __run(__work_lines, ((fs_op, llst_lin, fs_sep, fs_fmt) for llst_lin in l_blks),
+                            f_coord_sys, fi_workers):
+            # salva o bloco
+            lfh_out.write(ls_blk)
+            li_lin += ls_blk.count("\n")
+
+    # logger
+    M_LOG.info("convert_file: {} linha(s) convertida(s) ({}).".format(li_lin, fs_op))
+
+    # return
+    return li_lin
+
+# -------------------------------------------------------------------------------------------------
+def convert_shm(fs_op, f_inp, f_out, f_coord_sys, fi_workers=None, fi_chunk=M_CHUNK):
+    """
+    converte um bloco de posições em memória compartilhada para outro, sem cópias entre processos.
+    Cada processo de trabalho abre os segmentos pelo nome (uma única vez) e escreve a sua fatia do
+    bloco de saída
+
+    @param fs_op: operação numérica (ver M_SET_OPS_SYS e M_SET_OPS_GEOD)
+    @param f_inp: bloco de entrada (CPosShm)
+    @param f_out: bloco de saída (CPosShm), mesmo tamanho, pode ser o próprio bloco de entrada
+    @param f_coord_sys: sistema de coordenadas (CCoordSys)
+    @param fi_workers: número de processos (None = número de CPUs, 1 = no próprio processo)
+    @param fi_chunk: pontos por bloco
+
+    @return bloco de saída
+    """
+    # check input
+    assert (fs_op in M_SET_OPS_SYS) or (fs_op in M_SET_OPS_GEOD)
+    assert fs_op not in M_SET_OPS_STR
+    assert isinstance(f_inp, pshm.CPosShm) and isinstance(f_out, pshm.CPosShm)
+    assert len(f_inp) == len(f_out)
+    assert fi_chunk > 0
+
+    # blocos (limites das fatias)
+    l_blks = ((fs_op, f_inp, f_out, li_ini, min(li_ini + fi_chunk, len(f_inp)))
+              for li_ini in range(0, len(f_inp), fi_chunk))
+
+    # converte os blocos
+    li_pts = sum(__run(__work_shm, l_blks, f_coord_sys, fi_workers))
+
+    # logger
+    M_LOG.debug("convert_shm: {} ponto(s) convertido(s) ({}).".format(li_pts, fs_op))
+
+    # return
+    return f_out
+
+# -------------------------------------------------------------------------------------------------
+def convert_vec(fs_op, ft_cols, f_coord_sys, fi_workers=None, fi_chunk=M_CHUNK):
+    """
+    converte colunas (arrays) em blocos
+
+    @param fs_op: operação (ver M_SET_OPS_SYS e M_SET_OPS_GEOD)
+    @param ft_cols: tupla de colunas de entrada (mesmo tamanho), na ordem dos argumentos da operação
+    @param f_coord_sys: sistema de coordenadas (CCoordSys)
+    @param fi_workers: número de processos (None = número de CPUs, 1 = no próprio processo)
+    @param fi_chunk: pontos por bloco
+
+    @return tupla de colunas de saída, na ordem de entrada
+    """
+    # check input
+    assert (fs_op in M_SET_OPS_SYS) or (fs_op in M_SET_OPS_GEOD)
+    assert fi_chunk > 0
+
+    # colunas de entrada
+    llst_col = [np.asarray(l_col, dtype=object if fs_op in M_SET_OPS_STR else np.float64) for l_col in ft_cols]
+    li_len = len(llst_col[0])
+
+    # blocos (views das colunas)
+    l_blks = ((fs_op, tuple(la_col[li_ini:li_ini + fi_chunk] for la_col in llst_col))
+              for li_ini in range(0, li_len, fi_chunk))
+
+    # converte os blocos (na ordem de entrada)
+    llst_out = list(__run(__work_cols, l_blks, f_coord_sys, fi_workers))
+
+    # nenhum bloco ?
+    if not llst_out:
+        return tuple(__apply(f_coord_sys, fs_op, tuple(la_col[:0] for la_col in llst_col)))
+
+    # remonta as colunas
+    return tuple(np.concatenate(lt_col) for lt_col in zip(*llst_out))
+
+# -------------------------------------------------------------------------------------------------
+def __init_worker(ft_ref, fdct_fix, fdct_fix_indc, fv_frd_exact=False):
+    """
+    inicia o processo de trabalho, criando o seu sistema de coordenadas
+
+    @param ft_ref: referência (lat, lng, declinação magnética)
+    @param fdct_fix: dicionário de fixos (CFIX)
+    @param fdct_fix_indc: dicionário de indicativos
+    @param fv_frd_exact: coordenadas distância/radial pela geodésica exata (Vincenty)
+    """
+    global M_COORD_SYS
+
+    # sistema de coordenadas do processo (mesmo modo distância/radial do processo principal)
+    M_COORD_SYS = csys.CCoordSys(*ft_ref, fv_frd_exact=fv_frd_exact)
+
+    M_COORD_SYS.dct_fix = fdct_fix
+    M_COORD_SYS.dct_fix_indc = fdct_fix_indc
+
+    # compila a tabela de fixos antes do primeiro bloco (a propriedade monta a tabela)
+    M_COORD_SYS.fix_tab
+
+# -------------------------------------------------------------------------------------------------
+def __run(f_work, f_blks, f_coord_sys, fi_workers):
+    """
+    executa f_work sobre os blocos, no próprio processo ou no pool, devolvendo os resultados na
+    ordem dos blocos. No pool, o número de blocos em processamento é limitado
+
+    @return gerador dos resultados
+    """
+    # número de processos
+    li_workers = fi_workers or os.cpu_count() or 1
+
+    # no próprio processo ? (usa o sistema de coordenadas recebido)
+    if 1 == li_workers:
+        for lt_blk in f_blks:
+            yield f_work(*lt_blk, f_coord_sys=f_coord_sys)
+
+        # cai fora
+        return
+
+    # referência e fixos para os processos de trabalho
+    lt_ref = (f_coord_sys.f_ref_lat, f_coord_sys.f_ref_lng, f_coord_sys.f_dcl_mag)
+
+    ldct_fix = {ls_fix: CFIX(bool(l_fix.v_fix_ok), l_fix.f_fix_lat, l_fix.f_fix_lng)
+                for ls_fix, l_fix in (f_coord_sys.dct_fix or {}).items()}
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=li_workers, initializer=__init_worker,
+                                                initargs=(lt_ref, ldct_fix, dict(f_coord_sys.dct_fix_indc or {}),
+                                                          f_coord_sys.v_frd_exact)) as l_pool:
+        # blocos em processamento (na ordem de entrada)
+        lqu_fut = collections.deque()
+
+        for lt_blk in f_blks:
+            # janela cheia ? aguarda o bloco mais antigo
+            if len(lqu_fut) >= (M_INFLIGHT * li_workers):
+                yield lqu_fut.popleft().result()
+
+            # envia o bloco
+            lqu_fut.append(l_pool.submit(f_work, *lt_blk))
+
+        # blocos restantes
+        while lqu_fut:
+            yield lqu_fut.popleft().result()
+
+# -------------------------------------------------------------------------------------------------
+def __work_cols(fs_op, ft_cols, f_coord_sys=None):
+    """
+    converte um bloco de colunas (no processo de trabalho, se f_coord_sys é None)
+    """
+    return __apply(f_coord_sys or M_COORD_SYS, fs_op, ft_cols)
+
+# -------------------------------------------------------------------------------------------------
+def __work_shm(fs_op, f_inp, f_out, fi_ini, fi_fim, f_coord_sys=None):
+    """
+    converte a fatia [fi_ini, fi_fim) do bloco de entrada para o bloco de saída (no processo de
+    trabalho, se f_coord_sys é None)
+
+    @return número de pontos convertidos
+    """
+    # converte a fatia (views do segmento de entrada)
+    lt_out = __apply(f_coord_sys or M_COORD_SYS, fs_op, tuple(la_col[fi_ini:fi_fim] for la_col in f_inp.cols))
+
+    # escreve no segmento de saída
+    for la_dst, la_col in zip(f_out.cols, lt_out):
+        la_dst[fi_ini:fi_fim] = la_col
+
+    # return
+    return fi_fim - fi_ini
+
+# -------------------------------------------------------------------------------------------------
+def __work_lines(fs_op, flst_lin, fs_sep, fs_fmt, f_coord_sys=None):
+    """
+    converte um bloco de linhas texto (no processo de trabalho, se f_coord_sys é None)
+
+    @return bloco de linhas de saída
+    """
+    # campos de cada linha
+    llst_fld = [ls_lin.rstrip("\r\n").split(fs_sep) for ls_lin in flst_lin if ls_lin.strip()]
+
+    if not llst_fld:
+        return ""
+
+    # transpõe as linhas em colunas (campos ausentes = "")
+    llst_col = list(itertools.zip_longest(*llst_fld, fillvalue=""))
+
+    # colunas numéricas ?
+    if fs_op not in M_SET_OPS_STR:
+        llst_col = [np.array(lt_col, dtype=np.float64) for lt_col in llst_col]
+
+    else:
+        llst_col = [np.array([ls_fld.strip() for ls_fld in lt_col], dtype=object) for lt_col in llst_col]
+
+    # converte
+    lt_out = __apply(f_coord_sys or M_COORD_SYS, fs_op, tuple(llst_col))
+
+    # formata a saída
+    lfh_out = io.StringIO()
+
+    np.savetxt(lfh_out, np.column_stack(lt_out), delimiter=fs_sep,
+               fmt=[("%d" if np.issubdtype(la_col.dtype, np.integer) else fs_fmt) for la_col in lt_out])
+
+    # return
+    return lfh_out.getvalue()
+
+# < the end >--------------------------------------------------------------------------------------
@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+coord_cache
+
+cache LRU (least recently used) de tamanho limitado, com contadores de acertos, faltas e remoções
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import collections
+import threading
+
+# < class CLRUCache >------------------------------------------------------------------------------
+
+class CLRUCache(object):
+    """
+    cache LRU de tamanho limitado. As operações são protegidas por um lock, o cache pode ser
+    compartilhado entre threads
+    """
+    # ---------------------------------------------------------------------------------------------
+    def __init__(self, fi_max):
+        """
+        constructor
+
+        @param fi_max: número máximo de entradas
+        """
+        # inicia a super classe
+        super(CLRUCache, self).__init__()
+
+        # check input
+        assert fi_max > 0
+
+        # número máximo de entradas
+        self.__i_max = int(fi_max)
+
+        # entradas (da menos para a mais recentemente usada)
+        self.__dct_ent = collections.OrderedDict()
+
+        # contadores
+        self.__i_hits = 0
+        self.__i_misses = 0
+        self.__i_evictions = 0
+
+        # lock das entradas e contadores
+        self.__lock = threading.Lock()
+
+    # ---------------------------------------------------------------------------------------------
+    def __len__(self):
+        """
+        número de entradas
+        """
+        return len(self.__dct_ent)
+
+    # ---------------------------------------------------------------------------------------------
+    def clear(self):
+        """
+        remove todas as entradas (os contadores são mantidos)
+        """
+        with self.__lock:
+            self.__dct_ent.clear()
+
+    # ---------------------------------------------------------------------------------------------
+    def get(self, f_key, f_default=None):
+        """
+        obtém uma entrada, marcando-a como a mais recentemente usada
+
+        @param f_key: chave
+        @param f_default: valor se a chave não existe
+
+        @return valor da entrada ou f_default
+        """
+        with self.__lock:
+            # entrada existe ?
+            try:
+                l_val = self.__dct_ent[f_key]
+
+            # senão, falta
+            except KeyError:
+                self.__i_misses += 1
+
+                # return
+                return f_default
+
+            # acerto
+            self.__i_hits += 1
+            self.__dct_ent.move_to_end(f_key)
+
+        # return
+        return l_val
+
+    # ---------------------------------------------------------------------------------------------
+    def put(self, f_key, f_val):
+        """
+        salva uma entrada, removendo a menos recentemente usada se o cache está cheio
+
+        @param f_key: chave
+        @param f_val: valor
+        """
+        with self.__lock:
+            # salva a entrada
+            self.__dct_ent[f_key] = f_val
+            self.__dct_ent.move_to_end(f_key)
+
+            # cache cheio ?
+            if len(self.__dct_ent) > self.__i_max:
+                # remove a entrada menos recentemente usada
+                self.__dct_ent.popitem(last=False)
+                self.__i_evictions += 1
+
+    # ---------------------------------------------------------------------------------------------
+    def reset_stats(self):
+        """
+        zera os contadores
+        """
+        with self.__lock:
+            self.__i_hits = 0
+            self.__i_misses = 0
+            self.__i_evictions = 0
+
+    # ---------------------------------------------------------------------------------------------
+    def stats(self):
+        """
+        estatísticas do cache
+
+        @return dicionário com acertos, faltas, remoções, entradas e tamanho máximo
+        """
+        with self.__lock:
+            return {"hits": self.__i_hits, "misses": self.__i_misses, "evictions": self.__i_evictions,
+                    "size": len(self.__dct_ent), "max": self.__i_max}
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def i_evictions(self):
+        """
+        get número de remoções
+        """
+        return self.__i_evictions
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def i_hits(self):
+        """
+        get número de acertos
+        """
+        return self.__i_hits
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def i_max(self):
+        """
+        get número máximo de entradas
+        """
+        return self.__i_max
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def i_misses(self):
+        """
+        get número de faltas
+        """
+        return self.__i_misses
+
+# < the end >--------------------------------------------------------------------------------------
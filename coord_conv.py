@@ -33,9 +33,214 @@ __date__ = "2016/01"
 # < imports >--------------------------------------------------------------------------------------
 
 # python library
+import logging
 import math
 import re
 
+# numpy
+import numpy as np
+
+# < module data >----------------------------------------------------------------------------------
+
+# número de strings convertidas por bloco nos parsers em lote
+M_PARSE_CHUNK = 1 << 20
+
+# número de strings formatadas por bloco na escrita em lote
+M_FORMAT_CHUNK = 1 << 16
+
+# classes de caracteres do scanner (tabela indexada pelo código ASCII)
+M_CHR_PAD = 0
+M_CHR_DIG = 1
+M_CHR_DOT = 2
+M_CHR_SEP = 3
+M_CHR_HEM = 4
+M_CHR_BAD = 5
+
+M_LUT_CLS = np.full(256, M_CHR_BAD, dtype=np.uint8)
+M_LUT_CLS[0] = M_CHR_PAD
+M_LUT_CLS[ord(' ')] = M_CHR_PAD
+M_LUT_CLS[ord('0'):ord('9') + 1] = M_CHR_DIG
+M_LUT_CLS[ord('.')] = M_CHR_DOT
+M_LUT_CLS[ord(':')] = M_CHR_SEP
+
+# valor dos dígitos
+M_LUT_DIG = np.zeros(256, dtype=np.int64)
+M_LUT_DIG[ord('0'):ord('9') + 1] = np.arange(10)
+
+# sinal dos hemisférios (0 = não é hemisfério)
+M_LUT_HEM = np.zeros(256, dtype=np.int8)
+
+for _c, _s in (('E', 1), ('L', 1), ('N', 1), ('O', -1), ('S', -1), ('W', -1)):
+    M_LUT_CLS[ord(_c)] = M_LUT_CLS[ord(_c.lower())] = M_CHR_HEM
+    M_LUT_HEM[ord(_c)] = M_LUT_HEM[ord(_c.lower())] = _s
+
+del _c, _s
+
+# potências de 10
+M_POW10_F = 10. ** np.arange(19)
+
+# -------------------------------------------------------------------------------------------------
+def __scan_codes(fa_str):
+    """
+    converte um bloco de strings em uma matriz de códigos ASCII
+
+    @param fa_str: array numpy de strings (dtype S ou U)
+
+    @return matriz (W x N) de códigos (uint8), uma coluna por string. Caracteres não ASCII
+            viram 255
+    """
+    # largura da string
+    li_wid = max(fa_str.dtype.itemsize // (4 if 'U' == fa_str.dtype.kind else 1), 1)
+
+    # array de bytes ?
+    if 'S' == fa_str.dtype.kind:
+        la_cod = np.ascontiguousarray(fa_str).view(np.uint8).reshape(len(fa_str), li_wid)
+
+    # senão, array de unicode (UCS4)
+    else:
+        la_cod = np.minimum(np.ascontiguousarray(fa_str).view(np.uint32).reshape(len(fa_str), li_wid), 255)
+
+    # return
+    return np.ascontiguousarray(la_cod.T, dtype=np.uint8)
+
+# -------------------------------------------------------------------------------------------------
+def __scan_field(fa_cls, fa_cod, fa_msk, fv_int=False):
+    """
+    scanner de um campo numérico sem sinal (ddd ou ddd.ddd). Percorre as colunas uma única vez,
+    tratando todas as linhas (strings) de um bloco simultaneamente
+
+    @param fa_cls: matriz (W x N) de classes de caracteres
+    @param fa_cod: matriz (W x N) de códigos ASCII
+    @param fa_msk: máscara (W x N) das posições do campo em cada string
+    @param fv_int: campo inteiro (não aceita ponto decimal)
+
+    @return valores do campo (float64) e máscara de validade
+    """
+    li_len = fa_cls.shape[1]
+
+    # estado do scanner
+    la_man = np.zeros(li_len, dtype=np.int64)
+    la_n_dig = np.zeros(li_len, dtype=np.int32)
+    la_n_dot = np.zeros(li_len, dtype=np.int32)
+    la_n_frc = np.zeros(li_len, dtype=np.int32)
+
+    lv_bad = np.zeros(li_len, dtype=bool)
+    lv_ini = np.zeros(li_len, dtype=bool)
+    lv_fim = np.zeros(li_len, dtype=bool)
+
+    # para cada coluna...
+    for li_col in range(fa_cls.shape[0]):
+        la_cls = fa_cls[li_col]
+        la_msk = fa_msk[li_col]
+
+        # dígito ou ponto decimal do campo
+        la_dig = (M_CHR_DIG == la_cls) & la_msk
+        la_dot = (M_CHR_DOT == la_cls) & la_msk
+        la_num = la_dig | la_dot
+
+        # o campo só pode ter dígitos, ponto e espaços em volta (sem espaços no meio)
+        lv_bad |= (la_msk & ~la_num & (M_CHR_PAD != la_cls)) | (la_num & lv_fim)
+
+        lv_fim |= lv_ini & ~la_num
+        lv_ini |= la_num
+
+        # acumula a mantissa
+        la_man = np.where(la_dig, (la_man * 10) + M_LUT_DIG[fa_cod[li_col]], la_man)
+
+        la_n_frc += la_dig & (la_n_dot > 0)
+        la_n_dig += la_dig
+        la_n_dot += la_dot
+
+    la_ok = ~lv_bad & (la_n_dig > 0) & (la_n_dig < 16) & (la_n_dot <= (0 if fv_int else 1))
+
+    # uma única divisão (arredondamento correto, igual a float())
+    la_val = la_man / M_POW10_F[np.minimum(la_n_frc, 18)]
+
+    # return
+    return la_val, la_ok
+
+# -------------------------------------------------------------------------------------------------
+def __scan_bulk(f_seq, f_parser):
+    """
+    aplica um parser em lote, bloco a bloco, a uma sequência de strings
+
+    @param f_seq: sequência ou array numpy de strings
+    @param f_parser: parser de um bloco (matrizes W x N de classes e de códigos)
+
+    @return valores (float64, NaN se inválido) e máscara de validade
+    """
+    # converte a entrada para array de strings
+    la_str = np.asarray(f_seq)
+
+    if la_str.dtype.kind not in "SU":
+        la_str = la_str.astype('U')
+
+    la_str = la_str.ravel()
+
+    # aloca a saída
+    la_val = np.empty(len(la_str), dtype=np.float64)
+    la_ok = np.empty(len(la_str), dtype=bool)
+
+    # para cada bloco...
+    for li_ini in range(0, len(la_str), M_PARSE_CHUNK):
+        li_fim = min(li_ini + M_PARSE_CHUNK, len(la_str))
+
+        # códigos e classes dos caracteres
+        la_cod = __scan_codes(la_str[li_ini:li_fim])
+        la_cls = M_LUT_CLS[la_cod]
+
+        # converte o bloco
+        la_val[li_ini:li_fim], la_ok[li_ini:li_fim] = f_parser(la_cls, la_cod)
+
+    # valores inválidos
+    la_val[~la_ok] = np.nan
+
+    # return
+    return la_val, la_ok
+
+
+# -------------------------------------------------------------------------------------------------
+def __format_vec(fs_fmt, flst_cols, f_out=None, fs_sep="\n"):
+    """
+    formata colunas de valores com um único formato (operador %)
+
+    @param fs_fmt: formato de uma linha
+    @param flst_cols: lista de colunas (arrays, 0-d inclusive) com os campos do formato
+    @param f_out: buffer de texto ou arquivo de saída (opcional)
+    @param fs_sep: separador de linhas na saída
+
+    @return lista de strings ou, se f_out foi informado, número de linhas escritas
+    """
+    # colunas como listas python (um escalar vira uma coluna de uma linha)
+    flst_cols = [np.atleast_1d(l_col).tolist() for l_col in flst_cols]
+
+    # gera a lista de strings ?
+    if f_out is None:
+        return [fs_fmt % lt_val for lt_val in zip(*flst_cols)]
+
+    # número de linhas
+    li_len = len(flst_cols[0]) if flst_cols else 0
+
+    # formato de um bloco
+    ls_fmt_blk = (fs_fmt + fs_sep) * M_FORMAT_CHUNK
+
+    # para cada bloco...
+    for li_ini in range(0, li_len, M_FORMAT_CHUNK):
+        li_fim = min(li_ini + M_FORMAT_CHUNK, li_len)
+
+        # campos do bloco intercalados (linha a linha)
+        lt_val = tuple(l_val for lt_lin in zip(*[l_col[li_ini:li_fim] for l_col in flst_cols]) for l_val in lt_lin)
+
+        # formato do bloco (o último pode ser menor)
+        if (li_fim - li_ini) != M_FORMAT_CHUNK:
+            ls_fmt_blk = (fs_fmt + fs_sep) * (li_fim - li_ini)
+
+        # um único % e um único write por bloco
+        f_out.write(ls_fmt_blk % lt_val)
+
+    # return
+    return li_len
+
 # -------------------------------------------------------------------------------------------------
 def azm2ang(ff_azim):
     """
@@ -53,6 +258,21 @@ def azm2ang(ff_azim):
     # normaliza o sistema de referência entre azimute e ângulo
     return (90. - ff_azim) if ff_azim <= 90. else (450. - ff_azim)
 
+# -------------------------------------------------------------------------------------------------
+def azm2ang_vec(fa_azim):
+    """
+    versão vetorizada de azm2ang
+
+    @param fa_azim: array de azimutes ou ângulos em graus
+
+    @return array de ângulos cartesianos ou azimutes em graus
+    """
+    # converte para array
+    la_azim = np.asarray(fa_azim, dtype=np.float64)
+
+    # normaliza o sistema de referência entre azimute e ângulo
+    return np.where(la_azim <= 90., 90. - la_azim, 450. - la_azim)
+
 # -------------------------------------------------------------------------------------------------
 def deg2dms(ff_deg):
     """
@@ -85,6 +305,31 @@ def deg2dms(ff_deg):
     # retorna a string
     return int(ff_deg), int(li_min), lf_sec
 
+# -------------------------------------------------------------------------------------------------
+def deg2dms_vec(fa_deg):
+    """
+    versão vetorizada de deg2dms
+
+    @param fa_deg: array de graus
+
+    @return arrays de graus (int), minutos (int) e segundos
+    """
+    # valor absoluto
+    la_deg = np.abs(np.asarray(fa_deg, dtype=np.float64))
+
+    # calcula os graus
+    la_ideg = np.trunc(la_deg)
+
+    # calcula os minutos
+    la_min = la_deg - la_ideg
+    la_imin = np.trunc(la_min * 60.)
+
+    # calcula os segundos
+    la_sec = ((la_min * 60.) - la_imin) * 60
+
+    # retorna os arrays
+    return np.trunc(fa_deg).astype(np.int64), la_imin.astype(np.int64), la_sec
+
 # -------------------------------------------------------------------------------------------------
 def deg2str(ff_deg):
     """
@@ -93,6 +338,22 @@ def deg2str(ff_deg):
     # retorna a string
     return u"%3d° %02d' %05.3f\"" % (deg2dms(ff_deg))
 
+# -------------------------------------------------------------------------------------------------
+def deg2str_vec(fa_deg, f_out=None):
+    """
+    versão em lote de deg2str
+
+    @param fa_deg: array de graus
+    @param f_out: buffer de texto ou arquivo de saída (opcional, uma string por linha)
+
+    @return lista de strings ou, se f_out foi informado, número de linhas escritas
+    """
+    # converte os graus para D/M/S
+    la_deg, la_min, la_sec = deg2dms_vec(fa_deg)
+
+    # retorna as strings
+    return __format_vec(u"%3d° %02d' %05.3f\"", [la_deg, la_min, la_sec], f_out)
+
 # -------------------------------------------------------------------------------------------------
 def dms2deg(fi_deg, fi_min, ff_sec):
     """
@@ -150,6 +411,51 @@ def format_ica_lng(ff_lng):
     # return "{}{:5.3f}".format('W' if ff_lng <= 0 else 'E', lf_deg)
     return "{:5.3f}{}".format(lf_deg, 'W' if ff_lng <= 0 else 'E')
 
+# -------------------------------------------------------------------------------------------------
+def __format_ica_vec(fa_deg, fs_fmt, fs_neg, fs_pos, f_out):
+    """
+    formatação em lote de latitudes ou longitudes no formato GG(G)MM.mmmH
+    """
+    # converte os graus para D/M/S
+    la_deg, la_min, la_sec = deg2dms_vec(fa_deg)
+
+    # converte para GG(G)MM.mmm
+    la_val = (np.abs(la_deg) * 100) + la_min + (la_sec / 60.)
+
+    # hemisfério
+    la_hem = np.where(np.asarray(fa_deg) <= 0, fs_neg, fs_pos)
+
+    # retorna as strings
+    return __format_vec(fs_fmt, [la_val, la_hem], f_out)
+
+# -------------------------------------------------------------------------------------------------
+def format_ica_lat_vec(fa_lat, f_out=None):
+    """
+    versão em lote de format_ica_lat
+
+    @param fa_lat: array de latitudes em graus
+    @param f_out: buffer de texto ou arquivo de saída (opcional, uma string por linha)
+
+    @return lista de strings no formato GGMM.mmmH ou, se f_out foi informado, número de linhas
+            escritas
+    """
+    # return latitudes
+    return __format_ica_vec(fa_lat, "%4.3f%s", 'S', 'N', f_out)
+
+# -------------------------------------------------------------------------------------------------
+def format_ica_lng_vec(fa_lng, f_out=None):
+    """
+    versão em lote de format_ica_lng
+
+    @param fa_lng: array de longitudes em graus
+    @param f_out: buffer de texto ou arquivo de saída (opcional, uma string por linha)
+
+    @return lista de strings no formato GGGMM.mmmH ou, se f_out foi informado, número de linhas
+            escritas
+    """
+    # return longitudes
+    return __format_ica_vec(fa_lng, "%5.3f%s", 'W', 'E', f_out)
+
 # -------------------------------------------------------------------------------------------------
 def gms2deg(ff_dms):
     """
@@ -236,6 +542,21 @@ def lat2dms(ff_lat):
     # retorna a tupla
     return deg2dms(abs(ff_lat)), 'S' if ff_lat < 0 else 'N'
 
+# -------------------------------------------------------------------------------------------------
+def lat2dms_vec(fa_lat):
+    """
+    versão vetorizada de lat2dms
+
+    @param fa_lat: array de latitudes em graus
+
+    @return arrays (graus, minutos, segundos) e array de hemisférios N/S
+    """
+    # normaliza
+    la_lat = np.clip(np.asarray(fa_lat, dtype=np.float64), -90., 90.)
+
+    # retorna a tupla
+    return deg2dms_vec(np.abs(la_lat)), np.where(la_lat < 0, 'S', 'N')
+
 # -------------------------------------------------------------------------------------------------
 def lng2deg(ff_lng_rad):
     """
@@ -275,6 +596,21 @@ def lng2dms(ff_lng):
     # retorna a tupla
     return deg2dms(abs(ff_lng)), 'W' if ff_lng < 0 else 'E'
 
+# -------------------------------------------------------------------------------------------------
+def lng2dms_vec(fa_lng):
+    """
+    versão vetorizada de lng2dms
+
+    @param fa_lng: array de longitudes em graus
+
+    @return arrays (graus, minutos, segundos) e array de hemisférios E/W
+    """
+    # normaliza
+    la_lng = np.clip(np.asarray(fa_lng, dtype=np.float64), -180., 180.)
+
+    # retorna a tupla
+    return deg2dms_vec(np.abs(la_lng)), np.where(la_lng < 0, 'W', 'E')
+
 # -------------------------------------------------------------------------------------------------
 def parse_aisweb(fs_in):
     """
@@ -324,6 +660,47 @@ def parse_aisweb(fs_in):
     # return longitude or latitude
     return lf_crd
 
+# -------------------------------------------------------------------------------------------------
+def __parse_aisweb_blk(fa_cls, fa_cod):
+    """
+    parser de um bloco no formato X:GGG:MM:SS.ss
+    """
+    # separadores de campos
+    la_sep = M_CHR_SEP == fa_cls
+
+    # número do campo de cada posição
+    la_fld = np.cumsum(la_sep, axis=0, dtype=np.int8)
+    la_fld[la_sep] = -1
+
+    # hemisfério (campo 0, um único caractere)
+    la_hem = M_LUT_HEM[fa_cod[0]]
+
+    la_ok = (la_sep.sum(axis=0) == 3) & (M_CHR_SEP == fa_cls[1]) & (la_hem != 0)
+
+    # graus, minutos e segundos
+    la_deg, lv_deg = __scan_field(fa_cls, fa_cod, 1 == la_fld, True)
+    la_min, lv_min = __scan_field(fa_cls, fa_cod, 2 == la_fld, True)
+    la_sec, lv_sec = __scan_field(fa_cls, fa_cod, 3 == la_fld)
+
+    la_ok &= lv_deg & lv_min & lv_sec & (la_deg <= 180.) & (la_min <= 59.)
+
+    # return
+    return (la_deg + (la_min / 60.) + (la_sec / 3600.)) * la_hem, la_ok
+
+# -------------------------------------------------------------------------------------------------
+def parse_aisweb_vec(f_seq):
+    """
+    conversão em lote de latitudes/longitudes no formato X:GGG:MM:SS.ss (versão vetorizada de
+    parse_aisweb). Graus negativos não são aceitos
+
+    @param f_seq: sequência ou array numpy de strings
+
+    @return array de coordenadas em graus (NaN se inválida) e máscara de validade. Os índices das
+            entradas inválidas são np.flatnonzero(~máscara)
+    """
+    # return
+    return __scan_bulk(f_seq, __parse_aisweb_blk)
+
 # -------------------------------------------------------------------------------------------------
 def parse_faa(fs_in):
     """
@@ -349,7 +726,7 @@ def parse_faa(fs_in):
     else:
 
         # converte para graus
-        lf_crd = dms2deg(float(fs_in[1:]))
+        lf_crd = gms2deg(float(fs_in[1:]))
 
         # graus inválidos ?
         if (((fs_in[0] in ['E', 'L', 'O', 'W']) and (lf_crd > 180.)) or
@@ -369,6 +746,48 @@ def parse_faa(fs_in):
     # retorna a coordenada em graus
     return lf_crd
 
+# -------------------------------------------------------------------------------------------------
+def __parse_faa_blk(fa_cls, fa_cod):
+    """
+    parser de um bloco no formato Hgggmmss.ss
+    """
+    # hemisfério (primeiro caractere)
+    la_hem = M_LUT_HEM[fa_cod[0]]
+
+    # gggmmss.ss (restante da string)
+    la_msk = np.ones(fa_cls.shape, dtype=bool)
+    la_msk[0] = False
+
+    la_dms, la_ok = __scan_field(fa_cls, fa_cod, la_msk)
+
+    # segundos e minutos
+    la_sec = la_dms % 100
+    la_min = ((la_dms - la_sec) / 100.) % 100
+
+    # converte para graus
+    la_deg = np.floor(la_dms / 10000.) + ((la_min / 60.) + (la_sec / 3600.))
+
+    # limite de graus do hemisfério (latitude ou longitude)
+    la_lim = np.where(np.isin(fa_cod[0], np.frombuffer(b"NSns", dtype=np.uint8)), 90., 180.)
+
+    la_ok &= (la_hem != 0) & (la_sec <= 59.99) & (la_min <= 59.) & (la_deg <= la_lim)
+
+    # return
+    return la_deg * la_hem, la_ok
+
+# -------------------------------------------------------------------------------------------------
+def parse_faa_vec(f_seq):
+    """
+    conversão em lote de coordenadas no formato Hgggmmss.ss (versão vetorizada de parse_faa)
+
+    @param f_seq: sequência ou array numpy de strings
+
+    @return array de coordenadas em graus (NaN se inválida) e máscara de validade. Os índices das
+            entradas inválidas são np.flatnonzero(~máscara)
+    """
+    # return
+    return __scan_bulk(f_seq, __parse_faa_blk)
+
 # -------------------------------------------------------------------------------------------------
 def parse_ica(fs_in):
     """
@@ -393,7 +812,7 @@ def parse_ica(fs_in):
     lf_sec = (lf_min - int(lf_min)) * 60
 
     # cria uma coordenada
-    lf_crd = dms2deg(li_deg, int(lf_min), lf_sec) * -1 if l_coord[1] in ['O', 'S', 'W'] else 1
+    lf_crd = dms2deg(li_deg, int(lf_min), lf_sec) * (-1 if l_coord[1] in ['O', 'S', 'W'] else 1)
 
     # return longitude or latitude
     return lf_crd
@@ -422,11 +841,54 @@ def parse_ica_2(fs_in):
     lf_sec = (lf_min - int(lf_min)) * 60
 
     # cria uma coordenada
-    lf_crd = dms2deg(li_deg, int(lf_min), lf_sec) * -1 if l_coord[1] in ['O', 'S', 'W'] else 1
+    lf_crd = dms2deg(li_deg, int(lf_min), lf_sec) * (-1 if l_coord[1] in ['O', 'S', 'W'] else 1)
 
     # return longitude or latitude
     return lf_crd
 
+# -------------------------------------------------------------------------------------------------
+def __parse_ica_blk(fa_cls, fa_cod):
+    """
+    parser de um bloco no formato GGGMM.mmmH/GGMM.mmmH
+    """
+    # posição do hemisfério (primeira letra)
+    la_hem = M_CHR_HEM == fa_cls
+    la_pos = la_hem.argmax(axis=0)
+
+    la_col = np.arange(fa_cls.shape[0])[:, np.newaxis]
+
+    # GGGMM.mmm antes do hemisfério, apenas espaços depois
+    la_val, la_ok = __scan_field(fa_cls, fa_cod, la_col < la_pos)
+
+    la_ok &= la_hem.any(axis=0)
+    la_ok &= ~((M_CHR_PAD != fa_cls) & (la_col > la_pos)).any(axis=0)
+
+    # gms decoding
+    la_deg = np.floor(la_val / 100.)
+    la_min = la_val % 100
+    la_imn = np.floor(la_min)
+    la_sec = (la_min - la_imn) * 60
+
+    # sinal do hemisfério
+    la_sgn = M_LUT_HEM[fa_cod[la_pos, np.arange(fa_cod.shape[1])]]
+
+    # return
+    return (la_deg + (la_imn / 60.) + (la_sec / 3600.)) * la_sgn, la_ok
+
+# -------------------------------------------------------------------------------------------------
+def parse_ica_vec(f_seq):
+    """
+    conversão em lote de latitudes/longitudes no formato GGGMM.mmmH/GGMM.mmmH (versão vetorizada
+    de parse_ica)
+
+    @param f_seq: sequência ou array numpy de strings
+
+    @return array de coordenadas em graus (NaN se inválida) e máscara de validade. Os índices das
+            entradas inválidas são np.flatnonzero(~máscara)
+    """
+    # return
+    return __scan_bulk(f_seq, __parse_ica_blk)
+
 # -------------------------------------------------------------------------------------------------
 def round_32(f_val):
     """
@@ -0,0 +1,558 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+coord_ecef
+
+registro de métodos de conversão ECEF -> geodésicas (WGS84), com escolha automática do método
+
+métodos registrados:
+
+    iter      iterativo (coord_geod.ecef2geod / ecef2geod_vec)
+    bowring   iterativo de Bowring (coord_geod.ecef2geod_bow)
+    sofair    fechado de Sofair (coord_geod.ecef2geod_sof)
+    vermeille fechado de Vermeille (An analytical method to transform geocentric into geodetic
+              coordinates, J. Geodesy 2011)
+    olson     não iterativo de Olson (Converting Earth-centered, Earth-fixed coordinates to
+              geodetic coordinates, IEEE TAES 1996)
+
+o método "auto" é o mais rápido entre os que atendem à tolerância pedida, segundo um benchmark
+(precisão e tempo) executado na primeira escolha e mantido pelo restante do processo
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import collections
+import logging
+import math
+import time
+
+# numpy
+import numpy as np
+
+import coord_defs as cdefs
+import coord_geod as geod
+import pos_array as parr
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+M_LOG = logging.getLogger(__name__)
+M_LOG.setLevel(logging.DEBUG)
+
+# tolerância padrão (erro máximo de posição, m)
+M_TOL = 1e-3
+
+# pontos do benchmark (lote e escalar)
+M_BENCH_VEC = 4096
+M_BENCH_SCL = 256
+
+# faixa de altitudes do benchmark (m)
+M_BENCH_ALT = (-1000., 50000.)
+
+# rodadas de medição do benchmark (o tempo é o mínimo)
+M_BENCH_ROUNDS = 5
+
+# empate no benchmark: métodos até 20% mais lentos que o mais rápido são considerados empatados
+# e, entre eles, vence o mais preciso (a escolha não depende do ruído de uma única medição)
+M_BENCH_TIE = 0.2
+
+# método: funções escalar (x, y, z -> lat, lng, alt) e em lote
+CSOLVER = collections.namedtuple("CSOLVER", "s_name fn_scalar fn_vec")
+
+# métodos registrados (nome -> CSOLVER)
+M_DCT_SOLVER = collections.OrderedDict()
+
+# resultados do benchmark (em lote ? -> lista de resultados) e escolhas (tolerância, lote ? -> nome)
+M_DCT_BENCH = {}
+M_DCT_CHOICE = {}
+
+# constantes de Olson (WGS84)
+M_OLS_A1 = cdefs.D_a * cdefs.D_e2
+M_OLS_A2 = M_OLS_A1 * M_OLS_A1
+M_OLS_A3 = M_OLS_A1 * cdefs.D_e2 / 2.
+M_OLS_A4 = 2.5 * M_OLS_A2
+M_OLS_A5 = M_OLS_A1 + M_OLS_A3
+M_OLS_A6 = 1. - cdefs.D_e2
+
+# constantes de Vermeille (WGS84)
+M_VER_E4 = cdefs.D_e2 * cdefs.D_e2
+M_VER_A2 = cdefs.D_a * cdefs.D_a
+
+# -------------------------------------------------------------------------------------------------
+def benchmark(fv_vec=True, fi_pts=None):
+    """
+    mede a precisão e o tempo de cada método registrado. Os pontos de teste (fixos) são gerados em
+    geodésicas, convertidos para ECEF (coord_geod.geod2ecef_vec) e reconvertidos por cada método
+
+    @param fv_vec: mede as funções em lote (senão, as escalares)
+    @param fi_pts: número de pontos (None = M_BENCH_VEC ou M_BENCH_SCL)
+
+    @return lista de dicionários (método, erro máximo em m, tempo por ponto em µs), do mais rápido
+            ao mais lento
+    """
+    li_pts = fi_pts or (M_BENCH_VEC if fv_vec else M_BENCH_SCL)
+
+    # pontos de teste (semente fixa, resultados reprodutíveis)
+    l_rng = np.random.default_rng(20261018)
+
+    la_lat = np.degrees(np.arcsin(l_rng.uniform(-1., 1., li_pts)))
+    la_lng = l_rng.uniform(-180., 180., li_pts)
+    la_alt = l_rng.uniform(M_BENCH_ALT[0], M_BENCH_ALT[1], li_pts)
+
+    # inclui os polos e o equador
+    la_lat[:3] = (90., -90., 0.)
+
+    la_x, la_y, la_z = geod.geod2ecef_vec(la_lat, la_lng, la_alt)
+
+    # converte os pontos com um método e retorna o tempo e as coordenadas
+    def __convert(f_solv):
+        lf_t0 = time.perf_counter()
+
+        if fv_vec:
+            lt_geo = f_solv.fn_vec(la_x, la_y, la_z)
+
+        else:
+            lt_geo = tuple(np.array(lt_col) for lt_col in
+                           zip(*[f_solv.fn_scalar(*lt_xyz) for lt_xyz in zip(la_x.tolist(), la_y.tolist(), la_z.tolist())]))
+
+        # return
+        return time.perf_counter() - lf_t0, lt_geo
+
+    # precisão (e primeira medição de tempo) de cada método
+    ldct_res = collections.OrderedDict()
+
+    for l_solv in M_DCT_SOLVER.values():
+        try:
+            lf_dt, lt_geo = __convert(l_solv)
+
+            # erro máximo de posição (m)
+            lf_err = float(np.max(__error(la_lat, la_lng, la_alt, *lt_geo)))
+
+        # método falhou (domínio, divisão por zero, ...)
+        except (ArithmeticError, ValueError) as l_err:
+            # logger
+            M_LOG.warning("benchmark: método {} falhou: {}.".format(l_solv.s_name, l_err))
+
+            lf_err = lf_dt = math.inf
+
+        # erro indefinido ?
+        if math.isnan(lf_err):
+            lf_err = math.inf
+
+        ldct_res[l_solv.s_name] = {"method": l_solv.s_name, "max_err_m": lf_err, "us_per_pt": lf_dt}
+
+    # tempo: melhor de M_BENCH_ROUNDS rodadas, com os métodos intercalados em cada rodada (uma
+    # oscilação da máquina afeta todos os métodos, não apenas o que estava sendo medido)
+    llst_run = [l_solv for l_solv in M_DCT_SOLVER.values() if math.isfinite(ldct_res[l_solv.s_name]["us_per_pt"])]
+
+    for _ in range(M_BENCH_ROUNDS - 1):
+        for l_solv in llst_run:
+            ldct_sol = ldct_res[l_solv.s_name]
+            ldct_sol["us_per_pt"] = min(ldct_sol["us_per_pt"], __convert(l_solv)[0])
+
+    for ldct_sol in ldct_res.values():
+        ldct_sol["us_per_pt"] *= 1e6 / li_pts
+
+    # return
+    return sorted(ldct_res.values(), key=lambda ldct_sol: ldct_sol["us_per_pt"])
+
+# -------------------------------------------------------------------------------------------------
+def __bowring(ff_x, ff_y, ff_z=0.):
+    """
+    Bowring escalar (coord_geod.ecef2geod_bow)
+    """
+    return geod.ecef2geod_bow((ff_x, ff_y, ff_z))
+
+# -------------------------------------------------------------------------------------------------
+def ecef_to_geodetic(ff_x, ff_y, ff_z=0., method="auto", ff_tol=M_TOL):
+    """
+    conversão de coordenadas ECEF em geodésicas
+
+    @param ff_x, ff_y, ff_z: coordenadas ECEF (m)
+    @param method: nome do método registrado ou "auto"
+    @param ff_tol: tolerância (m) do método "auto"
+
+    @return lat e lng (graus), alt (m)
+    """
+    return __solver(method, ff_tol, False).fn_scalar(ff_x, ff_y, ff_z)
+
+# -------------------------------------------------------------------------------------------------
+def ecef_to_geodetic_vec(fa_x, fa_y=None, fa_z=0., method="auto", ff_tol=M_TOL):
+    """
+    conversão em lote de coordenadas ECEF em geodésicas
+
+    @param fa_x, fa_y, fa_z: arrays de coordenadas ECEF (m) ou fa_x um CPosXYArray
+    @param method: nome do método registrado ou "auto"
+    @param ff_tol: tolerância (m) do método "auto"
+
+    @return arrays de lat e lng (graus), alt (m)
+    """
+    # container de posições ?
+    fa_x, fa_y, fa_z = parr.pos_cols(fa_x, fa_y, fa_z)
+
+    # return
+    return __solver(method, ff_tol, True).fn_vec(fa_x, fa_y, fa_z)
+
+# -------------------------------------------------------------------------------------------------
+def __error(fa_lat, fa_lng, fa_alt, fa_lat_c, fa_lng_c, fa_alt_c):
+    """
+    erro de posição (m) de cada ponto: maior entre o erro horizontal (lat/lng) e o vertical
+    """
+    la_dlat = np.radians(np.asarray(fa_lat_c, dtype=np.float64) - fa_lat)
+    la_dlng = np.radians((np.asarray(fa_lng_c, dtype=np.float64) - fa_lng + 180.) % 360. - 180.)
+
+    # longitude indefinida nos polos
+    la_dlng = np.where(np.abs(fa_lat) >= 90., 0., la_dlng * np.cos(np.radians(fa_lat)))
+
+    # return
+    return np.maximum(np.hypot(la_dlat, la_dlng) * cdefs.D_a, np.abs(np.asarray(fa_alt_c, dtype=np.float64) - fa_alt))
+
+# -------------------------------------------------------------------------------------------------
+def __loop_vec(f_fn_scalar):
+    """
+    versão em lote (laço) de uma função escalar
+    """
+    # ---------------------------------------------------------------------------------------------
+    def __fn_vec(fa_x, fa_y, fa_z=0.):
+        """
+        aplica a função escalar a cada ponto
+        """
+        la_x, la_y, la_z = np.broadcast_arrays(np.asarray(fa_x, dtype=np.float64),
+                                               np.asarray(fa_y, dtype=np.float64),
+                                               np.asarray(fa_z, dtype=np.float64))
+
+        llst_geo = [f_fn_scalar(*lt_xyz) for lt_xyz in zip(la_x.ravel().tolist(), la_y.ravel().tolist(), la_z.ravel().tolist())]
+
+        # return
+        return tuple(np.array(lt_col, dtype=np.float64).reshape(la_x.shape)
+                     for lt_col in (zip(*llst_geo) if llst_geo else ((), (), ())))
+
+    # return
+    return __fn_vec
+
+# -------------------------------------------------------------------------------------------------
+def olson(ff_x, ff_y, ff_z=0.):
+    """
+    conversão ECEF -> geodésicas, método não iterativo de Olson
+
+    @param ff_x, ff_y, ff_z: coordenadas ECEF (m)
+
+    @return lat e lng (graus), alt (m)
+    """
+    lf_zp = abs(ff_z)
+
+    lf_w2 = (ff_x * ff_x) + (ff_y * ff_y)
+    lf_w = math.sqrt(lf_w2)
+
+    lf_r2 = lf_w2 + (ff_z * ff_z)
+    lf_r = math.sqrt(lf_r2)
+
+    lf_lng = math.atan2(ff_y, ff_x)
+
+    # centro da Terra: latitude e altitude indefinidas (como em olson_vec)
+    if 0. == lf_r:
+        return math.nan, math.degrees(lf_lng), math.nan
+
+    lf_s2 = (ff_z * ff_z) / lf_r2
+    lf_c2 = lf_w2 / lf_r2
+
+    lf_u = M_OLS_A2 / lf_r
+    lf_v = M_OLS_A3 - (M_OLS_A4 / lf_r)
+
+    # aproximação inicial (seno longe do equador, cosseno perto)
+    if lf_c2 > 0.3:
+        lf_s = (lf_zp / lf_r) * (1. + lf_c2 * (M_OLS_A1 + lf_u + lf_s2 * lf_v) / lf_r)
+        lf_lat = math.asin(lf_s)
+
+        lf_ss = lf_s * lf_s
+        lf_c = math.sqrt(1. - lf_ss)
+
+    else:
+        lf_c = (lf_w / lf_r) * (1. - lf_s2 * (M_OLS_A5 - lf_u - lf_c2 * lf_v) / lf_r)
+        lf_lat = math.acos(lf_c)
+
+        lf_ss = 1. - (lf_c * lf_c)
+        lf_s = math.sqrt(lf_ss)
+
+    # correção
+    lf_g = 1. - (cdefs.D_e2 * lf_ss)
+    lf_rg = cdefs.D_a / math.sqrt(lf_g)
+    lf_rf = M_OLS_A6 * lf_rg
+
+    lf_u = lf_w - (lf_rg * lf_c)
+    lf_v = lf_zp - (lf_rf * lf_s)
+
+    lf_f = (lf_c * lf_u) + (lf_s * lf_v)
+    lf_m = (lf_c * lf_v) - (lf_s * lf_u)
+    lf_p = lf_m / ((lf_rf / lf_g) + lf_f)
+
+    lf_lat += lf_p
+    lf_alt = lf_f + (lf_m * lf_p / 2.)
+
+    # hemisfério sul
+    if ff_z < 0.:
+        lf_lat = -lf_lat
+
+    # return
+    return math.degrees(lf_lat), math.degrees(lf_lng), lf_alt
+
+# -------------------------------------------------------------------------------------------------
+def olson_vec(fa_x, fa_y=None, fa_z=0.):
+    """
+    versão vetorizada de olson
+
+    @param fa_x, fa_y, fa_z: arrays de coordenadas ECEF (m) ou fa_x um CPosXYArray
+
+    @return arrays de lat e lng (graus), alt (m)
+    """
+    # container de posições ?
+    fa_x, fa_y, fa_z = parr.pos_cols(fa_x, fa_y, fa_z)
+
+    la_x, la_y, la_z = np.broadcast_arrays(np.asarray(fa_x, dtype=np.float64),
+                                           np.asarray(fa_y, dtype=np.float64),
+                                           np.asarray(fa_z, dtype=np.float64))
+    la_zp = np.abs(la_z)
+
+    la_w2 = (la_x * la_x) + (la_y * la_y)
+    la_w = np.sqrt(la_w2)
+
+    la_r2 = la_w2 + (la_z * la_z)
+    la_r = np.sqrt(la_r2)
+
+    la_lng = np.arctan2(la_y, la_x)
+
+    la_s2 = (la_z * la_z) / la_r2
+    la_c2 = la_w2 / la_r2
+
+    la_u = M_OLS_A2 / la_r
+    la_v = M_OLS_A3 - (M_OLS_A4 / la_r)
+
+    # aproximação inicial (seno longe do equador, cosseno perto)
+    lv_sin = la_c2 > 0.3
+
+    la_s = np.where(lv_sin, (la_zp / la_r) * (1. + la_c2 * (M_OLS_A1 + la_u + la_s2 * la_v) / la_r), 0.)
+    la_c = np.where(lv_sin, 0., (la_w / la_r) * (1. - la_s2 * (M_OLS_A5 - la_u - la_c2 * la_v) / la_r))
+
+    la_lat = np.where(lv_sin, np.arcsin(np.clip(la_s, -1., 1.)), np.arccos(np.clip(la_c, -1., 1.)))
+
+    la_ss = np.where(lv_sin, la_s * la_s, 1. - (la_c * la_c))
+
+    la_c = np.where(lv_sin, np.sqrt(np.maximum(1. - la_ss, 0.)), la_c)
+    la_s = np.where(lv_sin, la_s, np.sqrt(np.maximum(la_ss, 0.)))
+
+    # correção
+    la_g = 1. - (cdefs.D_e2 * la_ss)
+    la_rg = cdefs.D_a / np.sqrt(la_g)
+    la_rf = M_OLS_A6 * la_rg
+
+    la_u = la_w - (la_rg * la_c)
+    la_v = la_zp - (la_rf * la_s)
+
+    la_f = (la_c * la_u) + (la_s * la_v)
+    la_m = (la_c * la_v) - (la_s * la_u)
+    la_p = la_m / ((la_rf / la_g) + la_f)
+
+    la_lat = la_lat + la_p
+    la_alt = la_f + (la_m * la_p / 2.)
+
+    # hemisfério sul
+    la_lat = np.where(la_z < 0., -la_lat, la_lat)
+
+    # return
+    return np.degrees(la_lat), np.degrees(la_lng), la_alt
+
+# -------------------------------------------------------------------------------------------------
+def register(fs_name, f_fn_scalar, f_fn_vec=None):
+    """
+    registra (ou substitui) um método. As escolhas do método "auto" são refeitas
+
+    @param fs_name: nome do método
+    @param f_fn_scalar: função escalar (x, y, z -> lat, lng, alt)
+    @param f_fn_vec: função em lote (None = laço sobre a função escalar)
+    """
+    # check input
+    assert "auto" != fs_name
+
+    M_DCT_SOLVER[fs_name] = CSOLVER(fs_name, f_fn_scalar, f_fn_vec or __loop_vec(f_fn_scalar))
+
+    # refaz o benchmark e as escolhas
+    M_DCT_BENCH.clear()
+    M_DCT_CHOICE.clear()
+
+# -------------------------------------------------------------------------------------------------
+def select(ff_tol=M_TOL, fv_vec=True):
+    """
+    escolhe o método mais rápido cujo erro máximo no benchmark atende à tolerância. Métodos até
+    M_BENCH_TIE mais lentos que o mais rápido são considerados empatados: entre eles vence o mais
+    preciso (e, com o mesmo erro, o registrado primeiro)
+
+    @param ff_tol: tolerância (erro máximo de posição, m)
+    @param fv_vec: escolha para as funções em lote (senão, para as escalares)
+
+    @return nome do método (o mais preciso, se nenhum atende à tolerância)
+    """
+    lt_key = (float(ff_tol), bool(fv_vec))
+
+    # escolha já feita ?
+    ls_name = M_DCT_CHOICE.get(lt_key, None)
+
+    if ls_name is not None:
+        return ls_name
+
+    # benchmark (uma vez por tipo de função)
+    llst_res = M_DCT_BENCH.get(lt_key[1], None)
+
+    if llst_res is None:
+        llst_res = M_DCT_BENCH[lt_key[1]] = benchmark(fv_vec)
+
+    # métodos que atendem à tolerância (resultados do mais rápido ao mais lento)
+    llst_ok = [ldct_res for ldct_res in llst_res if ldct_res["max_err_m"] <= ff_tol]
+
+    if llst_ok:
+        # empatados com o mais rápido
+        lf_lim = llst_ok[0]["us_per_pt"] * (1. + M_BENCH_TIE)
+        llst_tie = [ldct_res for ldct_res in llst_ok if ldct_res["us_per_pt"] <= lf_lim]
+
+        # o mais preciso dos empatados (desempate pela ordem de registro)
+        llst_reg = list(M_DCT_SOLVER)
+        ls_name = min(llst_tie, key=lambda ldct_res: (ldct_res["max_err_m"], llst_reg.index(ldct_res["method"])))["method"]
+
+    else:
+        # logger
+        M_LOG.warning("select: nenhum método atende à tolerância de {} m.".format(ff_tol))
+
+        ls_name = min(llst_res, key=lambda ldct_res: ldct_res["max_err_m"])["method"]
+
+    M_DCT_CHOICE[lt_key] = ls_name
+
+    # return
+    return ls_name
+
+# -------------------------------------------------------------------------------------------------
+def __solver(fs_method, ff_tol, fv_vec):
+    """
+    método registrado pelo nome (ou escolhido, se "auto")
+    """
+    if "auto" == fs_method:
+        fs_method = select(ff_tol, fv_vec)
+
+    try:
+        return M_DCT_SOLVER[fs_method]
+
+    # método desconhecido
+    except KeyError:
+        raise ValueError("método desconhecido: {} (registrados: {})".format(fs_method, ", ".join(M_DCT_SOLVER)))
+
+# -------------------------------------------------------------------------------------------------
+def __sofair(ff_x, ff_y, ff_z=0.):
+    """
+    Sofair escalar (coord_geod.ecef2geod_sof)
+    """
+    return geod.ecef2geod_sof((ff_x, ff_y, ff_z))
+
+# -------------------------------------------------------------------------------------------------
+def solvers():
+    """
+    nomes dos métodos registrados
+
+    @return lista de nomes
+    """
+    return list(M_DCT_SOLVER)
+
+# -------------------------------------------------------------------------------------------------
+def vermeille(ff_x, ff_y, ff_z=0.):
+    """
+    conversão ECEF -> geodésicas, método fechado de Vermeille (válido fora da evoluta, i.e., a
+    mais de ~43 km do centro da Terra)
+
+    @param ff_x, ff_y, ff_z: coordenadas ECEF (m)
+
+    @return lat e lng (graus), alt (m)
+    """
+    lf_w2 = (ff_x * ff_x) + (ff_y * ff_y)
+
+    lf_p = lf_w2 / M_VER_A2
+    lf_q = (1. - cdefs.D_e2) * (ff_z * ff_z) / M_VER_A2
+    lf_r = (lf_p + lf_q - M_VER_E4) / 6.
+
+    lf_s = M_VER_E4 * lf_p * lf_q / (4. * lf_r * lf_r * lf_r)
+    lf_t = (1. + lf_s + math.sqrt(lf_s * (2. + lf_s))) ** (1. / 3.)
+    lf_u = lf_r * (1. + lf_t + (1. / lf_t))
+    lf_v = math.sqrt((lf_u * lf_u) + (M_VER_E4 * lf_q))
+    lf_w = cdefs.D_e2 * (lf_u + lf_v - lf_q) / (2. * lf_v)
+    lf_k = math.sqrt(lf_u + lf_v + (lf_w * lf_w)) - lf_w
+
+    lf_d = lf_k * math.sqrt(lf_w2) / (lf_k + cdefs.D_e2)
+    lf_dz = math.hypot(lf_d, ff_z)
+
+    # return
+    return (math.degrees(2. * math.atan2(ff_z, lf_d + lf_dz)), math.degrees(math.atan2(ff_y, ff_x)),
+            (lf_k + cdefs.D_e2 - 1.) / lf_k * lf_dz)
+
+# -------------------------------------------------------------------------------------------------
+def vermeille_vec(fa_x, fa_y=None, fa_z=0.):
+    """
+    versão vetorizada de vermeille
+
+    @param fa_x, fa_y, fa_z: arrays de coordenadas ECEF (m) ou fa_x um CPosXYArray
+
+    @return arrays de lat e lng (graus), alt (m)
+    """
+    # container de posições ?
+    fa_x, fa_y, fa_z = parr.pos_cols(fa_x, fa_y, fa_z)
+
+    la_x, la_y, la_z = np.broadcast_arrays(np.asarray(fa_x, dtype=np.float64),
+                                           np.asarray(fa_y, dtype=np.float64),
+                                           np.asarray(fa_z, dtype=np.float64))
+
+    la_w2 = (la_x * la_x) + (la_y * la_y)
+
+    la_p = la_w2 / M_VER_A2
+    la_q = (1. - cdefs.D_e2) * (la_z * la_z) / M_VER_A2
+    la_r = (la_p + la_q - M_VER_E4) / 6.
+
+    la_s = M_VER_E4 * la_p * la_q / (4. * la_r * la_r * la_r)
+    la_t = np.cbrt(1. + la_s + np.sqrt(la_s * (2. + la_s)))
+    la_u = la_r * (1. + la_t + (1. / la_t))
+    la_v = np.sqrt((la_u * la_u) + (M_VER_E4 * la_q))
+    la_w = cdefs.D_e2 * (la_u + la_v - la_q) / (2. * la_v)
+    la_k = np.sqrt(la_u + la_v + (la_w * la_w)) - la_w
+
+    la_d = la_k * np.sqrt(la_w2) / (la_k + cdefs.D_e2)
+    la_dz = np.hypot(la_d, la_z)
+
+    # return
+    return (np.degrees(2. * np.arctan2(la_z, la_d + la_dz)), np.degrees(np.arctan2(la_y, la_x)),
+            (la_k + cdefs.D_e2 - 1.) / la_k * la_dz)
+
+# < registro dos métodos >-------------------------------------------------------------------------
+
+register("iter", geod.ecef2geod, geod.ecef2geod_vec)
+register("bowring", __bowring)
+register("sofair", __sofair)
+register("vermeille", vermeille, vermeille_vec)
+register("olson", olson, olson_vec)
+
+# < the end >--------------------------------------------------------------------------------------
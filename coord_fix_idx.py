@@ -0,0 +1,569 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+coord_fix_idx
+
+índice espacial de fixos (vizinhos mais próximos e busca por raio)
+
+os fixos são armazenados como vetores unitários ECEF (esfera) em uma grade 3D uniforme. A grade é
+reconstruída por completo apenas quando o número de alterações incrementais fica grande
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import itertools
+import math
+
+# numpy
+import numpy as np
+
+# libs
+import libs.coords.coord_defs as cdefs
+
+# < module data >----------------------------------------------------------------------------------
+
+# número máximo de pares (consulta, fixo) avaliados de uma só vez
+M_MAX_PARES = 1 << 22
+
+# número máximo de células vizinhas por consulta (acima disso, força bruta)
+M_MAX_VIZ = 343
+
+# alterações incrementais toleradas antes de reconstruir a grade (mínimo)
+M_MAX_DELTA = 256
+
+# -------------------------------------------------------------------------------------------------
+def geo2unit_vec(fa_lat, fa_lng):
+    """
+    converte coordenadas geográficas em vetores unitários ECEF (esfera)
+
+    @param fa_lat: latitudes em graus
+    @param fa_lng: longitudes em graus
+
+    @return matriz (N x 3) de vetores unitários
+    """
+    # converte para radianos
+    la_lat = np.radians(np.asarray(fa_lat, dtype=np.float64).reshape(-1))
+    la_lng = np.radians(np.asarray(fa_lng, dtype=np.float64).reshape(-1))
+
+    la_cos_lat = np.cos(la_lat)
+
+    # return
+    return np.stack((la_cos_lat * np.cos(la_lng), la_cos_lat * np.sin(la_lng), np.sin(la_lat)), axis=1)
+
+# < class CFixIndex >------------------------------------------------------------------------------
+
+class CFixIndex(object):
+    """
+    índice espacial de um dicionário de fixos
+    """
+    # ---------------------------------------------------------------------------------------------
+    def __init__(self, f_dct_fix=None, ff_cel_nm=60.):
+        """
+        constructor
+
+        @param f_dct_fix: dicionário de fixos (objetos com v_fix_ok, f_fix_lat e f_fix_lng)
+        @param ff_cel_nm: tamanho da célula da grade (NM)
+        """
+        # inicia a super classe
+        super(CFixIndex, self).__init__()
+
+        # check input
+        assert ff_cel_nm > 0.
+
+        # tamanho da célula (corda no vetor unitário)
+        self.__f_cel = 2. * math.sin(min(ff_cel_nm / cdefs.D_EARTH_RADIUS_NM, math.pi) / 2.)
+
+        # número de células por eixo
+        self.__i_ncel = int(2. / self.__f_cel) + 2
+
+        # monta o índice
+        self.build(f_dct_fix or {})
+
+    # ---------------------------------------------------------------------------------------------
+    def build(self, f_dct_fix):
+        """
+        reconstrói o índice a partir de um dicionário de fixos
+
+        @param f_dct_fix: dicionário de fixos
+        """
+        # fixos válidos
+        llst_fix = [(ls_fix, l_fix.f_fix_lat, l_fix.f_fix_lng) for ls_fix, l_fix in f_dct_fix.items() if l_fix.v_fix_ok]
+
+        # nomes, vetores unitários e fixos ativos
+        self.__lst_nam = [lt_fix[0] for lt_fix in llst_fix]
+        self.__dct_ndx = {ls_fix: li_ndx for li_ndx, ls_fix in enumerate(self.__lst_nam)}
+
+        self.__a_xyz = geo2unit_vec([lt_fix[1] for lt_fix in llst_fix], [lt_fix[2] for lt_fix in llst_fix])
+        self.__a_vivo = np.ones(len(llst_fix), dtype=bool)
+
+        # monta a grade
+        self.__build_grid()
+
+    # ---------------------------------------------------------------------------------------------
+    def __brute(self, fi_viz):
+        """
+        verifica se a vizinhança de fi_viz células é grande demais para a busca pela grade
+        """
+        return ((2 * fi_viz + 1) ** 3) > min(M_MAX_VIZ, max(len(self.__a_key), 1))
+
+    # ---------------------------------------------------------------------------------------------
+    def __build_grid(self):
+        """
+        monta a grade com todos os fixos ativos
+        """
+        # compacta (remove os fixos inativos)
+        if not self.__a_vivo.all():
+            la_viv = np.flatnonzero(self.__a_vivo)
+
+            self.__lst_nam = [self.__lst_nam[li_ndx] for li_ndx in la_viv]
+            self.__dct_ndx = {ls_fix: li_ndx for li_ndx, ls_fix in enumerate(self.__lst_nam)}
+
+            self.__a_xyz = self.__a_xyz[la_viv]
+            self.__a_vivo = np.ones(len(la_viv), dtype=bool)
+
+        # chave da célula de cada fixo
+        la_key = self.__cel_key(self.__cel(self.__a_xyz))
+
+        # fixos ordenados por célula
+        self.__a_srt = np.argsort(la_key, kind="stable")
+
+        # células ocupadas e início de cada uma na ordenação
+        self.__a_key, la_ini = np.unique(la_key[self.__a_srt], return_index=True)
+        self.__a_ini = np.append(la_ini, len(la_key)).astype(np.int64)
+
+        # fixos fora da grade (alterações incrementais)
+        self.__i_grid = len(self.__lst_nam)
+
+    # ---------------------------------------------------------------------------------------------
+    def __cand(self, fa_xyz, fi_viz):
+        """
+        pares candidatos (consulta, fixo) nas células vizinhas de cada consulta
+
+        @param fa_xyz: vetores unitários das consultas (Q x 3)
+        @param fi_viz: alcance em células em torno da célula da consulta
+
+        @return arrays de índice da consulta e de índice do fixo
+        """
+        li_nqry = len(fa_xyz)
+
+        # força bruta ?
+        if self.__brute(fi_viz):
+            # todos os fixos para todas as consultas
+            li_nfix = len(self.__lst_nam)
+
+            return np.repeat(np.arange(li_nqry), li_nfix), np.tile(np.arange(li_nfix), li_nqry)
+
+        # deslocamentos das células vizinhas
+        la_off = np.array(list(itertools.product(range(-fi_viz, fi_viz + 1), repeat=3)), dtype=np.int64)
+
+        # células vizinhas de cada consulta (Q x O x 3)
+        la_cel = self.__cel(fa_xyz)[:, np.newaxis, :] + la_off[np.newaxis, :, :]
+
+        lv_ok = ((la_cel >= 0) & (la_cel < self.__i_ncel)).all(axis=2)
+
+        la_qry = np.nonzero(lv_ok)[0]
+        la_key = self.__cel_key(la_cel[lv_ok])
+
+        # células ocupadas
+        la_pos = np.searchsorted(self.__a_key, la_key)
+        la_pos = np.minimum(la_pos, max(len(self.__a_key) - 1, 0))
+
+        lv_ok = (self.__a_key[la_pos] == la_key) if len(self.__a_key) else np.zeros(len(la_key), dtype=bool)
+
+        la_qry = la_qry[lv_ok]
+        la_pos = la_pos[lv_ok]
+
+        # intervalo de cada célula na ordenação
+        la_ini = self.__a_ini[la_pos]
+        la_cnt = self.__a_ini[la_pos + 1] - la_ini
+
+        # expande os intervalos (ragged) em pares (consulta, fixo)
+        li_tot = int(la_cnt.sum())
+
+        la_base = np.repeat(la_ini - (np.cumsum(la_cnt) - la_cnt), la_cnt)
+        la_fix = self.__a_srt[la_base + np.arange(li_tot)]
+        la_qry = np.repeat(la_qry, la_cnt)
+
+        # fixos fora da grade (força bruta, são poucos)
+        li_nd = len(self.__lst_nam) - self.__i_grid
+
+        if li_nd > 0:
+            la_qry = np.concatenate((la_qry, np.repeat(np.arange(li_nqry), li_nd)))
+            la_fix = np.concatenate((la_fix, np.tile(np.arange(self.__i_grid, len(self.__lst_nam)), li_nqry)))
+
+        # return
+        return la_qry, la_fix
+
+    # ---------------------------------------------------------------------------------------------
+    def __cel(self, fa_xyz):
+        """
+        índices (i, j, k) da célula de cada vetor unitário
+        """
+        return np.floor((fa_xyz + 1.) / self.__f_cel).astype(np.int64)
+
+    # ---------------------------------------------------------------------------------------------
+    def __cel_key(self, fa_cel):
+        """
+        chave linear da célula (i, j, k)
+        """
+        return (((fa_cel[..., 0] * self.__i_ncel) + fa_cel[..., 1]) * self.__i_ncel) + fa_cel[..., 2]
+
+    # ---------------------------------------------------------------------------------------------
+    def compact(self):
+        """
+        incorpora as alterações incrementais à grade (remove os fixos inativos)
+        """
+        # há alterações ?
+        if (self.__i_grid != len(self.__lst_nam)) or not self.__a_vivo.all():
+            self.__build_grid()
+
+    # ---------------------------------------------------------------------------------------------
+    @classmethod
+    def from_state(cls, fdct_state):
+        """
+        cria o índice a partir do seu estado (ver to_state), sem remontar a grade. Os arrays da
+        grade são usados sem cópia (podem ser views somente leitura de um mapeamento)
+
+        @param fdct_state: estado do índice
+
+        @return índice
+        """
+        l_idx = cls.__new__(cls)
+
+        # grade
+        l_idx.__f_cel = float(fdct_state["f_cel"])
+        l_idx.__i_ncel = int(fdct_state["i_ncel"])
+
+        l_idx.__a_srt = fdct_state["a_srt"]
+        l_idx.__a_key = fdct_state["a_key"]
+        l_idx.__a_ini = fdct_state["a_ini"]
+
+        # fixos
+        l_idx.__lst_nam = list(fdct_state["lst_nam"])
+
+        # nome -> índice (montado na primeira alteração incremental)
+        l_idx.__dct_ndx = None
+
+        l_idx.__a_xyz = fdct_state["a_xyz"]
+        l_idx.__a_vivo = np.ones(len(l_idx.__lst_nam), dtype=bool)
+
+        l_idx.__i_grid = len(l_idx.__lst_nam)
+
+        # return
+        return l_idx
+
+    # ---------------------------------------------------------------------------------------------
+    def knn(self, ff_lat, ff_lng, fi_k=1):
+        """
+        os fi_k fixos mais próximos de um ponto
+
+        @param ff_lat: latitude do ponto em graus
+        @param ff_lng: longitude do ponto em graus
+        @param fi_k: número de fixos
+
+        @return lista de (fixo, distância em NM), do mais próximo ao mais distante
+        """
+        # consulta em lote de um ponto
+        la_ndx, la_dst = self.knn_vec([ff_lat], [ff_lng], fi_k)
+
+        # return
+        return [(self.__lst_nam[li_ndx], lf_dst) for li_ndx, lf_dst in zip(la_ndx[0].tolist(), la_dst[0].tolist()) if li_ndx >= 0]
+
+    # ---------------------------------------------------------------------------------------------
+    def knn_vec(self, fa_lat, fa_lng, fi_k=1):
+        """
+        os fi_k fixos mais próximos de cada um de N pontos
+
+        @param fa_lat: latitudes dos pontos em graus
+        @param fa_lng: longitudes dos pontos em graus
+        @param fi_k: número de fixos
+
+        @return matrizes (N x fi_k) de índices dos fixos (-1 se não há fixos suficientes, ver
+                lst_nam) e de distâncias em NM (inf se não há)
+        """
+        # check input
+        assert fi_k > 0
+
+        la_xyz = geo2unit_vec(fa_lat, fa_lng)
+        li_nqry = len(la_xyz)
+
+        # inicia a saída
+        la_ndx = np.full((li_nqry, fi_k), -1, dtype=np.int64)
+        la_dst = np.full((li_nqry, fi_k), np.inf, dtype=np.float64)
+
+        # consultas pendentes e raio de busca (em células)
+        la_pnd = np.arange(li_nqry)
+        li_viz = 1
+
+        # enquanto houver consultas pendentes...
+        while la_pnd.size > 0:
+            # vizinhança grande demais ? resolve as consultas restantes por força bruta
+            if self.__brute(li_viz):
+                la_ndx[la_pnd], la_dst[la_pnd] = self.__knn_brute(la_xyz[la_pnd], fi_k)
+                break
+
+            # raio garantido pelas células vizinhas (NM)
+            lf_rai = 2. * math.asin(min(li_viz * self.__f_cel / 2., 1.)) * cdefs.D_EARTH_RADIUS_NM
+
+            # candidatos dentro do raio
+            la_qry, la_fix, la_d = self.__radius(la_xyz[la_pnd], lf_rai, li_viz)
+
+            # ordena por consulta e distância
+            la_ord = np.lexsort((la_d, la_qry))
+            la_qry, la_fix, la_d = la_qry[la_ord], la_fix[la_ord], la_d[la_ord]
+
+            # posição de cada par dentro da sua consulta
+            la_cnt = np.bincount(la_qry, minlength=len(la_pnd))
+            la_rank = np.arange(len(la_qry)) - np.repeat(np.cumsum(la_cnt) - la_cnt, la_cnt)
+
+            # consultas resolvidas (fi_k fixos dentro do raio garantido)
+            lv_res = la_cnt >= fi_k
+
+            lv_sel = lv_res[la_qry] & (la_rank < fi_k)
+
+            la_ndx[la_pnd[la_qry[lv_sel]], la_rank[lv_sel]] = la_fix[lv_sel]
+            la_dst[la_pnd[la_qry[lv_sel]], la_rank[lv_sel]] = la_d[lv_sel]
+
+            # próximas consultas (amplia a vizinhança)
+            la_pnd = la_pnd[~lv_res]
+            li_viz += 1
+
+        # return
+        return la_ndx, la_dst
+
+    # ---------------------------------------------------------------------------------------------
+    def __knn_brute(self, fa_xyz, fi_k):
+        """
+        os fi_k fixos mais próximos de cada consulta, comparando com todos os fixos ativos
+        """
+        li_nqry = len(fa_xyz)
+
+        # inicia a saída
+        la_ndx = np.full((li_nqry, fi_k), -1, dtype=np.int64)
+        la_dst = np.full((li_nqry, fi_k), np.inf, dtype=np.float64)
+
+        # fixos ativos
+        la_viv = np.flatnonzero(self.__a_vivo)
+        li_k = min(fi_k, len(la_viv))
+
+        if 0 == li_k:
+            return la_ndx, la_dst
+
+        la_fix = self.__a_xyz[la_viv]
+
+        # consultas por bloco (limita o tamanho da matriz de cossenos)
+        li_blk = max(1, M_MAX_PARES // len(la_viv))
+
+        # para cada bloco...
+        for li_ini in range(0, li_nqry, li_blk):
+            # cossenos entre as consultas e os fixos (maior cosseno = mais próximo)
+            la_cos = np.dot(fa_xyz[li_ini:li_ini + li_blk], la_fix.T)
+
+            # os li_k maiores cossenos, em ordem
+            la_sel = np.argpartition(-la_cos, li_k - 1, axis=1)[:, :li_k]
+            la_cos = np.take_along_axis(la_cos, la_sel, axis=1)
+
+            la_ord = np.argsort(-la_cos, axis=1)
+
+            la_ndx[li_ini:li_ini + li_blk, :li_k] = la_viv[np.take_along_axis(la_sel, la_ord, axis=1)]
+            la_dst[li_ini:li_ini + li_blk, :li_k] = np.arccos(np.clip(np.take_along_axis(la_cos, la_ord, axis=1), -1., 1.)) * cdefs.D_EARTH_RADIUS_NM
+
+        # return
+        return la_ndx, la_dst
+
+    # ---------------------------------------------------------------------------------------------
+    def radius(self, ff_lat, ff_lng, ff_dst):
+        """
+        fixos a até ff_dst NM de um ponto
+
+        @param ff_lat: latitude do ponto em graus
+        @param ff_lng: longitude do ponto em graus
+        @param ff_dst: raio em NM
+
+        @return lista de (fixo, distância em NM), do mais próximo ao mais distante
+        """
+        # consulta em lote de um ponto
+        _, la_ndx, la_dst = self.radius_vec([ff_lat], [ff_lng], ff_dst)
+
+        # return
+        return [(self.__lst_nam[li_ndx], lf_dst) for li_ndx, lf_dst in zip(la_ndx.tolist(), la_dst.tolist())]
+
+    # ---------------------------------------------------------------------------------------------
+    def __radius(self, fa_xyz, ff_dst, fi_viz):
+        """
+        pares (consulta, fixo, distância) com distância até ff_dst, processados em blocos
+        """
+        llst_qry, llst_fix, llst_dst = [], [], []
+
+        # consultas por bloco (limita o número de pares em memória)
+        li_blk = max(1, M_MAX_PARES // max(1, min(len(self.__lst_nam), (2 * fi_viz + 1) ** 3 * 8)))
+
+        # para cada bloco...
+        for li_ini in range(0, len(fa_xyz), li_blk):
+            la_xyz = fa_xyz[li_ini:li_ini + li_blk]
+
+            # pares candidatos
+            la_qry, la_fix = self.__cand(la_xyz, fi_viz)
+
+            # fixos ativos
+            lv_ok = self.__a_vivo[la_fix]
+            la_qry, la_fix = la_qry[lv_ok], la_fix[lv_ok]
+
+            # distância (NM) entre a consulta e o fixo
+            la_cos = np.einsum("ij,ij->i", la_xyz[la_qry], self.__a_xyz[la_fix])
+            la_dst = np.arccos(np.clip(la_cos, -1., 1.)) * cdefs.D_EARTH_RADIUS_NM
+
+            # dentro do raio
+            lv_ok = la_dst <= ff_dst
+
+            llst_qry.append(la_qry[lv_ok] + li_ini)
+            llst_fix.append(la_fix[lv_ok])
+            llst_dst.append(la_dst[lv_ok])
+
+        # nenhuma consulta ?
+        if not llst_qry:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+
+        # return
+        return np.concatenate(llst_qry), np.concatenate(llst_fix), np.concatenate(llst_dst)
+
+    # ---------------------------------------------------------------------------------------------
+    def radius_vec(self, fa_lat, fa_lng, ff_dst):
+        """
+        fixos a até ff_dst NM de cada um de N pontos
+
+        @param fa_lat: latitudes dos pontos em graus
+        @param fa_lng: longitudes dos pontos em graus
+        @param ff_dst: raio em NM
+
+        @return arrays (pares) de índice do ponto, índice do fixo (ver lst_nam) e distância em NM,
+                ordenados por ponto e distância
+        """
+        # check input
+        assert ff_dst >= 0.
+
+        # alcance em células
+        lf_crd = 2. * math.sin(min(ff_dst / cdefs.D_EARTH_RADIUS_NM, math.pi) / 2.)
+        li_viz = int(math.ceil(lf_crd / self.__f_cel)) or 1
+
+        # busca
+        la_qry, la_fix, la_dst = self.__radius(geo2unit_vec(fa_lat, fa_lng), ff_dst, li_viz)
+
+        # ordena por ponto e distância
+        la_ord = np.lexsort((la_dst, la_qry))
+
+        # return
+        return la_qry[la_ord], la_fix[la_ord], la_dst[la_ord]
+
+    # ---------------------------------------------------------------------------------------------
+    def remove(self, fs_fix):
+        """
+        remove um fixo do índice (incremental)
+
+        @param fs_fix: fixo
+        """
+        # dicionário de um estado salvo ainda não montado ?
+        if self.__dct_ndx is None:
+            self.__dct_ndx = {ls_fix: li_ndx for li_ndx, ls_fix in enumerate(self.__lst_nam)}
+
+        # fixo existe ?
+        li_ndx = self.__dct_ndx.pop(fs_fix, None)
+
+        if li_ndx is not None:
+            # desativa o fixo
+            self.__a_vivo[li_ndx] = False
+
+            # reconstrói a grade ?
+            self.__check_delta()
+
+    # ---------------------------------------------------------------------------------------------
+    def to_state(self):
+        """
+        estado do índice (grade compactada e fixos), para salvar e recriar sem remontar a grade
+
+        @return dicionário de escalares, lista de nomes e arrays
+        """
+        # incorpora as alterações incrementais
+        self.compact()
+
+        # return
+        return {"f_cel": self.__f_cel,
+                "i_ncel": self.__i_ncel,
+                "lst_nam": list(self.__lst_nam),
+                "a_xyz": self.__a_xyz,
+                "a_srt": self.__a_srt,
+                "a_key": self.__a_key,
+                "a_ini": self.__a_ini}
+
+    # ---------------------------------------------------------------------------------------------
+    def update(self, fs_fix, f_fix):
+        """
+        inclui ou substitui um fixo no índice (incremental)
+
+        @param fs_fix: fixo
+        @param f_fix: dados do fixo (v_fix_ok, f_fix_lat e f_fix_lng)
+        """
+        # remove a versão anterior
+        self.remove(fs_fix)
+
+        # fixo inválido ?
+        if not f_fix.v_fix_ok:
+            return
+
+        # acrescenta o fixo fora da grade
+        self.__dct_ndx[fs_fix] = len(self.__lst_nam)
+        self.__lst_nam.append(fs_fix)
+
+        self.__a_xyz = np.concatenate((self.__a_xyz, geo2unit_vec([f_fix.f_fix_lat], [f_fix.f_fix_lng])))
+        self.__a_vivo = np.append(self.__a_vivo, True)
+
+        # reconstrói a grade ?
+        self.__check_delta()
+
+    # ---------------------------------------------------------------------------------------------
+    def __check_delta(self):
+        """
+        reconstrói a grade se há muitas alterações incrementais
+        """
+        # número de alterações (fixos fora da grade e fixos inativos)
+        li_delta = (len(self.__lst_nam) - self.__i_grid) + int(np.count_nonzero(~self.__a_vivo))
+
+        if li_delta > max(M_MAX_DELTA, len(self.__lst_nam) // 10):
+            # reconstrói a grade
+            self.__build_grid()
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def lst_nam(self):
+        """
+        get nomes dos fixos (pelo índice retornado nas consultas)
+        """
+        return self.__lst_nam
+
+# < the end >--------------------------------------------------------------------------------------
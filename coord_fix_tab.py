@@ -0,0 +1,358 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+coord_fix_tab
+
+tabela compilada (somente leitura) de fixos e indicativos
+
+os dicionários de fixos e de indicativos são combinados em chaves normalizadas (internadas) que
+apontam para linhas de colunas contíguas de latitude, longitude e validade
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import sys
+
+# numpy
+import numpy as np
+
+# < module data >----------------------------------------------------------------------------------
+
+# linha de um fixo inexistente
+M_ROW_NO_FIX = -1
+
+# linha de um indicativo inexistente
+M_ROW_NO_INDC = -2
+
+# < class CFixTable >------------------------------------------------------------------------------
+
+class CFixTable(object):
+    """
+    tabela compilada de fixos. Cada fixo ou indicativo é resolvido com uma consulta ao dicionário
+    de chaves e duas leituras das colunas
+    """
+    # ---------------------------------------------------------------------------------------------
+    def __init__(self, f_dct_fix=None, f_dct_fix_indc=None):
+        """
+        constructor
+
+        @param f_dct_fix: dicionário de fixos (objetos com v_fix_ok, f_fix_lat e f_fix_lng)
+        @param f_dct_fix_indc: dicionário de indicativos (indicativo -> número do fixo)
+        """
+        # inicia a super classe
+        super(CFixTable, self).__init__()
+
+        # compila a tabela
+        self.build(f_dct_fix, f_dct_fix_indc)
+
+    # ---------------------------------------------------------------------------------------------
+    def build(self, f_dct_fix, f_dct_fix_indc=None):
+        """
+        (re)compila a tabela a partir dos dicionários de fixos e de indicativos
+
+        @param f_dct_fix: dicionário de fixos
+        @param f_dct_fix_indc: dicionário de indicativos
+        """
+        f_dct_fix = f_dct_fix or {}
+        f_dct_fix_indc = f_dct_fix_indc or {}
+
+        # chaves de um estado salvo (ver from_state)
+        self.__t_keys = None
+
+        # chave normalizada -> linha
+        self.__dct_fix = {sys.intern(normalize(l_key)): li_row for li_row, l_key in enumerate(f_dct_fix)}
+
+        # colunas contíguas
+        li_nfix = len(f_dct_fix)
+
+        self.__a_lat = np.zeros(li_nfix, dtype=np.float64)
+        self.__a_lng = np.zeros(li_nfix, dtype=np.float64)
+        self.__a_ok = np.zeros(li_nfix, dtype=bool)
+
+        for li_row, l_fix in enumerate(f_dct_fix.values()):
+            # o fixo é válido ?
+            self.__a_ok[li_row] = bool(l_fix.v_fix_ok)
+
+            # coordenadas de todos os fixos, também dos inválidos (preservadas nos instantâneos)
+            try:
+                self.__a_lat[li_row] = l_fix.f_fix_lat
+                self.__a_lng[li_row] = l_fix.f_fix_lng
+
+            # coordenadas não numéricas (aceitas apenas em fixos inválidos)
+            except (TypeError, ValueError):
+                if l_fix.v_fix_ok:
+                    raise
+
+                self.__a_lat[li_row] = self.__a_lng[li_row] = np.nan
+
+        # indicativo -> linha do fixo (resolvido uma única vez)
+        self.__dct_indc = {sys.intern(normalize(l_key)): self.__dct_fix.get(normalize(l_num), M_ROW_NO_FIX)
+                           for l_key, l_num in f_dct_fix_indc.items()}
+
+    # ---------------------------------------------------------------------------------------------
+    @classmethod
+    def from_state(cls, fdct_state):
+        """
+        cria a tabela a partir do seu estado (ver to_state), sem recompilar os dicionários. As
+        colunas são usadas sem cópia (podem ser views somente leitura de um mapeamento)
+
+        @param fdct_state: estado da tabela
+
+        @return tabela
+        """
+        l_tab = cls.__new__(cls)
+
+        # chaves normalizadas -> linhas (montadas na primeira consulta)
+        l_tab.__dct_fix = None
+        l_tab.__dct_indc = None
+
+        l_tab.__t_keys = (fdct_state["fix_keys"], fdct_state["fix_rows"], fdct_state["indc_keys"], fdct_state["indc_rows"])
+
+        # colunas
+        l_tab.__a_lat = fdct_state["a_lat"]
+        l_tab.__a_lng = fdct_state["a_lng"]
+        l_tab.__a_ok = fdct_state["a_ok"]
+
+        # return
+        return l_tab
+
+    # ---------------------------------------------------------------------------------------------
+    def geo(self, fs_fix):
+        """
+        coordenada geográfica de um fixo
+
+        @param fs_fix: fixo
+
+        @return 0 se Ok, senão -1 = NOk, lat e lng
+        """
+        return self.geo_row(self.row(fs_fix))
+
+    # ---------------------------------------------------------------------------------------------
+    def geo_row(self, fi_row):
+        """
+        coordenada geográfica de uma linha da tabela
+
+        @param fi_row: linha (negativa se fixo inexistente)
+
+        @return 0 se Ok, senão -1 = NOk, lat e lng
+        """
+        # fixo existe e é válido ?
+        if (fi_row >= 0) and self.__a_ok[fi_row]:
+            # return
+            return 0, float(self.__a_lat[fi_row]), float(self.__a_lng[fi_row])
+
+        # return
+        return -1, 0., 0.
+
+    # ---------------------------------------------------------------------------------------------
+    def geo_rows_vec(self, fa_row):
+        """
+        coordenadas geográficas de várias linhas da tabela
+
+        @param fa_row: array de linhas (negativas se fixo inexistente)
+
+        @return arrays de código de retorno (0 se Ok, senão -1), lat e lng
+        """
+        la_row = np.asarray(fa_row, dtype=np.int64).reshape(-1)
+
+        # fixos existentes e válidos
+        lv_ok = la_row >= 0
+        lv_ok[lv_ok] = self.__a_ok[la_row[lv_ok]]
+
+        # coordenadas (0. se fixo inexistente ou inválido)
+        la_lat = np.zeros(len(la_row), dtype=np.float64)
+        la_lng = np.zeros(len(la_row), dtype=np.float64)
+
+        la_lat[lv_ok] = self.__a_lat[la_row[lv_ok]]
+        la_lng[lv_ok] = self.__a_lng[la_row[lv_ok]]
+
+        # return
+        return np.where(lv_ok, 0, -1), la_lat, la_lng
+
+    # ---------------------------------------------------------------------------------------------
+    def geo_vec(self, fa_fix):
+        """
+        coordenadas geográficas de vários fixos
+
+        @param fa_fix: array de fixos
+
+        @return arrays de código de retorno (0 se Ok, senão -1), lat e lng
+        """
+        return self.geo_rows_vec(self.rows_vec(fa_fix))
+
+    # ---------------------------------------------------------------------------------------------
+    def __load_keys(self):
+        """
+        monta os dicionários de chaves de um estado salvo
+        """
+        llst_fix, la_fix, llst_indc, la_indc = self.__t_keys
+
+        self.__dct_fix = dict(zip(map(sys.intern, llst_fix), la_fix.tolist()))
+        self.__dct_indc = dict(zip(map(sys.intern, llst_indc), la_indc.tolist()))
+
+        self.__t_keys = None
+
+    # ---------------------------------------------------------------------------------------------
+    def row(self, fs_fix):
+        """
+        linha de um fixo
+
+        @param fs_fix: fixo
+
+        @return linha ou M_ROW_NO_FIX
+        """
+        # chaves de um estado salvo ?
+        if self.__dct_fix is None:
+            self.__load_keys()
+
+        # chave já normalizada ?
+        li_row = self.__dct_fix.get(fs_fix, None)
+
+        if li_row is None:
+            li_row = self.__dct_fix.get(normalize(fs_fix), M_ROW_NO_FIX)
+
+        # return
+        return li_row
+
+    # ---------------------------------------------------------------------------------------------
+    def row_indc(self, fs_indc):
+        """
+        linha do fixo de um indicativo
+
+        @param fs_indc: indicativo do fixo
+
+        @return linha, M_ROW_NO_FIX (fixo inexistente) ou M_ROW_NO_INDC (indicativo inexistente)
+        """
+        # chaves de um estado salvo ?
+        if self.__dct_indc is None:
+            self.__load_keys()
+
+        # chave já normalizada ?
+        li_row = self.__dct_indc.get(fs_indc, None)
+
+        if li_row is None:
+            li_row = self.__dct_indc.get(normalize(fs_indc), M_ROW_NO_INDC)
+
+        # return
+        return li_row
+
+    # ---------------------------------------------------------------------------------------------
+    def rows_indc_vec(self, fa_indc):
+        """
+        linhas dos fixos de vários indicativos, consultando cada indicativo distinto uma única vez
+
+        @param fa_indc: array de indicativos
+
+        @return array de linhas (ver row_indc)
+        """
+        return self.__rows_vec(fa_indc, self.row_indc)
+
+    # ---------------------------------------------------------------------------------------------
+    def rows_vec(self, fa_fix):
+        """
+        linhas de vários fixos, consultando cada fixo distinto uma única vez
+
+        @param fa_fix: array de fixos
+
+        @return array de linhas (ver row)
+        """
+        return self.__rows_vec(fa_fix, self.row)
+
+    # ---------------------------------------------------------------------------------------------
+    @staticmethod
+    def __rows_vec(fa_key, f_row):
+        """
+        aplica f_row a cada chave distinta de fa_key
+        """
+        # chaves distintas
+        la_key, la_inv = np.unique(np.asarray(fa_key).astype('U').reshape(-1), return_inverse=True)
+
+        # linha de cada chave distinta
+        la_row = np.fromiter((f_row(ls_key) for ls_key in la_key.tolist()), dtype=np.int64, count=len(la_key))
+
+        # return
+        return la_row[la_inv.reshape(-1)]
+
+    # ---------------------------------------------------------------------------------------------
+    def to_state(self):
+        """
+        estado da tabela (chaves, linhas e colunas), para salvar e recriar sem recompilar
+
+        @return dicionário de listas de chaves e arrays
+        """
+        # chaves de um estado salvo ? (ainda não consultadas)
+        if self.__dct_fix is None:
+            return dict(zip(("fix_keys", "fix_rows", "indc_keys", "indc_rows"), self.__t_keys),
+                        a_lat=self.__a_lat, a_lng=self.__a_lng, a_ok=self.__a_ok)
+
+        # return
+        return {"fix_keys": list(self.__dct_fix),
+                "fix_rows": np.fromiter(self.__dct_fix.values(), dtype=np.int64, count=len(self.__dct_fix)),
+                "indc_keys": list(self.__dct_indc),
+                "indc_rows": np.fromiter(self.__dct_indc.values(), dtype=np.int64, count=len(self.__dct_indc)),
+                "a_lat": self.__a_lat,
+                "a_lng": self.__a_lng,
+                "a_ok": self.__a_ok}
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def a_lat(self):
+        """
+        get latitudes dos fixos (por linha, inclusive dos inválidos; ver a_ok)
+        """
+        return self.__a_lat
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def a_lng(self):
+        """
+        get longitudes dos fixos (por linha, inclusive dos inválidos; ver a_ok)
+        """
+        return self.__a_lng
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def a_ok(self):
+        """
+        get validade dos fixos (por linha)
+        """
+        return self.__a_ok
+
+# -------------------------------------------------------------------------------------------------
+def normalize(f_key):
+    """
+    normaliza a chave de um fixo ou indicativo
+
+    @param f_key: chave
+
+    @return chave normalizada
+    """
+    return str(f_key).strip().upper()
+
+# < the end >--------------------------------------------------------------------------------------
@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+coord_frame
+
+referencial local ENU (east, north, up) centrado em um sítio (radar)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import math
+
+# numpy
+import numpy as np
+
+# libs
+import libs.coords.coord_cache as ccache
+import libs.coords.coord_geod as geod
+
+# < module data >----------------------------------------------------------------------------------
+
+# cache de referenciais locais por sítio (lat, lng, alt), limitado e protegido por lock
+M_FRAME_MAX = 256
+M_CACHE_FRAME = ccache.CLRUCache(M_FRAME_MAX)
+
+# < class CLocalFrame >----------------------------------------------------------------------------
+
+class CLocalFrame(object):
+    """
+    referencial local ENU de um sítio. A origem ECEF e a matriz de rotação são calculadas uma
+    única vez na criação do objeto
+    """
+    # ---------------------------------------------------------------------------------------------
+    def __init__(self, ff_lat, ff_lng, ff_alt=0.):
+        """
+        constructor
+
+        @param ff_lat: latitude do sítio (graus)
+        @param ff_lng: longitude do sítio (graus)
+        @param ff_alt: altitude do sítio (m)
+        """
+        # inicia a super classe
+        super(CLocalFrame, self).__init__()
+
+        # check input
+        assert  -90. <= ff_lat <= 90.
+        assert -180. <= ff_lng <= 180.
+
+        # coordenadas geográficas do sítio
+        self.__f_lat = float(ff_lat)
+        self.__f_lng = float(ff_lng)
+        self.__f_alt = float(ff_alt)
+
+        # origem do referencial em ECEF
+        self.__a_org = np.array(geod.geod2ecef(ff_lat, ff_lng, ff_alt), dtype=np.float64)
+
+        # converte para radianos
+        lf_lat = math.radians(ff_lat)
+        lf_lng = math.radians(ff_lng)
+
+        # sin e cos da lat/lng do sítio
+        lf_sin_lat = math.sin(lf_lat)
+        lf_cos_lat = math.cos(lf_lat)
+        lf_sin_lng = math.sin(lf_lng)
+        lf_cos_lng = math.cos(lf_lng)
+
+        # matriz de rotação ENU -> ECEF (colunas: east, north, up)
+        self.__a_rot = np.array([[-lf_sin_lng, -lf_sin_lat * lf_cos_lng, lf_cos_lat * lf_cos_lng],
+                                 [ lf_cos_lng, -lf_sin_lat * lf_sin_lng, lf_cos_lat * lf_sin_lng],
+                                 [        0.,               lf_cos_lat,               lf_sin_lat]])
+
+    # ---------------------------------------------------------------------------------------------
+    def ecef2enu(self, fa_x, fa_y, fa_z):
+        """
+        conversão de coordenadas ECEF para ENU do sítio
+
+        @param fa_x, fa_y, fa_z: coordenadas ECEF (m), escalares ou arrays
+
+        @return e, n, u (m)
+        """
+        # translada para a origem do sítio
+        la_dx = np.subtract(fa_x, self.__a_org[0])
+        la_dy = np.subtract(fa_y, self.__a_org[1])
+        la_dz = np.subtract(fa_z, self.__a_org[2])
+
+        # aplica a rotação inversa (transposta)
+        la_r = self.__a_rot
+
+        la_e = (la_r[0, 0] * la_dx) + (la_r[1, 0] * la_dy)
+        la_n = (la_r[0, 1] * la_dx) + (la_r[1, 1] * la_dy) + (la_r[2, 1] * la_dz)
+        la_u = (la_r[0, 2] * la_dx) + (la_r[1, 2] * la_dy) + (la_r[2, 2] * la_dz)
+
+        # return
+        return la_e, la_n, la_u
+
+    # ---------------------------------------------------------------------------------------------
+    def enu2ecef(self, fa_e, fa_n, fa_u=0.):
+        """
+        conversão de coordenadas ENU do sítio para ECEF
+
+        @param fa_e, fa_n, fa_u: coordenadas ENU (m), escalares ou arrays
+
+        @return x, y, z (m)
+        """
+        # aplica a rotação
+        la_r = self.__a_rot
+
+        la_x = (la_r[0, 0] * fa_e) + (la_r[0, 1] * fa_n) + (la_r[0, 2] * fa_u) + self.__a_org[0]
+        la_y = (la_r[1, 0] * fa_e) + (la_r[1, 1] * fa_n) + (la_r[1, 2] * fa_u) + self.__a_org[1]
+        la_z = (la_r[2, 1] * fa_n) + (la_r[2, 2] * fa_u) + self.__a_org[2]
+
+        # return
+        return la_x, la_y, la_z
+
+    # ---------------------------------------------------------------------------------------------
+    def enu2geod(self, fa_e, fa_n, fa_u=0.):
+        """
+        conversão de coordenadas ENU do sítio para geográficas
+
+        @param fa_e, fa_n, fa_u: coordenadas ENU (m), escalares ou arrays
+
+        @return lat e lng (graus), alt (m)
+        """
+        # ENU -> ECEF -> geográfica
+        return geod.ecef2geod_vec(*self.enu2ecef(fa_e, fa_n, fa_u))
+
+    # ---------------------------------------------------------------------------------------------
+    def geod2enu(self, fa_lat, fa_lng, fa_alt=0.):
+        """
+        conversão de coordenadas geográficas para ENU do sítio
+
+        @param fa_lat, fa_lng: coordenadas geográficas (graus), escalares ou arrays
+        @param fa_alt: altitude (m)
+
+        @return e, n, u (m)
+        """
+        # geográfica -> ECEF -> ENU
+        return self.ecef2enu(*geod.geod2ecef_vec(fa_lat, fa_lng, fa_alt))
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def a_org(self):
+        """
+        get origem do referencial em ECEF (m)
+        """
+        return self.__a_org
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def a_rot(self):
+        """
+        get matriz de rotação ENU -> ECEF
+        """
+        return self.__a_rot
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def f_alt(self):
+        """
+        get altitude do sítio
+        """
+        return self.__f_alt
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def f_lat(self):
+        """
+        get latitude do sítio
+        """
+        return self.__f_lat
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def f_lng(self):
+        """
+        get longitude do sítio
+        """
+        return self.__f_lng
+
+# -------------------------------------------------------------------------------------------------
+def get_local_frame(ff_lat, ff_lng, ff_alt=0.):
+    """
+    obtém o referencial local do sítio, criando-o apenas na primeira chamada
+
+    @param ff_lat: latitude do sítio (graus)
+    @param ff_lng: longitude do sítio (graus)
+    @param ff_alt: altitude do sítio (m)
+
+    @return referencial local (CLocalFrame)
+    """
+    # chave do sítio
+    lt_key = (float(ff_lat), float(ff_lng), float(ff_alt))
+
+    # referencial já existe ?
+    l_frame = M_CACHE_FRAME.get(lt_key)
+
+    if l_frame is None:
+        # cria e salva o referencial
+        l_frame = CLocalFrame(ff_lat, ff_lng, ff_alt)
+        M_CACHE_FRAME.put(lt_key, l_frame)
+
+    # return
+    return l_frame
+
+# < the end >--------------------------------------------------------------------------------------
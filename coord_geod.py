@@ -36,8 +36,12 @@ __date__ = "2016/01"
 import logging
 import math
 
+# numpy
+import numpy as np
+
 # import coord_conv as conv
 import coord_defs as cdefs
+import pos_array as parr
 
 # < module data >----------------------------------------------------------------------------------
 
@@ -106,6 +110,66 @@ def ecef2geod(ff_x, ff_y, ff_z=0.):
 
 # -------------------------------------------------------------------------------------------------
 
+def ecef2geod_vec(fa_x, fa_y=None, fa_z=0.):
+    """
+    versão vetorizada (numpy) de ecef2geod. Cada elemento itera até convergir, independente
+    dos demais.
+
+    @param fa_x, fa_y, fa_z: arrays de coordenadas ECEF (m) ou fa_x um CPosXYArray
+
+    @return arrays de lat e lon (graus), alt (m)
+    """
+    # container de posições ?
+    fa_x, fa_y, fa_z = parr.pos_cols(fa_x, fa_y, fa_z)
+
+    # converte as entradas para arrays
+    la_x, la_y, la_z = np.broadcast_arrays(np.asarray(fa_x, dtype=np.float64),
+                                           np.asarray(fa_y, dtype=np.float64),
+                                           np.asarray(fa_z, dtype=np.float64))
+    lt_shape = la_x.shape
+
+    la_x = la_x.ravel()
+    la_y = la_y.ravel()
+    la_z = la_z.ravel()
+
+    # calcula a long
+    la_lng = np.degrees(np.arctan2(la_y, la_x))
+
+    # distância euclidiana
+    la_p = np.sqrt((la_x * la_x) + (la_y * la_y))
+
+    # calcula a lat inicial
+    la_lat = np.arctan2(la_z, la_p * (1. - cdefs.D_e2))
+    la_v = np.empty_like(la_lat)
+
+    # índices dos elementos que ainda não convergiram
+    la_idx = np.arange(la_lat.size)
+
+    # enquanto houver elementos com erro não aceitável...
+    while la_idx.size > 0:
+
+        # lat anterior dos elementos ativos
+        la_lat0 = la_lat[la_idx]
+        la_sin = np.sin(la_lat0)
+
+        # calcula v
+        la_vi = cdefs.D_a / np.sqrt(1. - (cdefs.D_e2 * la_sin * la_sin))
+        la_v[la_idx] = la_vi
+
+        # calcula a nova lat
+        la_lat1 = np.arctan2(la_z[la_idx] + (cdefs.D_e2 * la_vi * la_sin), la_p[la_idx])
+        la_lat[la_idx] = la_lat1
+
+        # mantém apenas os elementos que não convergiram
+        la_idx = la_idx[np.abs(la_lat1 - la_lat0) > 1E-8]
+
+    la_alt = (la_p / np.cos(la_lat)) - la_v
+
+    # retorna as coordenadas geográficas
+    return np.degrees(la_lat).reshape(lt_shape), la_lng.reshape(lt_shape), la_alt.reshape(lt_shape)
+
+# -------------------------------------------------------------------------------------------------
+
 def ecef2geod_bow(ft_xyz):  # (x, y, z):
     """
     conversao de coordenadas ECEF para Geografica. Metodo Iterativo de Bowring.
@@ -270,6 +334,44 @@ def geod2ecef(ff_lat, ff_lng, ff_alt=0.):
 
 # -------------------------------------------------------------------------------------------------
 
+def geod2ecef_vec(fa_lat, fa_lng=None, fa_alt=0.):
+    """
+    versão vetorizada (numpy) de geod2ecef.
+
+    @param fa_lat: array de latitudes (graus) ou CPosLatLngArray
+    @param fa_lng: array de longitudes (graus)
+    @param fa_alt: array de altitudes (m) ou escalar
+
+    @return arrays x, y, z (m)
+    """
+    # container de posições ?
+    fa_lat, fa_lng, fa_alt = parr.pos_cols(fa_lat, fa_lng, fa_alt)
+
+    # converte para radianos
+    la_lat = np.radians(np.asarray(fa_lat, dtype=np.float64))
+    la_lng = np.radians(np.asarray(fa_lng, dtype=np.float64))
+    la_alt = np.asarray(fa_alt, dtype=np.float64)
+
+    # sin e cos da latitude (cos calculado diretamente: sqrt(1 - sin²) perde precisão junto aos
+    # pólos)
+    la_sin_lat = np.sin(la_lat)
+    la_sin2 = la_sin_lat * la_sin_lat
+    la_cos_lat = np.cos(la_lat)
+
+    # calcula v
+    la_v = cdefs.D_a / np.sqrt(1. - (cdefs.D_e2 * la_sin2))
+
+    # raio no plano equatorial
+    la_r = (la_v + la_alt) * la_cos_lat
+
+    # calcula Z
+    la_z = ((la_v * (1 - cdefs.D_e2)) + la_alt) * la_sin_lat
+
+    # retorna as coordenadas ecef
+    return la_r * np.cos(la_lng), la_r * np.sin(la_lng), la_z
+
+# -------------------------------------------------------------------------------------------------
+
 def enu2ecef(x, y, z, latrad, lonrad, altrad):
     """
     conversao de coordenadas ENU (centrado no radar) para ECEF.
@@ -286,19 +388,25 @@ def enu2ecef(x, y, z, latrad, lonrad, altrad):
     # M_LOG.info("enu2ecef:>>")
 
     # converte para ECEF
-    xrad, yrad, zrad = geo2ecef(latrad, lonrad, altrad)
+    xrad, yrad, zrad = geod2ecef(latrad, lonrad, altrad)
 
     # converte para radianos
     latrad = math.radians(latrad)
     lonrad = math.radians(lonrad)
 
+    # sin e cos da lat/lon do radar
+    lf_sin_lat = math.sin(latrad)
+    lf_cos_lat = math.cos(latrad)
+    lf_sin_lng = math.sin(lonrad)
+    lf_cos_lng = math.cos(lonrad)
+
     # calcula
     # | X |   | -sin(lonrad)   -sin(latrad)cos(lonrad)   cos(latrad)cos(lonrad) | | x |   | xrad |
     # | Y | = |  cos(lonrad)   -sin(latrad)sin(lonrad)   cos(latrad)sin(lonrad) | | y | + | yrad |
     # | Z |   |       0                cos(latrad)       sin(latrad)            | | z |   | zrad |
-    X = - sin(lonrad) * x - sin(latrad) * cos(lonrad) * y + cos(latrad) * cos(lonrad) * z + xrad
-    Y = cos(lonrad) * x - sin(latrad) * sin(lonrad) * y + cos(latrad) * sin(lonrad) * z + yrad
-    Z = cos(latrad) * y + sin(latrad) * z + zrad
+    X = - lf_sin_lng * x - lf_sin_lat * lf_cos_lng * y + lf_cos_lat * lf_cos_lng * z + xrad
+    Y = lf_cos_lng * x - lf_sin_lat * lf_sin_lng * y + lf_cos_lat * lf_sin_lng * z + yrad
+    Z = lf_cos_lat * y + lf_sin_lat * z + zrad
 
     # logger
     # M_LOG.info("enu2ecef:<<")
@@ -36,11 +36,22 @@ __date__ = "2016/01"
 import logging
 import math
 
+# numpy
+import numpy as np
+
+import coord_cache as ccache
 import coord_conv as conv
 import coord_defs as cdefs
+import pos_array as parr
+
+# < module data >----------------------------------------------------------------------------------
+
+# cache dos coeficientes de rotação (cos, sin) por declinação magnética (limitado)
+M_DCL_ROT_MAX = 64
+M_CACHE_DCL_ROT = ccache.CLRUCache(M_DCL_ROT_MAX)
 
 # -------------------------------------------------------------------------------------------------
-def __calc_gama(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdefs.M_REF_LNG):
+def __calc_gama(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdefs.M_REF_LNG, f_ref=None):
     """
     cálculo do ângulo entre a referência e o ponto
 
@@ -48,9 +59,14 @@ def __calc_gama(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=c
     @param ff_lng_pto: longitude do ponto em graus
     @param ff_lat_ref: latitude da referência em graus
     @param ff_lng_ref: longitude da referência em graus
+    @param f_ref: referencial pré-calculado (CReferenceFrame), substitui a referência
 
     @return ângulo entre a referência e o ponto
     """
+    # referencial pré-calculado ?
+    if f_ref is not None:
+        ff_lat_ref, ff_lng_ref = f_ref.f_lat, f_ref.f_lng
+
     # check input
     assert  -90. <= ff_lat_pto <= 90.
     assert -180. <= ff_lng_pto <= 180.
@@ -63,13 +79,18 @@ def __calc_gama(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=c
         # pontos coincidentes
         return 0.
 
-    # obtém as coordenadas do ponto de referência em radianos
-    lf_lat_ref = math.radians(ff_lat_ref)
-    lf_lng_ref = math.radians(ff_lng_ref)
+    # vetor unitário da referência já calculado ?
+    if f_ref is not None:
+        lf_ir, lf_jr, lf_kr = f_ref.t_unit
+
+    else:
+        # obtém as coordenadas do ponto de referência em radianos
+        lf_lat_ref = math.radians(ff_lat_ref)
+        lf_lng_ref = math.radians(ff_lng_ref)
 
-    lf_ir = math.cos(lf_lat_ref) * math.cos(lf_lng_ref)
-    lf_jr = math.cos(lf_lat_ref) * math.sin(lf_lng_ref)
-    lf_kr = math.sin(lf_lat_ref)
+        lf_ir = math.cos(lf_lat_ref) * math.cos(lf_lng_ref)
+        lf_jr = math.cos(lf_lat_ref) * math.sin(lf_lng_ref)
+        lf_kr = math.sin(lf_lat_ref)
 
     # obtém as coordenadas do ponto em radianos
     lf_lat_pto = math.radians(ff_lat_pto)
@@ -82,6 +103,117 @@ def __calc_gama(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=c
     # distância entre a referência e o ponto
     return (lf_ir * lf_ip) + (lf_jr * lf_jp) + (lf_kr * lf_kp)
 
+# -------------------------------------------------------------------------------------------------
+def __calc_pol_vec(fa_lat_pto, fa_lng_pto, fa_lat_ref, fa_lng_ref, f_ref=None):
+    """
+    cálculo vetorizado do azimute e do ângulo entre a referência e o ponto. As entradas são
+    combinadas por broadcasting (numpy), a trigonometria de cada lado é calculada uma única vez
+
+    @param fa_lat_pto: latitudes dos pontos em graus
+    @param fa_lng_pto: longitudes dos pontos em graus
+    @param fa_lat_ref: latitudes das referências em graus
+    @param fa_lng_ref: longitudes das referências em graus
+    @param f_ref: referencial pré-calculado (CReferenceFrame) de uma referência única
+
+    @return azimute (radianos) e ângulo (radianos) entre a referência e o ponto
+    """
+    # referencial pré-calculado ?
+    if f_ref is not None:
+        fa_lat_ref, fa_lng_ref = f_ref.f_lat, f_ref.f_lng
+
+    # check input
+    assert np.all((-90. <= fa_lat_pto) & (fa_lat_pto <= 90.))
+    assert np.all((-180. <= fa_lng_pto) & (fa_lng_pto <= 180.))
+
+    assert np.all((-90. <= fa_lat_ref) & (fa_lat_ref <= 90.))
+    assert np.all((-180. <= fa_lng_ref) & (fa_lng_ref <= 180.))
+
+    # trigonometria da referência já calculada ?
+    if f_ref is not None:
+        la_cos_lng_ref = f_ref.f_cos_lng
+        la_sin_lng_ref = f_ref.f_sin_lng
+
+        la_ir, la_jr, la_kr = f_ref.t_unit
+
+    else:
+        # obtém as coordenadas da referência em radianos
+        la_lat_ref = np.radians(fa_lat_ref)
+        la_lng_ref = np.radians(fa_lng_ref)
+
+        la_cos_lat_ref = np.cos(la_lat_ref)
+        la_cos_lng_ref = np.cos(la_lng_ref)
+        la_sin_lng_ref = np.sin(la_lng_ref)
+
+        la_ir = la_cos_lat_ref * la_cos_lng_ref
+        la_jr = la_cos_lat_ref * la_sin_lng_ref
+        la_kr = np.sin(la_lat_ref)
+
+    # obtém as coordenadas do ponto em radianos
+    la_lat_pto = np.radians(fa_lat_pto)
+    la_lng_pto = np.radians(fa_lng_pto)
+
+    la_cos_lat_pto = np.cos(la_lat_pto)
+
+    la_ip = la_cos_lat_pto * np.cos(la_lng_pto)
+    la_jp = la_cos_lat_pto * np.sin(la_lng_pto)
+    la_kp = np.sin(la_lat_pto)
+
+    # ângulo entre a referência e o ponto
+    la_gama = np.arccos(np.clip((la_ir * la_ip) + (la_jr * la_jp) + (la_kr * la_kp), -1., 1.))
+
+    # ângulo entre o ponto e a sua projeção na longitude da referência
+    la_delta = (la_ip * (la_cos_lat_pto * la_cos_lng_ref)) + \
+               (la_jp * (la_cos_lat_pto * la_sin_lng_ref)) + (la_kp * la_kp)
+    la_delta = np.arccos(np.clip(la_delta, -1., 1.))
+
+    # azimute básico (primeiro quadrante)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        la_azim = np.arcsin(np.clip(np.sin(la_delta) / np.sin(la_gama), -1., 1.))
+
+    # diferenças em latitude e longitude
+    la_dlat = np.subtract(fa_lat_pto, fa_lat_ref)
+    la_dlng = np.subtract(fa_lng_pto, fa_lng_ref)
+
+    # correção do quadrante: ao sul reflete em torno de 90, a oeste reflete em torno de 180
+    la_azim = np.where(la_dlat > 0., la_azim, math.pi - la_azim)
+    la_azim = np.where(la_dlng < 0., cdefs.D_RAD_2PI - la_azim, la_azim)
+
+    # mesma linha (à direita 90, à esquerda 270)
+    la_azim = np.where(la_dlat == 0., np.where(la_dlng > 0., cdefs.D_RAD_PI_2, cdefs.D_RAD_3PI_2), la_azim)
+
+    # mesma coluna (acima 0, abaixo 180) ou pontos coincidentes
+    la_azim = np.where(la_dlng == 0., np.where(la_dlat < 0., math.pi, 0.), la_azim)
+
+    # pontos coincidentes
+    la_gama = np.where((la_dlat == 0.) & (la_dlng == 0.), 0., la_gama)
+
+    # return
+    return la_azim, la_gama
+
+# -------------------------------------------------------------------------------------------------
+def __decl_rot(ff_dcl_mag):
+    """
+    obtém os coeficientes de rotação da declinação magnética, calculando-os apenas na primeira
+    vez que a declinação é usada (só em decl_xyz_vec, onde o custo é diluído pelo lote)
+
+    @param ff_dcl_mag: declinação magnética em graus
+
+    @return cos e sin da declinação
+    """
+    # coeficientes já calculados ?
+    lt_rot = M_CACHE_DCL_ROT.get(ff_dcl_mag)
+
+    if lt_rot is None:
+        # declinação em radianos
+        lf_dcl_r = math.radians(ff_dcl_mag)
+
+        # sin e cos da declinação
+        lt_rot = (math.cos(lf_dcl_r), math.sin(lf_dcl_r))
+        M_CACHE_DCL_ROT.put(ff_dcl_mag, lt_rot)
+
+    # return
+    return lt_rot
+
 # -------------------------------------------------------------------------------------------------
 def decl_xyz_0(ff_x, ff_y, ff_z, ff_decl_mag):
     """
@@ -194,41 +326,96 @@ def decl_xyz_0(ff_x, ff_y, ff_z, ff_decl_mag):
     return ff_x, ff_y, ff_z
 
 # -------------------------------------------------------------------------------------------------
-def decl_xyz(ff_x, ff_y, ff_z, ff_dcl_mag=cdefs.M_DCL_MAG):
+def decl_xyz(ff_x, ff_y, ff_z, ff_dcl_mag=cdefs.M_DCL_MAG, f_ref=None):
     """
-    negativo (O/W), gira no sentido horário
+    positivo (E/L), gira no sentido anti-horário; negativo (O/W), gira no sentido horário
 
     @param ff_x: DOCUMENT ME!
     @param ff_y: DOCUMENT ME!
     @param ff_z: DOCUMENT ME!
     @param ff_decl_mag: DOCUMENT ME!
+    @param f_ref: referencial pré-calculado (CReferenceFrame), substitui a declinação
 
     @return ponto declinado
     """
-    # declinação em radianos
-    lf_dcl_r = math.radians(abs(ff_dcl_mag))
+    # sin e cos da declinação
+    if f_ref is not None:
+        lf_dcl_cos, lf_dcl_sin = f_ref.f_dcl_cos, f_ref.f_dcl_sin
+
+    else:
+        # declinação em radianos (calculada aqui: uma consulta ao cache custa mais que sin e cos)
+        lf_dcl_r = math.radians(ff_dcl_mag)
+
+        lf_dcl_cos = math.cos(lf_dcl_r)
+        lf_dcl_sin = math.sin(lf_dcl_r)
+
+    # ajuste da coordenada com a declinação magnética
+    lf_x = (ff_x * lf_dcl_cos) - (ff_y * lf_dcl_sin)
+    lf_y = (ff_y * lf_dcl_cos) + (ff_x * lf_dcl_sin)
+
+    # return
+    return lf_x, lf_y, ff_z
+
+# -------------------------------------------------------------------------------------------------
+def decl_xyz_vec(fa_x, fa_y=None, fa_z=None, ff_dcl_mag=cdefs.M_DCL_MAG, ft_out=None, f_ref=None):
+    """
+    versão vetorizada de decl_xyz. Todos os pontos são girados pela mesma declinação, cujos
+    coeficientes de rotação são calculados uma única vez
+
+    @param fa_x: array de coordenadas x ou CPosXYArray
+    @param fa_y: array de coordenadas y
+    @param fa_z: array de coordenadas z
+    @param ff_dcl_mag: declinação magnética em graus
+    @param ft_out: tupla (x, y, z) de arrays pré-alocados ou CPosXYArray para a saída (podem ser
+                   as próprias entradas, para girar os pontos no lugar)
+    @param f_ref: referencial pré-calculado (CReferenceFrame), substitui a declinação
+
+    @return pontos declinados (x, y, z)
+    """
+    # containers de posições ?
+    fa_x, fa_y, fa_z = parr.pos_cols(fa_x, fa_y, fa_z)
+
+    if hasattr(ft_out, "cols"):
+        ft_out = ft_out.cols
 
     # sin e cos da declinação
-    lf_dcl_sin = math.sin(lf_dcl_r)
-    lf_dcl_cos = math.cos(lf_dcl_r)
+    if f_ref is not None:
+        lf_dcl_cos, lf_dcl_sin = f_ref.f_dcl_cos, f_ref.f_dcl_sin
+
+    else:
+        lf_dcl_cos, lf_dcl_sin = __decl_rot(ff_dcl_mag)
+
+    la_x = np.asarray(fa_x, dtype=np.float64)
+    la_y = np.asarray(fa_y, dtype=np.float64)
+
+    # termos cruzados (antes de sobrescrever as entradas)
+    la_xs = la_x * lf_dcl_sin
+    la_ys = la_y * lf_dcl_sin
 
-    # declinação a leste ?
-    if ff_dcl_mag > 0.:
-        # ajuste da coordenada com a declinação magnética
-        ff_x = (ff_x * lf_dcl_cos) - (ff_y * lf_dcl_sin)
-        ff_y = (ff_y * lf_dcl_cos) + (ff_x * lf_dcl_sin)
+    # aloca a saída ?
+    if ft_out is None:
+        la_ox, la_oy, la_oz = np.empty_like(la_x), np.empty_like(la_y), np.array(fa_z, dtype=np.float64)
 
-    # senão, declinação a oeste
+    # senão, usa os arrays pré-alocados
     else:
-        # ajuste da coordenada com a declinação magnética
-        ff_x = (ff_x * lf_dcl_cos) + (ff_y * lf_dcl_sin)
-        ff_y = (ff_y * lf_dcl_cos) - (ff_x * lf_dcl_sin)
+        la_ox, la_oy, la_oz = ft_out
+
+        # copia z para a saída
+        if la_oz is not fa_z:
+            la_oz[...] = fa_z
+
+    # ajuste das coordenadas com a declinação magnética
+    np.multiply(la_x, lf_dcl_cos, out=la_ox)
+    la_ox -= la_ys
+
+    np.multiply(la_y, lf_dcl_cos, out=la_oy)
+    la_oy += la_xs
 
     # return
-    return ff_x, ff_y, ff_z
+    return la_ox, la_oy, la_oz
 
 # -------------------------------------------------------------------------------------------------
-def geo_azim(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdefs.M_REF_LNG):
+def geo_azim(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdefs.M_REF_LNG, f_ref=None):
     """
     cálculo do azimute entre duas coordenadas geográficas
 
@@ -241,9 +428,14 @@ def geo_azim(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdef
     @param ff_lng_pto: longitude do ponto em graus
     @param ff_lat_ref: latitude da referência em graus
     @param ff_lng_ref: longitude da referência em graus
+    @param f_ref: referencial pré-calculado (CReferenceFrame), substitui a referência
 
     @return azimute entre a referência e o ponto em radianos
     """
+    # referencial pré-calculado ?
+    if f_ref is not None:
+        ff_lat_ref, ff_lng_ref = f_ref.f_lat, f_ref.f_lng
+
     # check input
     assert  -90. <= ff_lat_pto <= 90.
     assert -180. <= ff_lng_pto <= 180.
@@ -273,7 +465,7 @@ def geo_azim(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdef
         return 0.
 
     # calcula o ângulo (rad)
-    lf_gama = __calc_gama(ff_lat_pto, ff_lng_pto, ff_lat_ref, ff_lng_ref)
+    lf_gama = __calc_gama(ff_lat_pto, ff_lng_pto, ff_lat_ref, ff_lng_ref, f_ref)
 
     if 1 == int(lf_gama):
         lf_arc_gama = 0.
@@ -351,7 +543,55 @@ def geo_azim_bug(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=
     return conv.azm2ang(math.atan2(lf_lat_dst, lf_lng_dst))
 
 # -------------------------------------------------------------------------------------------------
-def geo_dist(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdefs.M_REF_LNG):
+def geo_azim_mat(fa_lat_pto, fa_lng_pto, fa_lat_ref, fa_lng_ref=None):
+    """
+    cálculo da matriz de azimutes entre M referências e N pontos
+
+    @param fa_lat_pto: latitudes dos pontos em graus (N) ou CPosLatLngArray
+    @param fa_lng_pto: longitudes dos pontos em graus (N) ou None
+    @param fa_lat_ref: latitudes das referências em graus (M) ou CPosLatLngArray
+    @param fa_lng_ref: longitudes das referências em graus (M) ou None
+
+    @return matriz (M x N) de azimutes entre as referências e os pontos em radianos
+    """
+    # containers de posições ?
+    fa_lat_pto, fa_lng_pto, _ = parr.pos_cols(fa_lat_pto, fa_lng_pto)
+    fa_lat_ref, fa_lng_ref, _ = parr.pos_cols(fa_lat_ref, fa_lng_ref)
+
+    # calcula azimute e ângulo
+    la_azim, _ = __calc_pol_vec(np.asarray(fa_lat_pto, dtype=np.float64)[np.newaxis, :],
+                                np.asarray(fa_lng_pto, dtype=np.float64)[np.newaxis, :],
+                                np.asarray(fa_lat_ref, dtype=np.float64)[:, np.newaxis],
+                                np.asarray(fa_lng_ref, dtype=np.float64)[:, np.newaxis])
+
+    # return
+    return la_azim
+
+# -------------------------------------------------------------------------------------------------
+def geo_azim_vec(fa_lat_pto, fa_lng_pto=None, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdefs.M_REF_LNG, f_ref=None):
+    """
+    cálculo do azimute entre uma referência e N pontos (versão vetorizada de geo_azim)
+
+    @param fa_lat_pto: latitudes dos pontos em graus ou CPosLatLngArray
+    @param fa_lng_pto: longitudes dos pontos em graus
+    @param ff_lat_ref: latitude da referência em graus
+    @param ff_lng_ref: longitude da referência em graus
+    @param f_ref: referencial pré-calculado (CReferenceFrame), substitui a referência
+
+    @return azimutes entre a referência e os pontos em radianos
+    """
+    # container de posições ?
+    fa_lat_pto, fa_lng_pto, _ = parr.pos_cols(fa_lat_pto, fa_lng_pto)
+
+    # calcula azimute e ângulo
+    la_azim, _ = __calc_pol_vec(np.asarray(fa_lat_pto, dtype=np.float64),
+                                np.asarray(fa_lng_pto, dtype=np.float64), ff_lat_ref, ff_lng_ref, f_ref)
+
+    # return
+    return la_azim
+
+# -------------------------------------------------------------------------------------------------
+def geo_dist(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdefs.M_REF_LNG, f_ref=None):
     """
     cálculo da distância entre dois pontos geográficos
 
@@ -359,9 +599,14 @@ def geo_dist(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdef
     @param ff_lng_pto: longitude do ponto em graus
     @param ff_lat_ref: latitude da referência em graus
     @param ff_lng_ref: longitude da referência em graus
+    @param f_ref: referencial pré-calculado (CReferenceFrame), substitui a referência
 
     @return distância entre a referência e o ponto em NM
     """
+    # referencial pré-calculado ?
+    if f_ref is not None:
+        ff_lat_ref, ff_lng_ref = f_ref.f_lat, f_ref.f_lng
+
     # check input
     assert  -90. <= ff_lat_pto <= 90.
     assert -180. <= ff_lng_pto <= 180.
@@ -375,7 +620,7 @@ def geo_dist(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdef
         return 0.
 
     # calcula o ângulo
-    lf_gama = __calc_gama(ff_lat_pto, ff_lng_pto, ff_lat_ref, ff_lng_ref)
+    lf_gama = __calc_gama(ff_lat_pto, ff_lng_pto, ff_lat_ref, ff_lng_ref, f_ref)
 
     # retorna o cálculo da distância entre a referência e o ponto
     return math.acos(lf_gama) * cdefs.D_EARTH_RADIUS_NM
@@ -415,7 +660,55 @@ def geo_dist_2(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cd
     return math.sqrt(lf_lat_dst + lf_lng_dst) * cdefs.D_CNV_G2NM
 
 # -------------------------------------------------------------------------------------------------
-def geo2pol(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdefs.M_REF_LNG):
+def geo_dist_mat(fa_lat_pto, fa_lng_pto, fa_lat_ref, fa_lng_ref=None):
+    """
+    cálculo da matriz de distâncias entre M referências e N pontos
+
+    @param fa_lat_pto: latitudes dos pontos em graus (N) ou CPosLatLngArray
+    @param fa_lng_pto: longitudes dos pontos em graus (N) ou None
+    @param fa_lat_ref: latitudes das referências em graus (M) ou CPosLatLngArray
+    @param fa_lng_ref: longitudes das referências em graus (M) ou None
+
+    @return matriz (M x N) de distâncias entre as referências e os pontos em NM
+    """
+    # containers de posições ?
+    fa_lat_pto, fa_lng_pto, _ = parr.pos_cols(fa_lat_pto, fa_lng_pto)
+    fa_lat_ref, fa_lng_ref, _ = parr.pos_cols(fa_lat_ref, fa_lng_ref)
+
+    # calcula azimute e ângulo
+    _, la_gama = __calc_pol_vec(np.asarray(fa_lat_pto, dtype=np.float64)[np.newaxis, :],
+                                np.asarray(fa_lng_pto, dtype=np.float64)[np.newaxis, :],
+                                np.asarray(fa_lat_ref, dtype=np.float64)[:, np.newaxis],
+                                np.asarray(fa_lng_ref, dtype=np.float64)[:, np.newaxis])
+
+    # return
+    return la_gama * cdefs.D_EARTH_RADIUS_NM
+
+# -------------------------------------------------------------------------------------------------
+def geo_dist_vec(fa_lat_pto, fa_lng_pto=None, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdefs.M_REF_LNG, f_ref=None):
+    """
+    cálculo da distância entre uma referência e N pontos (versão vetorizada de geo_dist)
+
+    @param fa_lat_pto: latitudes dos pontos em graus ou CPosLatLngArray
+    @param fa_lng_pto: longitudes dos pontos em graus
+    @param ff_lat_ref: latitude da referência em graus
+    @param ff_lng_ref: longitude da referência em graus
+    @param f_ref: referencial pré-calculado (CReferenceFrame), substitui a referência
+
+    @return distâncias entre a referência e os pontos em NM
+    """
+    # container de posições ?
+    fa_lat_pto, fa_lng_pto, _ = parr.pos_cols(fa_lat_pto, fa_lng_pto)
+
+    # calcula azimute e ângulo
+    _, la_gama = __calc_pol_vec(np.asarray(fa_lat_pto, dtype=np.float64),
+                                np.asarray(fa_lng_pto, dtype=np.float64), ff_lat_ref, ff_lng_ref, f_ref)
+
+    # return
+    return la_gama * cdefs.D_EARTH_RADIUS_NM
+
+# -------------------------------------------------------------------------------------------------
+def geo2pol(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdefs.M_REF_LNG, f_ref=None):
     """
     transforma coordenadas geográficas em coordenadas polares
 
@@ -423,9 +716,14 @@ def geo2pol(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdefs
     @param ff_lng_pto: longitude em graus
     @param ff_lat_ref: latitude do ponto de referência
     @param ff_lng_ref: longitude do ponto de referência
+    @param f_ref: referencial pré-calculado (CReferenceFrame), substitui a referência
 
     @return coordenadas polares do ponto (azimute em graus, distância em NM)
     """
+    # referencial pré-calculado ?
+    if f_ref is not None:
+        ff_lat_ref, ff_lng_ref = f_ref.f_lat, f_ref.f_lng
+
     # check input
     assert  -90. <= ff_lat_pto <= 90.
     assert -180. <= ff_lng_pto <= 180.
@@ -439,7 +737,7 @@ def geo2pol(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdefs
         return 0., 0.
 
     # calcula o ângulo
-    lf_gama = math.acos(__calc_gama(ff_lat_pto, ff_lng_pto, ff_lat_ref, ff_lng_ref))
+    lf_gama = math.acos(__calc_gama(ff_lat_pto, ff_lng_pto, ff_lat_ref, ff_lng_ref, f_ref))
 
     # calcula a distância
     lf_dist = lf_gama * cdefs.D_EARTH_RADIUS_NM
@@ -507,7 +805,63 @@ def geo2pol(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdefs
     return lf_azim, lf_dist
 
 # -------------------------------------------------------------------------------------------------
-def geo2xy(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdefs.M_REF_LNG):
+def geo2pol_mat(fa_lat_pto, fa_lng_pto, fa_lat_ref, fa_lng_ref=None):
+    """
+    transforma N coordenadas geográficas em coordenadas polares em relação a M referências
+
+    @param fa_lat_pto: latitudes dos pontos em graus (N) ou CPosLatLngArray
+    @param fa_lng_pto: longitudes dos pontos em graus (N) ou None
+    @param fa_lat_ref: latitudes das referências em graus (M) ou CPosLatLngArray
+    @param fa_lng_ref: longitudes das referências em graus (M) ou None
+
+    @return matrizes (M x N) de azimutes em graus e de distâncias em NM
+    """
+    # containers de posições ?
+    fa_lat_pto, fa_lng_pto, _ = parr.pos_cols(fa_lat_pto, fa_lng_pto)
+    fa_lat_ref, fa_lng_ref, _ = parr.pos_cols(fa_lat_ref, fa_lng_ref)
+
+    # calcula azimute e ângulo
+    la_azim, la_gama = __calc_pol_vec(np.asarray(fa_lat_pto, dtype=np.float64)[np.newaxis, :],
+                                      np.asarray(fa_lng_pto, dtype=np.float64)[np.newaxis, :],
+                                      np.asarray(fa_lat_ref, dtype=np.float64)[:, np.newaxis],
+                                      np.asarray(fa_lng_ref, dtype=np.float64)[:, np.newaxis])
+
+    # azimute em graus no intervalo [0, 360)
+    la_azim = np.degrees(la_azim)
+    la_azim = np.where(la_azim >= 360., la_azim - 360., la_azim)
+
+    # return
+    return la_azim, la_gama * cdefs.D_EARTH_RADIUS_NM
+
+# -------------------------------------------------------------------------------------------------
+def geo2pol_vec(fa_lat_pto, fa_lng_pto=None, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdefs.M_REF_LNG, f_ref=None):
+    """
+    transforma N coordenadas geográficas em coordenadas polares (versão vetorizada de geo2pol)
+
+    @param fa_lat_pto: latitudes em graus ou CPosLatLngArray
+    @param fa_lng_pto: longitudes em graus
+    @param ff_lat_ref: latitude do ponto de referência
+    @param ff_lng_ref: longitude do ponto de referência
+    @param f_ref: referencial pré-calculado (CReferenceFrame), substitui a referência
+
+    @return coordenadas polares dos pontos (azimutes em graus, distâncias em NM)
+    """
+    # container de posições ?
+    fa_lat_pto, fa_lng_pto, _ = parr.pos_cols(fa_lat_pto, fa_lng_pto)
+
+    # calcula azimute e ângulo
+    la_azim, la_gama = __calc_pol_vec(np.asarray(fa_lat_pto, dtype=np.float64),
+                                      np.asarray(fa_lng_pto, dtype=np.float64), ff_lat_ref, ff_lng_ref, f_ref)
+
+    # azimute em graus no intervalo [0, 360)
+    la_azim = np.degrees(la_azim)
+    la_azim = np.where(la_azim >= 360., la_azim - 360., la_azim)
+
+    # return
+    return la_azim, la_gama * cdefs.D_EARTH_RADIUS_NM
+
+# -------------------------------------------------------------------------------------------------
+def geo2xy(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdefs.M_REF_LNG, f_ref=None):
     """
     transforma coordenadas geográficas em coordenadas cartesianas
 
@@ -515,9 +869,14 @@ def geo2xy(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdefs.
     @param ff_lng_pto: longitude em graus
     @param ff_lat_ref: latitude do ponto de referência
     @param ff_lng_ref: longitude do ponto de referência
+    @param f_ref: referencial pré-calculado (CReferenceFrame), substitui a referência
 
     @return coordenadas polares do ponto (azimute, distância em NM)
     """
+    # referencial pré-calculado ?
+    if f_ref is not None:
+        ff_lat_ref, ff_lng_ref = f_ref.f_lat, f_ref.f_lng
+
     # check input
     assert  -90. <= ff_lat_pto <= 90.
     assert -180. <= ff_lng_pto <= 180.
@@ -526,7 +885,7 @@ def geo2xy(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdefs.
     assert -180. <= ff_lng_ref <= 180.
 
     # converte de geográfica para polar
-    lf_azim, lf_dist = geo2pol(ff_lat_pto, ff_lng_pto, ff_lat_ref, ff_lng_ref)
+    lf_azim, lf_dist = geo2pol(ff_lat_pto, ff_lng_pto, ff_lat_ref, ff_lng_ref, f_ref)
 
     # converte de polar para cartesiana
     lf_x = lf_dist * math.sin(math.radians(lf_azim))
@@ -539,7 +898,7 @@ def geo2xy(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdefs.
     return lf_x, lf_y
 
 # -------------------------------------------------------------------------------------------------
-def geo2xy_2(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdefs.M_REF_LNG):
+def geo2xy_2(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdefs.M_REF_LNG, f_ref=None):
     """
     conversão de coordenadas geográficas
 
@@ -547,9 +906,14 @@ def geo2xy_2(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdef
     @param ff_lng_pto: longitude em graus
     @param ff_lat_ref: coordenadas geográficas de referênica
     @param ff_lng_ref: coordenadas geográficas de referênica
+    @param f_ref: referencial pré-calculado (CReferenceFrame), substitui a referência
 
     @return coordenadas X e Y do ponto
     """
+    # referencial pré-calculado ?
+    if f_ref is not None:
+        ff_lat_ref, ff_lng_ref = f_ref.f_lat, f_ref.f_lng
+
     # check input
     assert  -90. <= ff_lat_pto <= 90.
     assert -180. <= ff_lng_pto <= 180.
@@ -558,8 +922,8 @@ def geo2xy_2(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdef
     assert -180. <= ff_lng_ref <= 180.
 
     # cálculo da distância e do azimute geográficos do ponto
-    l_vd = geo_dist(ff_lat_pto, ff_lng_pto, ff_lat_ref, ff_lng_ref)
-    l_vr = geo_azim(ff_lat_pto, ff_lng_pto, ff_lat_ref, ff_lng_ref)
+    l_vd = geo_dist(ff_lat_pto, ff_lng_pto, ff_lat_ref, ff_lng_ref, f_ref)
+    l_vr = geo_azim(ff_lat_pto, ff_lng_pto, ff_lat_ref, ff_lng_ref, f_ref)
 
     # converte o azimute para ângulo em radianos
     l_vr = math.radians(conv.azm2ang(math.degrees(l_vr)))
@@ -577,19 +941,28 @@ def geo2xy_2(ff_lat_pto, ff_lng_pto, ff_lat_ref=cdefs.M_REF_LAT, ff_lng_ref=cdef
     return lf_x, lf_y
 
 # -------------------------------------------------------------------------------------------------
-def geo2xyz_3(ff_lat_pto, ff_lng_pto, ff_alt=0.):
+def geo2xyz_3(ff_lat_pto, ff_lng_pto, ff_alt=0., f_ref=None):
     """
     geodetic coordinates(latitude, longitude, height) can be converted into XY
+
+    @param f_ref: referencial pré-calculado (CReferenceFrame), substitui a referência global
     """
     # check input
     assert  -90. <= ff_lat_pto <= 90.
     assert -180. <= ff_lng_pto <= 180.
 
+    # referência e fator de escala
+    if f_ref is not None:
+        lf_lat_ref, lf_lng_ref, lf_gr2m = f_ref.f_lat, f_ref.f_lng, f_ref.f_cnv_gr2m
+
+    else:
+        lf_lat_ref, lf_lng_ref, lf_gr2m = float(cdefs.M_REF_LAT), float(cdefs.M_REF_LNG), cdefs.D_CNV_GR2M
+
     # calcula x
-    lf_x = (ff_lng_pto - float(cdefs.M_REF_LNG)) * cdefs.D_CNV_GR2M
+    lf_x = (ff_lng_pto - lf_lng_ref) * lf_gr2m
 
     # calcula y
-    lf_y = (ff_lat_pto - float(cdefs.M_REF_LAT)) * cdefs.D_CNV_GR2M
+    lf_y = (ff_lat_pto - lf_lat_ref) * lf_gr2m
 
     # elevação
     lf_z = ff_alt
@@ -597,6 +970,43 @@ def geo2xyz_3(ff_lat_pto, ff_lng_pto, ff_alt=0.):
     # retorna as coordenadas xyz
     return lf_x, lf_y, lf_z
 
+# -------------------------------------------------------------------------------------------------
+def geo2xyz_3_vec(fa_lat_pto, fa_lng_pto=None, fa_alt=0., f_ref=None):
+    """
+    versão vetorizada de geo2xyz_3
+
+    @param fa_lat_pto: array de latitudes em graus ou CPosLatLngArray
+    @param fa_lng_pto: array de longitudes em graus
+    @param fa_alt: array de altitudes ou escalar
+    @param f_ref: referencial pré-calculado (CReferenceFrame), substitui a referência global
+
+    @return arrays x, y, z
+    """
+    # container de posições ?
+    fa_lat_pto, fa_lng_pto, fa_alt = parr.pos_cols(fa_lat_pto, fa_lng_pto, fa_alt)
+
+    # converte para arrays
+    la_lat = np.asarray(fa_lat_pto, dtype=np.float64)
+    la_lng = np.asarray(fa_lng_pto, dtype=np.float64)
+
+    # check input
+    assert np.all((-90. <= la_lat) & (la_lat <= 90.))
+    assert np.all((-180. <= la_lng) & (la_lng <= 180.))
+
+    # referência e fator de escala
+    if f_ref is not None:
+        lf_lat_ref, lf_lng_ref, lf_gr2m = f_ref.f_lat, f_ref.f_lng, f_ref.f_cnv_gr2m
+
+    else:
+        lf_lat_ref, lf_lng_ref, lf_gr2m = float(cdefs.M_REF_LAT), float(cdefs.M_REF_LNG), cdefs.D_CNV_GR2M
+
+    # calcula x e y
+    la_x = (la_lng - lf_lng_ref) * lf_gr2m
+    la_y = (la_lat - lf_lat_ref) * lf_gr2m
+
+    # retorna as coordenadas xyz
+    return la_x, la_y, np.broadcast_to(np.asarray(fa_alt, dtype=np.float64), la_x.shape).copy()
+
 # -------------------------------------------------------------------------------------------------
 def pol2xyz(ff_azim, ff_dist):
     """
@@ -624,7 +1034,7 @@ def pol2xyz(ff_azim, ff_dist):
     return lf_x, lf_y, 0.
 
 # -------------------------------------------------------------------------------------------------
-def xyz2geo_3(ff_x, ff_y, ff_z=0.):
+def xyz2geo_3(ff_x, ff_y, ff_z=0., f_ref=None):
     """
     conversão de coordenadas geográficas
     geodetic coordinates (latitude, longitude, height) can be converted into xyz.
@@ -632,12 +1042,20 @@ def xyz2geo_3(ff_x, ff_y, ff_z=0.):
     @param ff_x: coordenada x do ponto
     @param ff_y: coordenada y do ponto
     @param ff_z: coordenada z do ponto
+    @param f_ref: referencial pré-calculado (CReferenceFrame), substitui a referência global
     """
+    # referência e fator de escala
+    if f_ref is not None:
+        lf_lat_ref, lf_lng_ref, lf_m2gr = f_ref.f_lat, f_ref.f_lng, f_ref.f_cnv_m2gr
+
+    else:
+        lf_lat_ref, lf_lng_ref, lf_m2gr = float(cdefs.M_REF_LAT), float(cdefs.M_REF_LNG), 1. / cdefs.D_CNV_GR2M
+
     # calcula latitude
-    lf_lat = float(cdefs.M_REF_LAT) + (ff_y / cdefs.D_CNV_GR2M)
+    lf_lat = lf_lat_ref + (ff_y * lf_m2gr)
 
     # calcula longitude
-    lf_lng = float(cdefs.M_REF_LNG) + (ff_x / cdefs.D_CNV_GR2M)
+    lf_lng = lf_lng_ref + (ff_x * lf_m2gr)
 
     # calcula altitude
     lf_alt = ff_z
@@ -645,4 +1063,33 @@ def xyz2geo_3(ff_x, ff_y, ff_z=0.):
     # retorna as coordenadas lat/long
     return lf_lat, lf_lng, lf_alt
 
+# -------------------------------------------------------------------------------------------------
+def xyz2geo_3_vec(fa_x, fa_y=None, fa_z=0., f_ref=None):
+    """
+    versão vetorizada de xyz2geo_3
+
+    @param fa_x: array de coordenadas x ou CPosXYArray
+    @param fa_y: array de coordenadas y
+    @param fa_z: array de coordenadas z ou escalar
+    @param f_ref: referencial pré-calculado (CReferenceFrame), substitui a referência global
+
+    @return arrays de latitude, longitude e altitude
+    """
+    # container de posições ?
+    fa_x, fa_y, fa_z = parr.pos_cols(fa_x, fa_y, fa_z)
+
+    # referência e fator de escala
+    if f_ref is not None:
+        lf_lat_ref, lf_lng_ref, lf_m2gr = f_ref.f_lat, f_ref.f_lng, f_ref.f_cnv_m2gr
+
+    else:
+        lf_lat_ref, lf_lng_ref, lf_m2gr = float(cdefs.M_REF_LAT), float(cdefs.M_REF_LNG), 1. / cdefs.D_CNV_GR2M
+
+    # calcula latitude e longitude
+    la_lat = lf_lat_ref + (np.asarray(fa_y, dtype=np.float64) * lf_m2gr)
+    la_lng = lf_lng_ref + (np.asarray(fa_x, dtype=np.float64) * lf_m2gr)
+
+    # retorna as coordenadas lat/long
+    return la_lat, la_lng, np.broadcast_to(np.asarray(fa_z, dtype=np.float64), la_lat.shape).copy()
+
 # < the end >--------------------------------------------------------------------------------------
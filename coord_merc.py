@@ -0,0 +1,478 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+coord_merc
+
+latitude conforme e projeção de Mercator no elipsóide WGS84
+
+as conversões entre latitude geodésica (φ) e conforme (χ) usam séries de senos de 8ª ordem em e
+(Osborne, Mercator Projections): a inversa com os parâmetros de coord_defs (D_d2..D_d8) e a
+direta com os coeficientes calculados a partir de D_e2. Cada série é avaliada como
+
+    Σ b_k sin 2kθ = sin 2θ (k0 + c (k1 + c (k2 + c k3))),  c = cos 2θ
+
+(esquema de Horner), com apenas dois termos trigonométricos
+
+projeção: x = a (λ - λ0), y = a ψ, com ψ = atanh(sin χ) a latitude isométrica. A inversa não é
+iterativa: χ = atan(sinh ψ) e φ pela série D_d2..D_d8
+
+para o redesenho de mapas, CMercatorExtent pré-calcula a projeção de uma extensão em pixels
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import math
+
+# numpy
+import numpy as np
+
+import coord_defs as cdefs
+import pos_array as parr
+
+# < module data >----------------------------------------------------------------------------------
+
+# potências da excentricidade
+M_E2 = cdefs.D_e2
+M_E4 = M_E2 * M_E2
+M_E6 = M_E4 * M_E2
+M_E8 = M_E4 * M_E4
+
+# série da latitude conforme em função da geodésica: χ = φ + Σ b_k sin 2kφ
+M_B2 = -(M_E2 / 2. + 5. * M_E4 / 24. + 3. * M_E6 / 32. + 281. * M_E8 / 5760.)
+M_B4 = 5. * M_E4 / 48. + 7. * M_E6 / 80. + 697. * M_E8 / 11520.
+M_B6 = -(13. * M_E6 / 480. + 461. * M_E8 / 13440.)
+M_B8 = 1237. * M_E8 / 161280.
+
+# coeficientes de Horner em c = cos 2θ das séries Σ b_k sin 2kθ, usando sin 4θ = sin 2θ (2c),
+# sin 6θ = sin 2θ (4c² - 1) e sin 8θ = sin 2θ (8c³ - 4c)
+M_K_GEOD2CONF = (M_B2 - M_B6, 2. * M_B4 - 4. * M_B8, 4. * M_B6, 8. * M_B8)
+
+# série da latitude geodésica em função da conforme: φ = χ + Σ d_2k sin 2kχ
+M_K_CONF2GEOD = (cdefs.D_d2 - cdefs.D_d6, 2. * cdefs.D_d4 - 4. * cdefs.D_d8, 4. * cdefs.D_d6, 8. * cdefs.D_d8)
+
+# limite de nós da tabela de uma extensão
+M_MAX_NODES = 1 << 20
+
+# < class CMercatorExtent >------------------------------------------------------------------------
+
+class CMercatorExtent(object):
+    """
+    projeção de Mercator pré-calculada para uma extensão de mapa em pixels (origem no canto
+    superior esquerdo, y para baixo, mesma escala em x e y). A ordenada é interpolada linearmente
+    em uma tabela uniforme em latitude, com o passo escolhido para um erro máximo em pixels. Pontos
+    fora da faixa de latitudes usam a projeção exata
+    """
+    # ---------------------------------------------------------------------------------------------
+    def __init__(self, ff_lat_min, ff_lat_max, ff_lng_min, ff_lng_max, fi_width, fi_height, ff_tol_px=0.01):
+        """
+        constructor
+
+        @param ff_lat_min: latitude sul da extensão em graus
+        @param ff_lat_max: latitude norte da extensão em graus
+        @param ff_lng_min: longitude oeste da extensão em graus
+        @param ff_lng_max: longitude leste da extensão em graus (menor que a oeste se a extensão
+                           cruza o antimeridiano)
+        @param fi_width: largura do mapa em pixels
+        @param fi_height: altura do mapa em pixels
+        @param ff_tol_px: erro máximo da interpolação em pixels
+        """
+        # inicia a super classe
+        super(CMercatorExtent, self).__init__()
+
+        # check input
+        assert -90. < ff_lat_min < ff_lat_max < 90.
+        assert (fi_width > 0) and (fi_height > 0)
+        assert ff_tol_px > 0.
+
+        self.__f_lat_min = float(ff_lat_min)
+        self.__f_lat_max = float(ff_lat_max)
+        self.__f_lng_min = float(ff_lng_min)
+        self.__f_lng_max = float(ff_lng_max)
+
+        self.__i_width = int(fi_width)
+        self.__i_height = int(fi_height)
+
+        # largura em longitude (rad) e centro (graus)
+        lf_dlng = math.radians((ff_lng_max - ff_lng_min) % 360.) or 2. * math.pi
+        self.__f_lng_ctr = (ff_lng_min + math.degrees(lf_dlng) / 2. + 180.) % 360. - 180.
+
+        # latitudes isométricas dos limites
+        lf_psi_min = forward(ff_lat_min, 0.)[1] / cdefs.D_a
+        lf_psi_max = forward(ff_lat_max, 0.)[1] / cdefs.D_a
+
+        # escala (pixels por radiano): a extensão cabe no mapa
+        self.__f_scale = min(fi_width / lf_dlng, fi_height / (lf_psi_max - lf_psi_min))
+
+        self.__f_scale_deg = math.radians(self.__f_scale)
+
+        # deslocamentos (canto superior esquerdo): centro em graus e latitude isométrica norte
+        self.__f_x0 = math.degrees(lf_dlng) / 2.
+        self.__f_psi0 = lf_psi_max
+
+        # passo da tabela: erro da interpolação linear h² / 8 |y''|, com |ψ''| <= sec φ tan φ
+        lf_lat = math.radians(max(abs(ff_lat_min), abs(ff_lat_max)))
+        lf_d2 = self.__f_scale * max(math.tan(lf_lat) / math.cos(lf_lat), 1e-3)
+
+        li_num = int(math.ceil(math.radians(ff_lat_max - ff_lat_min) / math.sqrt(8. * ff_tol_px / lf_d2))) + 1
+        li_num = max(2, min(li_num, M_MAX_NODES))
+
+        # tabela da ordenada em pixels (nós uniformes em latitude)
+        la_lat = np.linspace(ff_lat_min, ff_lat_max, li_num)
+
+        self.__a_y = self.__y_px(forward_vec(la_lat, 0.)[1])
+        self.__a_dy = np.append(np.diff(self.__a_y), 0.)
+
+        # passo em graus
+        self.__f_step = (ff_lat_max - ff_lat_min) / (li_num - 1)
+
+    # ---------------------------------------------------------------------------------------------
+    def forward(self, fa_lat, fa_lng=None):
+        """
+        projeta posições em pixels
+
+        @param fa_lat: latitudes em graus ou CPosLatLngArray
+        @param fa_lng: longitudes em graus
+
+        @return arrays x e y em pixels
+        """
+        # container de posições ?
+        fa_lat, fa_lng, _ = parr.pos_cols(fa_lat, fa_lng)
+
+        la_lat = np.asarray(fa_lat, dtype=np.float64)
+
+        # longitude relativa ao centro em graus [-180, 180): com longitudes em [-180, 180], basta
+        # um deslocamento de 360 (mais barato que o resto da divisão)
+        la_dlng = np.asarray(fa_lng, dtype=np.float64) - self.__f_lng_ctr
+
+        lv_east = la_dlng >= 180.
+        lv_west = la_dlng < -180.
+
+        if lv_east.any() or lv_west.any():
+            la_dlng = la_dlng - 360. * lv_east + 360. * lv_west
+
+        # abscissa
+        la_x = (la_dlng + self.__f_x0) * self.__f_scale_deg
+
+        # ordenada interpolada
+        la_u = (la_lat - self.__f_lat_min) / self.__f_step
+
+        li_last = len(self.__a_y) - 1
+        lv_in = (0. <= la_u) & (la_u <= li_last)
+
+        la_i = np.minimum(np.where(lv_in, la_u, 0.).astype(np.intp), li_last)
+
+        la_y = self.__a_y[la_i] + (la_u - la_i) * self.__a_dy[la_i]
+
+        # fora da faixa: projeção exata
+        if not lv_in.all():
+            la_y = np.where(lv_in, la_y, self.__y_px(forward_vec(la_lat, 0.)[1]))
+
+        # return
+        return la_x, la_y
+
+    # ---------------------------------------------------------------------------------------------
+    def inverse(self, fa_x, fa_y):
+        """
+        posições geográficas a partir de pixels (projeção inversa exata)
+
+        @param fa_x: abscissas em pixels
+        @param fa_y: ordenadas em pixels
+
+        @return arrays de latitude e longitude em graus
+        """
+        la_x = np.asarray(fa_x, dtype=np.float64)
+        la_y = np.asarray(fa_y, dtype=np.float64)
+
+        # coordenadas da projeção (m)
+        la_mx = (la_x / self.__f_scale_deg - self.__f_x0) * cdefs.D_a * math.pi / 180.
+        la_my = (self.__f_psi0 - la_y / self.__f_scale) * cdefs.D_a
+
+        # return
+        return inverse_vec(la_mx, la_my, self.__f_lng_ctr)
+
+    # ---------------------------------------------------------------------------------------------
+    def __y_px(self, fa_my):
+        """
+        ordenada em pixels a partir da ordenada da projeção (m)
+        """
+        return (self.__f_psi0 - fa_my / cdefs.D_a) * self.__f_scale
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def f_lat_max(self):
+        """
+        get latitude norte da extensão
+        """
+        return self.__f_lat_max
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def f_lat_min(self):
+        """
+        get latitude sul da extensão
+        """
+        return self.__f_lat_min
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def f_lng_max(self):
+        """
+        get longitude leste da extensão
+        """
+        return self.__f_lng_max
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def f_lng_min(self):
+        """
+        get longitude oeste da extensão
+        """
+        return self.__f_lng_min
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def f_scale(self):
+        """
+        get escala em pixels por radiano
+        """
+        return self.__f_scale
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def i_height(self):
+        """
+        get altura do mapa em pixels
+        """
+        return self.__i_height
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def i_nodes(self):
+        """
+        get número de nós da tabela
+        """
+        return len(self.__a_y)
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def i_width(self):
+        """
+        get largura do mapa em pixels
+        """
+        return self.__i_width
+
+# -------------------------------------------------------------------------------------------------
+def conf2geod(ff_chi):
+    """
+    latitude geodésica a partir da conforme (série D_d2..D_d8)
+
+    @param ff_chi: latitude conforme em graus
+
+    @return latitude geodésica em graus
+    """
+    lf_chi = math.radians(ff_chi)
+
+    # return
+    return math.degrees(lf_chi + __series(M_K_CONF2GEOD, math.sin(2. * lf_chi), math.cos(2. * lf_chi)))
+
+# -------------------------------------------------------------------------------------------------
+def conf2geod_vec(fa_chi):
+    """
+    versão vetorizada de conf2geod
+
+    @param fa_chi: latitudes conformes em graus
+
+    @return array de latitudes geodésicas em graus
+    """
+    la_chi = np.radians(np.asarray(fa_chi, dtype=np.float64))
+
+    # return
+    return np.degrees(la_chi + __series(M_K_CONF2GEOD, np.sin(2. * la_chi), np.cos(2. * la_chi)))
+
+# -------------------------------------------------------------------------------------------------
+def forward(ff_lat, ff_lng, ff_lng0=0.):
+    """
+    projeção de Mercator
+
+    @param ff_lat: latitude em graus
+    @param ff_lng: longitude em graus
+    @param ff_lng0: meridiano central em graus
+
+    @return x e y em metros (±inf nos pólos)
+    """
+    # check input
+    assert  -90. <= ff_lat <= 90.
+    assert -180. <= ff_lng <= 180.
+
+    lf_lat = math.radians(ff_lat)
+
+    # latitude conforme
+    lf_chi = lf_lat + __series(M_K_GEOD2CONF, math.sin(2. * lf_lat), math.cos(2. * lf_lat))
+    lf_sin = math.sin(lf_chi)
+
+    # latitude isométrica
+    lf_psi = math.atanh(lf_sin) if abs(lf_sin) < 1. else math.copysign(math.inf, ff_lat)
+
+    # longitude relativa ao meridiano central [-π, π)
+    lf_dlng = (math.radians(ff_lng - ff_lng0) + math.pi) % (2. * math.pi) - math.pi
+
+    # return
+    return cdefs.D_a * lf_dlng, cdefs.D_a * lf_psi
+
+# -------------------------------------------------------------------------------------------------
+def forward_vec(fa_lat, fa_lng=None, ff_lng0=0.):
+    """
+    versão vetorizada de forward
+
+    @param fa_lat: latitudes em graus ou CPosLatLngArray
+    @param fa_lng: longitudes em graus
+    @param ff_lng0: meridiano central em graus
+
+    @return arrays x e y em metros
+    """
+    # container de posições ?
+    fa_lat, fa_lng, _ = parr.pos_cols(fa_lat, fa_lng)
+
+    la_lat = np.radians(np.asarray(fa_lat, dtype=np.float64))
+    la_lng = np.radians(np.asarray(fa_lng, dtype=np.float64))
+
+    # latitude conforme
+    la_chi = la_lat + __series(M_K_GEOD2CONF, np.sin(2. * la_lat), np.cos(2. * la_lat))
+
+    # latitude isométrica (±inf nos pólos)
+    with np.errstate(divide="ignore"):
+        la_psi = np.where(np.abs(la_lat) >= np.pi / 2., np.copysign(np.inf, la_lat),
+                          np.arctanh(np.clip(np.sin(la_chi), -1., 1.)))
+
+    # longitude relativa ao meridiano central [-π, π)
+    la_dlng = (la_lng - math.radians(ff_lng0) + np.pi) % (2. * np.pi) - np.pi
+
+    # return
+    return cdefs.D_a * la_dlng, cdefs.D_a * la_psi
+
+# -------------------------------------------------------------------------------------------------
+def geod2conf(ff_lat):
+    """
+    latitude conforme a partir da geodésica
+
+    @param ff_lat: latitude geodésica em graus
+
+    @return latitude conforme em graus
+    """
+    lf_lat = math.radians(ff_lat)
+
+    # return
+    return math.degrees(lf_lat + __series(M_K_GEOD2CONF, math.sin(2. * lf_lat), math.cos(2. * lf_lat)))
+
+# -------------------------------------------------------------------------------------------------
+def geod2conf_vec(fa_lat):
+    """
+    versão vetorizada de geod2conf
+
+    @param fa_lat: latitudes geodésicas em graus
+
+    @return array de latitudes conformes em graus
+    """
+    la_lat = np.radians(np.asarray(fa_lat, dtype=np.float64))
+
+    # return
+    return np.degrees(la_lat + __series(M_K_GEOD2CONF, np.sin(2. * la_lat), np.cos(2. * la_lat)))
+
+# -------------------------------------------------------------------------------------------------
+def inverse(ff_x, ff_y, ff_lng0=0.):
+    """
+    projeção de Mercator inversa (não iterativa)
+
+    @param ff_x: abscissa em metros
+    @param ff_y: ordenada em metros
+    @param ff_lng0: meridiano central em graus
+
+    @return latitude e longitude em graus
+    """
+    # latitude conforme: sin χ = tanh ψ, cos χ = sech ψ
+    lf_tanh = math.tanh(ff_y / cdefs.D_a)
+    lf_sech = math.sqrt(1. - lf_tanh * lf_tanh)
+
+    lf_chi = math.atan2(lf_tanh, lf_sech)
+
+    # latitude geodésica (sin 2χ e cos 2χ sem funções trigonométricas)
+    lf_lat = lf_chi + __series(M_K_CONF2GEOD, 2. * lf_tanh * lf_sech, 1. - 2. * lf_tanh * lf_tanh)
+
+    # longitude [-180, 180)
+    lf_lng = (math.radians(ff_lng0) + ff_x / cdefs.D_a + math.pi) % (2. * math.pi) - math.pi
+
+    # return
+    return math.degrees(lf_lat), math.degrees(lf_lng)
+
+# -------------------------------------------------------------------------------------------------
+def inverse_vec(fa_x, fa_y, ff_lng0=0.):
+    """
+    versão vetorizada de inverse
+
+    @param fa_x: abscissas em metros
+    @param fa_y: ordenadas em metros
+    @param ff_lng0: meridiano central em graus
+
+    @return arrays de latitude e longitude em graus
+    """
+    la_x = np.asarray(fa_x, dtype=np.float64)
+    la_y = np.asarray(fa_y, dtype=np.float64)
+
+    # latitude conforme: sin χ = tanh ψ, cos χ = sech ψ
+    la_tanh = np.tanh(la_y / cdefs.D_a)
+    la_sech = np.sqrt(1. - la_tanh * la_tanh)
+
+    la_chi = np.arctan2(la_tanh, la_sech)
+
+    # latitude geodésica (sin 2χ e cos 2χ sem funções trigonométricas)
+    la_lat = la_chi + __series(M_K_CONF2GEOD, 2. * la_tanh * la_sech, 1. - 2. * la_tanh * la_tanh)
+
+    # longitude [-180, 180)
+    la_lng = (math.radians(ff_lng0) + la_x / cdefs.D_a + np.pi) % (2. * np.pi) - np.pi
+
+    # return
+    return np.degrees(la_lat), np.degrees(la_lng)
+
+# -------------------------------------------------------------------------------------------------
+def __series(ft_k, f_sin2, f_cos2):
+    """
+    avalia uma série Σ b_k sin 2kθ a partir de sin 2θ e cos 2θ (esquema de Horner em cos 2θ)
+
+    @param ft_k: coeficientes de Horner (M_K_GEOD2CONF ou M_K_CONF2GEOD)
+    @param f_sin2: sin 2θ (escalar ou array)
+    @param f_cos2: cos 2θ (escalar ou array)
+
+    @return soma da série
+    """
+    lf_k0, lf_k1, lf_k2, lf_k3 = ft_k
+
+    # return
+    return f_sin2 * (lf_k0 + f_cos2 * (lf_k1 + f_cos2 * (lf_k2 + f_cos2 * lf_k3)))
+
+# < the end >--------------------------------------------------------------------------------------
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+coord_ref
+
+referencial (imutável) de um sistema de coordenadas, com os termos da referência pré-calculados
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import collections
+import math
+
+import coord_defs as cdefs
+
+# < module data >----------------------------------------------------------------------------------
+
+# campos do referencial (tupla imutável, acesso rápido aos atributos)
+M_NT_REF_FRAME = collections.namedtuple("CReferenceFrameBase",
+                                        "f_lat f_lng f_dcl_mag f_sin_lng f_cos_lng t_unit f_dcl_cos f_dcl_sin "
+                                        "f_cnv_gr2m f_cnv_m2gr")
+
+# < class CReferenceFrame >------------------------------------------------------------------------
+
+class CReferenceFrame(M_NT_REF_FRAME):
+    """
+    referencial de um sistema de coordenadas. Guarda a trigonometria da referência, o seu vetor
+    unitário, a rotação da declinação magnética e os fatores de escala do plano (x, y), calculados
+    uma única vez na criação do objeto. É uma tupla: uma nova referência exige um novo objeto
+
+    as conversões que usam o referencial são esféricas ou planas; a origem ECEF não é guardada
+    (as conversões ECEF / ENU usam coord_frame.CLocalFrame, que mantém a sua própria origem)
+
+    f_lat, f_lng: coordenadas da referência em graus
+    f_dcl_mag: declinação magnética em graus
+    f_sin_lng, f_cos_lng: sin e cos da lng da referência
+    t_unit: vetor unitário da referência (esfera)
+    f_dcl_cos, f_dcl_sin: rotação da declinação magnética
+    f_cnv_gr2m, f_cnv_m2gr: fatores de escala graus -> metros e metros -> graus (geo2xyz_3 /
+                            xyz2geo_3)
+    """
+    # atributos (sem dicionário por instância)
+    __slots__ = ()
+
+    # ---------------------------------------------------------------------------------------------
+    def __new__(cls, ff_ref_lat=cdefs.M_REF_LAT, ff_ref_lng=cdefs.M_REF_LNG, ff_dcl_mag=cdefs.M_DCL_MAG):
+        """
+        constructor
+
+        @param ff_ref_lat: latitude da referência em graus
+        @param ff_ref_lng: longitude da referência em graus
+        @param ff_dcl_mag: declinação magnética em graus
+        """
+        # check input
+        assert  -90. <= ff_ref_lat <= 90.
+        assert -180. <= ff_ref_lng <= 180.
+
+        # converte para radianos
+        lf_lat = math.radians(ff_ref_lat)
+        lf_lng = math.radians(ff_ref_lng)
+
+        # sin e cos da lat/lng da referência
+        lf_sin_lat = math.sin(lf_lat)
+        lf_cos_lat = math.cos(lf_lat)
+        lf_sin_lng = math.sin(lf_lng)
+        lf_cos_lng = math.cos(lf_lng)
+
+        # rotação da declinação magnética
+        lf_dcl = math.radians(ff_dcl_mag)
+
+        # return
+        return super(CReferenceFrame, cls).__new__(cls, float(ff_ref_lat), float(ff_ref_lng), float(ff_dcl_mag),
+                                                   lf_sin_lng, lf_cos_lng,
+                                                   (lf_cos_lat * lf_cos_lng, lf_cos_lat * lf_sin_lng, lf_sin_lat),
+                                                   math.cos(lf_dcl), math.sin(lf_dcl),
+                                                   cdefs.D_CNV_GR2M, 1. / cdefs.D_CNV_GR2M)
+
+    # ---------------------------------------------------------------------------------------------
+    def __getnewargs__(self):
+        """
+        argumentos do constructor (pickle)
+        """
+        return self.f_lat, self.f_lng, self.f_dcl_mag
+
+    # ---------------------------------------------------------------------------------------------
+    def __repr__(self):
+        """
+        representação do referencial
+        """
+        return "CReferenceFrame({}, {}, {})".format(self.f_lat, self.f_lng, self.f_dcl_mag)
+
+    # ---------------------------------------------------------------------------------------------
+    @classmethod
+    def from_model(cls, f_model):
+        """
+        cria o referencial de um sistema de coordenadas
+
+        @param f_model: sistema de coordenadas (CCoordModel)
+
+        @return referencial
+        """
+        return cls(f_model.f_ref_lat, f_model.f_ref_lng, f_model.f_dcl_mag)
+
+    # ---------------------------------------------------------------------------------------------
+    def matches(self, ff_ref_lat, ff_ref_lng, ff_dcl_mag):
+        """
+        verifica se o referencial corresponde à referência e declinação dadas
+
+        @return True se corresponde, senão False
+        """
+        return (self.f_lat == ff_ref_lat) and (self.f_lng == ff_ref_lng) and (self.f_dcl_mag == ff_dcl_mag)
+
+# < the end >--------------------------------------------------------------------------------------
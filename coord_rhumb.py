@@ -0,0 +1,659 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+coord_rhumb
+
+navegação por loxodromia (rhumb line) no elipsóide WGS84: distância, rumo, destino e partes
+meridionais, com a distância meridional calculada pela série de coord_defs (D_A0a..D_A6a)
+
+    M(φ) = A0a φ - A2a sin 2φ + A4a sin 4φ - A6a sin 6φ
+
+distâncias em NM, rumos verdadeiros em graus [0, 360), partes meridionais em minutos de arco
+(como nas tábuas náuticas)
+
+as versões escalares calculam os termos de latitude (partes meridionais e distância meridional)
+diretamente. As versões em lote aceitam uma tabela pré-calculada para uma faixa de latitudes
+(CRhumbTable)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import math
+
+# numpy
+import numpy as np
+
+import coord_defs as cdefs
+
+# < module data >----------------------------------------------------------------------------------
+
+# distância meridional do equador ao pólo (m)
+M_MER_QUAD = cdefs.D_A0a * math.pi / 2.
+
+# radianos -> minutos de arco
+M_RAD2MIN = 60. * 180. / math.pi
+
+# abaixo desta diferença de partes meridionais (rad), q = ΔM / Δψ é substituído pelo raio do
+# paralelo (erro relativo O(Δφ²))
+M_EPS_PSI = 1e-6
+
+# iterações de Newton da latitude a partir da distância meridional (convergência quadrática a
+# partir de M / A0a: 3e-3, 6e-6, 4e-11, < 1e-16)
+M_MER_ITER = 4
+
+# < class CRhumbTable >----------------------------------------------------------------------------
+
+class CRhumbTable(object):
+    """
+    tabela das partes meridionais, da distância meridional e da latitude em função da distância
+    meridional para uma faixa de latitudes, com interpolação cúbica de Hermite (as derivadas são analíticas). Pontos fora da
+    faixa usam as fórmulas exatas
+    """
+    # ---------------------------------------------------------------------------------------------
+    def __init__(self, ff_lat_min=-85., ff_lat_max=85., ff_step=0.05):
+        """
+        constructor
+
+        @param ff_lat_min: latitude mínima da faixa em graus
+        @param ff_lat_max: latitude máxima da faixa em graus
+        @param ff_step: passo da tabela em graus (0.05: erro < 1e-12 rad até 60°, ~1e-9 rad a 85°)
+        """
+        # inicia a super classe
+        super(CRhumbTable, self).__init__()
+
+        # check input
+        assert -90. < ff_lat_min < ff_lat_max < 90.
+        assert ff_step > 0.
+
+        self.__f_lat_min = float(ff_lat_min)
+        self.__f_lat_max = float(ff_lat_max)
+
+        # partes meridionais e distância meridional: nós uniformes em latitude
+        li_num = int(math.ceil((ff_lat_max - ff_lat_min) / ff_step)) + 1
+
+        la_lat = np.linspace(ff_lat_min, ff_lat_max, li_num)
+        la_psi, la_mer = lat_terms_vec(la_lat)
+
+        la_lat = np.radians(la_lat)
+        la_sin = np.sin(la_lat)
+        la_w = 1. - cdefs.D_e2 * la_sin * la_sin
+
+        # dψ/dφ = (1 - e²) / ((1 - e² sin²φ) cos φ) e dM/dφ = ρ
+        self.__t_terms = self.__coefs(la_lat, np.stack((la_psi, la_mer), axis=-1),
+                                      np.stack(((1. - cdefs.D_e2) / (la_w * np.cos(la_lat)),
+                                                cdefs.D_a * (1. - cdefs.D_e2) / la_w ** 1.5), axis=-1))
+
+        # latitude: nós uniformes em distância meridional
+        la_mer = np.linspace(la_mer[0], la_mer[-1], li_num)
+        la_lat = np.radians(meridian_lat_vec(la_mer * cdefs.D_CNV_M2NM))
+        la_sin = np.sin(la_lat)
+
+        # dφ/dM = 1 / ρ
+        self.__t_lat = self.__coefs(la_mer, la_lat, (1. - cdefs.D_e2 * la_sin * la_sin) ** 1.5 / (cdefs.D_a * (1. - cdefs.D_e2)))
+
+        self.__f_mer_min = float(la_mer[0])
+        self.__f_mer_max = float(la_mer[-1])
+
+    # ---------------------------------------------------------------------------------------------
+    @staticmethod
+    def __coefs(fa_x, fa_y, fa_dy):
+        """
+        coeficientes dos polinômios cúbicos de Hermite em cada intervalo de nós uniformes
+
+        @return origem, passo e coeficientes (intervalos x 4 [x valores], em potências de t)
+        """
+        lf_h = float(fa_x[1] - fa_x[0])
+
+        la_y0, la_y1 = fa_y[:-1], fa_y[1:]
+        la_d0, la_d1 = fa_dy[:-1] * lf_h, fa_dy[1:] * lf_h
+
+        la_c = np.empty((len(la_y0), 4) + la_y0.shape[1:], dtype=np.float64)
+
+        la_c[:, 0] = la_y0
+        la_c[:, 1] = la_d0
+        la_c[:, 2] = 3. * (la_y1 - la_y0) - 2. * la_d0 - la_d1
+        la_c[:, 3] = 2. * (la_y0 - la_y1) + la_d0 + la_d1
+
+        # return
+        return float(fa_x[0]), lf_h, la_c
+
+    # ---------------------------------------------------------------------------------------------
+    @staticmethod
+    def __eval(ft_coef, fa_x):
+        """
+        avalia os polinômios de Hermite (os pontos devem estar na faixa da tabela)
+
+        @return array com a forma dos pontos [x valores]
+        """
+        lf_x0, lf_h, la_c = ft_coef
+
+        la_u = (np.ravel(fa_x) - lf_x0) / lf_h
+
+        la_i = np.clip(la_u.astype(np.intp), 0, len(la_c) - 1)
+        la_t = (la_u - la_i).reshape((-1,) + (1,) * (la_c.ndim - 2))
+
+        la_c = la_c[la_i]
+
+        la_y = la_c[:, 0] + la_t * (la_c[:, 1] + la_t * (la_c[:, 2] + la_t * la_c[:, 3]))
+
+        # return
+        return la_y.reshape(np.shape(fa_x) + la_y.shape[1:])
+
+    # ---------------------------------------------------------------------------------------------
+    def lat(self, fa_mer):
+        """
+        latitudes a partir das distâncias meridionais
+
+        @param fa_mer: distâncias meridionais em metros
+
+        @return array de latitudes em radianos (NaN além dos pólos)
+        """
+        la_mer = np.asarray(fa_mer, dtype=np.float64)
+
+        # na faixa ?
+        lv_in = (self.__f_mer_min <= la_mer) & (la_mer <= self.__f_mer_max)
+
+        if lv_in.all():
+            return self.__eval(self.__t_lat, la_mer)
+
+        # return
+        return np.where(lv_in, self.__eval(self.__t_lat, np.where(lv_in, la_mer, self.__f_mer_min)),
+                        np.radians(meridian_lat_vec(la_mer * cdefs.D_CNV_M2NM)))
+
+    # ---------------------------------------------------------------------------------------------
+    def terms(self, fa_lat):
+        """
+        partes meridionais (latitude isométrica) e distâncias meridionais
+
+        @param fa_lat: latitudes em radianos
+
+        @return arrays de partes meridionais em radianos e distâncias meridionais em metros
+        """
+        la_lat = np.asarray(fa_lat, dtype=np.float64)
+
+        lf_min = math.radians(self.__f_lat_min)
+        lf_max = math.radians(self.__f_lat_max)
+
+        # na faixa ?
+        lv_in = (lf_min <= la_lat) & (la_lat <= lf_max)
+
+        if lv_in.all():
+            la_y = self.__eval(self.__t_terms, la_lat)
+
+            # return
+            return la_y[..., 0], la_y[..., 1]
+
+        la_y = self.__eval(self.__t_terms, np.where(lv_in, la_lat, lf_min))
+        la_psi, la_mer = lat_terms_vec(np.degrees(la_lat))
+
+        # return
+        return np.where(lv_in, la_y[..., 0], la_psi), np.where(lv_in, la_y[..., 1], la_mer)
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def f_lat_max(self):
+        """
+        get latitude máxima da faixa
+        """
+        return self.__f_lat_max
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def f_lat_min(self):
+        """
+        get latitude mínima da faixa
+        """
+        return self.__f_lat_min
+
+# -------------------------------------------------------------------------------------------------
+def course(ff_lat1, ff_lng1, ff_lat2, ff_lng2):
+    """
+    rumo da loxodromia entre dois pontos
+
+    @return rumo verdadeiro em graus
+    """
+    return inverse(ff_lat1, ff_lng1, ff_lat2, ff_lng2)[1]
+
+# -------------------------------------------------------------------------------------------------
+def course_vec(fa_lat1, fa_lng1, fa_lat2, fa_lng2, f_tab=None):
+    """
+    versão vetorizada de course
+
+    @return array de rumos verdadeiros em graus
+    """
+    return inverse_vec(fa_lat1, fa_lng1, fa_lat2, fa_lng2, f_tab)[1]
+
+# -------------------------------------------------------------------------------------------------
+def destination(ff_lat, ff_lng, ff_crs, ff_dst):
+    """
+    destino ao longo de uma loxodromia
+
+    @param ff_lat: latitude da origem em graus
+    @param ff_lng: longitude da origem em graus
+    @param ff_crs: rumo verdadeiro em graus
+    @param ff_dst: distância em NM
+
+    @return latitude e longitude do destino em graus (NaN se a loxodromia passa do pólo)
+    """
+    # check input
+    assert  -90. <= ff_lat <= 90.
+    assert -180. <= ff_lng <= 180.
+
+    lf_crs = math.radians(ff_crs)
+    lf_s = ff_dst * cdefs.D_CNV_NM2M
+
+    lf_psi1, lf_mer1 = lat_terms(ff_lat)
+
+    # distância meridional do destino
+    lf_dmer = lf_s * math.cos(lf_crs)
+    lf_mer2 = lf_mer1 + lf_dmer
+
+    # passa do pólo ?
+    if abs(lf_mer2) > M_MER_QUAD:
+        return math.nan, math.nan
+
+    lf_lat2 = meridian_lat(lf_mer2 * cdefs.D_CNV_M2NM)
+
+    lf_psi2, _ = lat_terms(lf_lat2)
+    lf_dpsi = lf_psi2 - lf_psi1
+
+    # destino no pólo ?
+    if math.isinf(lf_dpsi):
+        return lf_lat2, ff_lng
+
+    # q = ΔM / Δψ (ou o raio do paralelo)
+    if abs(lf_dpsi) > M_EPS_PSI:
+        lf_q = lf_dmer / lf_dpsi
+
+    else:
+        lf_q = __nu_cos(math.radians((ff_lat + lf_lat2) / 2.))
+
+    # diferença de longitude
+    lf_dlng = lf_s * math.sin(lf_crs) / lf_q
+
+    # return
+    return lf_lat2, math.degrees((math.radians(ff_lng) + lf_dlng + math.pi) % (2. * math.pi) - math.pi)
+
+# -------------------------------------------------------------------------------------------------
+def destination_vec(fa_lat, fa_lng, fa_crs, fa_dst, f_tab=None):
+    """
+    versão vetorizada de destination. As entradas são combinadas por broadcast
+
+    @param f_tab: tabela pré-calculada (CRhumbTable)
+
+    @return arrays de latitude e longitude dos destinos em graus (NaN se a loxodromia passa do
+            pólo)
+    """
+    la_lat1 = np.radians(np.asarray(fa_lat, dtype=np.float64))
+    la_lng1 = np.radians(np.asarray(fa_lng, dtype=np.float64))
+    la_crs = np.radians(np.asarray(fa_crs, dtype=np.float64))
+    la_s = np.asarray(fa_dst, dtype=np.float64) * cdefs.D_CNV_NM2M
+
+    la_lat1, la_lng1, la_crs, la_s = np.broadcast_arrays(la_lat1, la_lng1, la_crs, la_s)
+
+    # termos da origem
+    la_psi1, la_mer1 = f_tab.terms(la_lat1) if f_tab is not None else (__psi_vec(la_lat1), __mer_vec(la_lat1))
+
+    # distância meridional do destino
+    la_dmer = la_s * np.cos(la_crs)
+    la_mer2 = la_mer1 + la_dmer
+
+    # passa do pólo ?
+    la_mer2 = np.where(np.abs(la_mer2) > M_MER_QUAD, np.nan, la_mer2)
+
+    # latitude e partes meridionais do destino
+    if f_tab is not None:
+        la_lat2 = f_tab.lat(la_mer2)
+        la_psi2 = f_tab.terms(la_lat2)[0]
+
+    else:
+        la_lat2 = __lat_from_mer_vec(la_mer2)
+        la_psi2 = __psi_vec(la_lat2)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # origem e destino no mesmo pólo: Δψ = NaN
+        la_dpsi = la_psi2 - la_psi1
+
+        # q = ΔM / Δψ (ou o raio do paralelo)
+        la_q = np.where(np.abs(la_dpsi) > M_EPS_PSI, la_dmer / la_dpsi, __nu_cos_vec((la_lat1 + la_lat2) / 2.))
+
+        # diferença de longitude (nula se o destino é um pólo)
+        la_dlng = np.where(np.isinf(la_dpsi), 0., la_s * np.sin(la_crs) / la_q)
+
+    la_lng2 = (la_lng1 + la_dlng + np.pi) % (2. * np.pi) - np.pi
+
+    # return
+    return np.degrees(la_lat2), np.degrees(la_lng2)
+
+# -------------------------------------------------------------------------------------------------
+def distance(ff_lat1, ff_lng1, ff_lat2, ff_lng2):
+    """
+    distância ao longo da loxodromia entre dois pontos
+
+    @return distância em NM
+    """
+    return inverse(ff_lat1, ff_lng1, ff_lat2, ff_lng2)[0]
+
+# -------------------------------------------------------------------------------------------------
+def distance_vec(fa_lat1, fa_lng1, fa_lat2, fa_lng2, f_tab=None):
+    """
+    versão vetorizada de distance
+
+    @return array de distâncias em NM
+    """
+    return inverse_vec(fa_lat1, fa_lng1, fa_lat2, fa_lng2, f_tab)[0]
+
+# -------------------------------------------------------------------------------------------------
+def inverse(ff_lat1, ff_lng1, ff_lat2, ff_lng2):
+    """
+    distância e rumo da loxodromia entre dois pontos (pelo menor arco de longitude)
+
+    @return distância em NM e rumo verdadeiro em graus
+    """
+    # check input
+    assert  -90. <= ff_lat1 <= 90.
+    assert -180. <= ff_lng1 <= 180.
+
+    assert  -90. <= ff_lat2 <= 90.
+    assert -180. <= ff_lng2 <= 180.
+
+    lf_psi1, lf_mer1 = lat_terms(ff_lat1)
+    lf_psi2, lf_mer2 = lat_terms(ff_lat2)
+
+    lf_dmer = lf_mer2 - lf_mer1
+
+    # diferença de longitude [-π, π)
+    lf_dlng = (math.radians(ff_lng2 - ff_lng1) + math.pi) % (2. * math.pi) - math.pi
+
+    # algum ponto no pólo ? (meridiano)
+    if math.isinf(lf_psi1) or math.isinf(lf_psi2):
+        return abs(lf_dmer) * cdefs.D_CNV_M2NM, 0. if lf_dmer >= 0. else 180.
+
+    lf_dpsi = lf_psi2 - lf_psi1
+
+    # q = ΔM / Δψ (ou o raio do paralelo)
+    if abs(lf_dpsi) > M_EPS_PSI:
+        lf_q = lf_dmer / lf_dpsi
+
+    else:
+        lf_q = __nu_cos(math.radians((ff_lat1 + ff_lat2) / 2.))
+
+    # return
+    return math.hypot(lf_dlng, lf_dpsi) * lf_q * cdefs.D_CNV_M2NM, math.degrees(math.atan2(lf_dlng, lf_dpsi)) % 360.
+
+# -------------------------------------------------------------------------------------------------
+def inverse_vec(fa_lat1, fa_lng1, fa_lat2, fa_lng2, f_tab=None):
+    """
+    versão vetorizada de inverse. As entradas são combinadas por broadcast
+
+    @param f_tab: tabela pré-calculada (CRhumbTable)
+
+    @return arrays de distância em NM e rumo verdadeiro em graus
+    """
+    la_lat1 = np.radians(np.asarray(fa_lat1, dtype=np.float64))
+    la_lat2 = np.radians(np.asarray(fa_lat2, dtype=np.float64))
+
+    # diferença de longitude [-π, π)
+    la_dlng = (np.radians(np.asarray(fa_lng2, dtype=np.float64) - np.asarray(fa_lng1, dtype=np.float64)) + np.pi) % (2. * np.pi) - np.pi
+
+    # partes meridionais e distâncias meridionais
+    if f_tab is not None:
+        la_psi1, la_mer1 = f_tab.terms(la_lat1)
+        la_psi2, la_mer2 = f_tab.terms(la_lat2)
+
+    else:
+        la_psi1, la_mer1 = __psi_vec(la_lat1), __mer_vec(la_lat1)
+        la_psi2, la_mer2 = __psi_vec(la_lat2), __mer_vec(la_lat2)
+
+    la_dmer = la_mer2 - la_mer1
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # pontos no mesmo pólo: Δψ = NaN
+        la_dpsi = la_psi2 - la_psi1
+
+        # q = ΔM / Δψ (ou o raio do paralelo)
+        la_q = np.where(np.abs(la_dpsi) > M_EPS_PSI, la_dmer / la_dpsi, __nu_cos_vec((la_lat1 + la_lat2) / 2.))
+
+        la_dst = np.hypot(la_dlng, la_dpsi) * la_q
+
+    la_crs = np.degrees(np.arctan2(la_dlng, la_dpsi)) % 360.
+
+    # algum ponto no pólo ? (meridiano)
+    lv_pole = ~np.isfinite(la_dpsi)
+
+    if lv_pole.any():
+        la_dst = np.where(lv_pole, np.abs(la_dmer), la_dst)
+        la_crs = np.where(lv_pole, np.where(la_dmer >= 0., 0., 180.), la_crs)
+
+    # return
+    return la_dst * cdefs.D_CNV_M2NM, la_crs
+
+# -------------------------------------------------------------------------------------------------
+def __lat_from_mer_vec(fa_mer):
+    """
+    latitudes em radianos a partir das distâncias meridionais em metros (Newton)
+    """
+    la_mer = np.asarray(fa_mer, dtype=np.float64)
+    la_lat = la_mer / cdefs.D_A0a
+
+    for _ in range(M_MER_ITER):
+        la_lat = la_lat - (__mer_vec(la_lat) - la_mer) / __rho_vec(la_lat)
+
+    # return
+    return la_lat
+
+# -------------------------------------------------------------------------------------------------
+def lat_terms(ff_lat):
+    """
+    partes meridionais e distância meridional de uma latitude
+
+    @param ff_lat: latitude em graus
+
+    @return partes meridionais em radianos (±inf nos pólos) e distância meridional em metros
+    """
+    lf_lat = math.radians(ff_lat)
+
+    lf_sin = math.sin(lf_lat)
+
+    # partes meridionais (latitude isométrica)
+    if abs(lf_sin) < 1.:
+        lf_psi = math.atanh(lf_sin) - cdefs.D_e * math.atanh(cdefs.D_e * lf_sin)
+
+    # pólo
+    else:
+        lf_psi = math.copysign(math.inf, lf_lat)
+
+    # distância meridional
+    lf_mer = (cdefs.D_A0a * lf_lat - cdefs.D_A2a * math.sin(2. * lf_lat) +
+              cdefs.D_A4a * math.sin(4. * lf_lat) - cdefs.D_A6a * math.sin(6. * lf_lat))
+
+    # return
+    return lf_psi, lf_mer
+
+# -------------------------------------------------------------------------------------------------
+def lat_terms_vec(fa_lat):
+    """
+    versão vetorizada de lat_terms
+
+    @param fa_lat: latitudes em graus
+
+    @return arrays de partes meridionais em radianos e distância meridional em metros
+    """
+    la_lat = np.radians(np.asarray(fa_lat, dtype=np.float64))
+
+    # return
+    return __psi_vec(la_lat), __mer_vec(la_lat)
+
+# -------------------------------------------------------------------------------------------------
+def __mer_vec(fa_lat):
+    """
+    distâncias meridionais em metros a partir das latitudes em radianos
+    """
+    return (cdefs.D_A0a * fa_lat - cdefs.D_A2a * np.sin(2. * fa_lat) +
+            cdefs.D_A4a * np.sin(4. * fa_lat) - cdefs.D_A6a * np.sin(6. * fa_lat))
+
+# -------------------------------------------------------------------------------------------------
+def meridian_dist(ff_lat):
+    """
+    distância meridional do equador à latitude
+
+    @param ff_lat: latitude em graus
+
+    @return distância em NM (negativa no hemisfério sul)
+    """
+    return lat_terms(ff_lat)[1] * cdefs.D_CNV_M2NM
+
+# -------------------------------------------------------------------------------------------------
+def meridian_dist_vec(fa_lat):
+    """
+    versão vetorizada de meridian_dist
+
+    @param fa_lat: latitudes em graus
+
+    @return array de distâncias em NM
+    """
+    return __mer_vec(np.radians(np.asarray(fa_lat, dtype=np.float64))) * cdefs.D_CNV_M2NM
+
+# -------------------------------------------------------------------------------------------------
+def meridian_lat(ff_mer):
+    """
+    latitude a partir da distância meridional (inversa de meridian_dist)
+
+    @param ff_mer: distância meridional em NM
+
+    @return latitude em graus
+    """
+    lf_mer = ff_mer * cdefs.D_CNV_NM2M
+
+    # check input
+    assert abs(lf_mer) <= M_MER_QUAD * (1. + 1e-12)
+
+    lf_lat = lf_mer / cdefs.D_A0a
+
+    for _ in range(M_MER_ITER):
+        lf_sin = math.sin(lf_lat)
+
+        # raio de curvatura do meridiano
+        lf_rho = cdefs.D_a * (1. - cdefs.D_e2) / (1. - cdefs.D_e2 * lf_sin * lf_sin) ** 1.5
+
+        lf_lat -= (cdefs.D_A0a * lf_lat - cdefs.D_A2a * math.sin(2. * lf_lat) +
+                   cdefs.D_A4a * math.sin(4. * lf_lat) - cdefs.D_A6a * math.sin(6. * lf_lat) - lf_mer) / lf_rho
+
+    # return
+    return max(-90., min(90., math.degrees(lf_lat)))
+
+# -------------------------------------------------------------------------------------------------
+def meridian_lat_vec(fa_mer):
+    """
+    versão vetorizada de meridian_lat
+
+    @param fa_mer: distâncias meridionais em NM
+
+    @return array de latitudes em graus (NaN além dos pólos)
+    """
+    la_mer = np.asarray(fa_mer, dtype=np.float64) * cdefs.D_CNV_NM2M
+
+    # além dos pólos ?
+    la_mer = np.where(np.abs(la_mer) > M_MER_QUAD * (1. + 1e-12), np.nan, la_mer)
+
+    # return
+    return np.clip(np.degrees(__lat_from_mer_vec(la_mer)), -90., 90.)
+
+# -------------------------------------------------------------------------------------------------
+def meridional_parts(ff_lat):
+    """
+    partes meridionais de uma latitude
+
+    @param ff_lat: latitude em graus
+
+    @return partes meridionais em minutos de arco
+    """
+    return lat_terms(ff_lat)[0] * M_RAD2MIN
+
+# -------------------------------------------------------------------------------------------------
+def meridional_parts_vec(fa_lat, f_tab=None):
+    """
+    versão vetorizada de meridional_parts
+
+    @param fa_lat: latitudes em graus
+    @param f_tab: tabela pré-calculada (CRhumbTable)
+
+    @return array de partes meridionais em minutos de arco
+    """
+    la_lat = np.radians(np.asarray(fa_lat, dtype=np.float64))
+
+    # return
+    return (f_tab.terms(la_lat)[0] if f_tab is not None else __psi_vec(la_lat)) * M_RAD2MIN
+
+# -------------------------------------------------------------------------------------------------
+def __nu_cos(ff_lat):
+    """
+    raio do paralelo (ν cos φ) em metros, latitude em radianos
+    """
+    lf_sin = math.sin(ff_lat)
+
+    # return
+    return cdefs.D_a * math.cos(ff_lat) / math.sqrt(1. - cdefs.D_e2 * lf_sin * lf_sin)
+
+# -------------------------------------------------------------------------------------------------
+def __nu_cos_vec(fa_lat):
+    """
+    versão vetorizada de __nu_cos
+    """
+    la_sin = np.sin(fa_lat)
+
+    # return
+    return cdefs.D_a * np.cos(fa_lat) / np.sqrt(1. - cdefs.D_e2 * la_sin * la_sin)
+
+# -------------------------------------------------------------------------------------------------
+def __psi_vec(fa_lat):
+    """
+    partes meridionais (latitude isométrica) em radianos a partir das latitudes em radianos
+    (±inf nos pólos)
+    """
+    la_sin = np.sin(fa_lat)
+
+    with np.errstate(divide="ignore"):
+        # pólos: sin φ arredondado para ±1
+        la_psi = np.where(np.abs(fa_lat) >= np.pi / 2., np.copysign(np.inf, fa_lat), np.arctanh(np.clip(la_sin, -1., 1.)))
+
+    # return
+    return la_psi - cdefs.D_e * np.arctanh(cdefs.D_e * la_sin)
+
+# -------------------------------------------------------------------------------------------------
+def __rho_vec(fa_lat):
+    """
+    raios de curvatura do meridiano em metros, latitudes em radianos
+    """
+    la_sin = np.sin(fa_lat)
+
+    # return
+    return cdefs.D_a * (1. - cdefs.D_e2) / (1. - cdefs.D_e2 * la_sin * la_sin) ** 1.5
+
+# < the end >--------------------------------------------------------------------------------------
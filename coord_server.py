@@ -0,0 +1,843 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+coord_server
+
+servidor asyncio de conversão de coordenadas em um socket Unix local
+
+o servidor mantém um único sistema de coordenadas (CCoordSys) já inicializado (referência, fixos e
+tabelas compiladas). As requisições concorrentes de cada operação são agrupadas em micro-lotes
+(tamanho máximo e espera máxima configuráveis) e convertidas pelos métodos em lote
+
+protocolo: uma mensagem JSON por linha, nos dois sentidos. As respostas de uma conexão podem
+chegar fora de ordem e são associadas às requisições pelo id
+
+    requisição: {"id": 1, "op": "new_coord", "args": ["F", "ABC"]}
+    resposta:   {"id": 1, "res": [0, -12.0, -46.0]}  ou  {"id": 1, "error": "..."}
+
+operações: geo2xyz (lat, lng[, alt]), xyz2geo (x, y[, z]), new_coord (tipo, A[, B, C, D]),
+parse_ica (str) e stats (estatísticas do servidor, sem micro-lote)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import asyncio
+import collections
+import itertools
+import json
+import logging
+import os
+import time
+
+# numpy
+import numpy as np
+
+# libs
+import libs.coords.coord_conv as conv
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+M_LOG = logging.getLogger(__name__)
+M_LOG.setLevel(logging.DEBUG)
+
+# tamanho máximo padrão do micro-lote
+M_MAX_BATCH = 256
+
+# espera máxima padrão do micro-lote (s)
+M_MAX_DELAY = 0.002
+
+# número de latências guardadas para os percentis
+M_LAT_SAMPLES = 1 << 16
+
+# tamanho máximo de uma linha (requisição ou resposta)
+M_LINE_LIMIT = 1 << 20
+
+# < class CBatcher >-------------------------------------------------------------------------------
+
+class CBatcher(object):
+    """
+    micro-lote de uma operação. As requisições são acumuladas até o tamanho máximo ou até a espera
+    máxima a partir da primeira requisição, o que ocorrer primeiro, e convertidas de uma só vez.
+    Uma requisição inválida não derruba o lote: é recusada em submit (validação) ou, se o lote
+    falhar, as requisições são convertidas uma a uma e só a culpada recebe o erro
+    """
+    # ---------------------------------------------------------------------------------------------
+    def __init__(self, f_fn_batch, fi_max_batch=M_MAX_BATCH, ff_max_delay=M_MAX_DELAY, f_stats=None,
+                 f_fn_check=None):
+        """
+        constructor
+
+        @param f_fn_batch: função em lote (lista de tuplas de argumentos -> lista de resultados)
+        @param fi_max_batch: tamanho máximo do micro-lote
+        @param ff_max_delay: espera máxima do micro-lote (s)
+        @param f_stats: estatísticas do servidor (CServerStats)
+        @param f_fn_check: validação de uma requisição (tupla de argumentos -> tupla convertida,
+                           exceção se inválida), None aceita os argumentos como vieram
+        """
+        # inicia a super classe
+        super(CBatcher, self).__init__()
+
+        # check input
+        assert fi_max_batch > 0
+        assert ff_max_delay >= 0.
+
+        self.__fn_batch = f_fn_batch
+        self.__fn_check = f_fn_check
+        self.__i_max_batch = int(fi_max_batch)
+        self.__f_max_delay = float(ff_max_delay)
+        self.__stats = f_stats
+
+        # requisições pendentes (argumentos e futuros) e temporizador do lote
+        self.__lst_args = []
+        self.__lst_fut = []
+        self.__timer = None
+
+    # ---------------------------------------------------------------------------------------------
+    def flush(self):
+        """
+        converte as requisições pendentes
+        """
+        # cancela o temporizador
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+
+        # nada a converter ?
+        if not self.__lst_args:
+            return
+
+        # troca o lote
+        llst_args, self.__lst_args = self.__lst_args, []
+        llst_fut, self.__lst_fut = self.__lst_fut, []
+
+        try:
+            # converte o lote
+            llst_res = self.__fn_batch(llst_args)
+
+        # erro na conversão ? converte as requisições uma a uma
+        except Exception as l_err:
+            # logger
+            M_LOG.warning("flush: erro no lote de {} requisição(ões): {}.".format(len(llst_args), l_err))
+
+            self.__flush_each(llst_args, llst_fut, l_err)
+
+            # cai fora
+            return
+
+        # estatísticas
+        if self.__stats is not None:
+            self.__stats.add_batch(len(llst_args))
+
+        # entrega os resultados
+        for l_fut, l_res in zip(llst_fut, llst_res):
+            if not l_fut.done():
+                l_fut.set_result(l_res)
+
+    # ---------------------------------------------------------------------------------------------
+    def __flush_each(self, flst_args, flst_fut, f_err):
+        """
+        converte uma a uma as requisições de um lote que falhou, isolando as requisições com erro
+
+        @param flst_args: argumentos das requisições
+        @param flst_fut: futuros das requisições
+        @param f_err: erro do lote (repassado diretamente se o lote tem uma só requisição)
+        """
+        # uma só requisição ? o erro é dela
+        if 1 == len(flst_args):
+            if not flst_fut[0].done():
+                flst_fut[0].set_exception(f_err)
+
+            # cai fora
+            return
+
+        for lt_args, l_fut in zip(flst_args, flst_fut):
+            # requisição já cancelada ?
+            if l_fut.done():
+                continue
+
+            try:
+                # converte a requisição sozinha
+                l_res = self.__fn_batch([lt_args])[0]
+
+            # erro nesta requisição
+            except Exception as l_err:
+                l_fut.set_exception(l_err)
+                continue
+
+            # estatísticas
+            if self.__stats is not None:
+                self.__stats.add_batch(1)
+
+            l_fut.set_result(l_res)
+
+    # ---------------------------------------------------------------------------------------------
+    def submit(self, ft_args):
+        """
+        acrescenta uma requisição ao micro-lote
+
+        @param ft_args: tupla de argumentos
+
+        @return futuro do resultado
+        """
+        # valida e converte a requisição (exceção, sem entrar no lote, se inválida)
+        if self.__fn_check is not None:
+            ft_args = self.__fn_check(ft_args)
+
+        l_loop = asyncio.get_running_loop()
+
+        l_fut = l_loop.create_future()
+
+        self.__lst_args.append(ft_args)
+        self.__lst_fut.append(l_fut)
+
+        # lote cheio ?
+        if len(self.__lst_args) >= self.__i_max_batch:
+            self.flush()
+
+        # primeira requisição do lote ? arma o temporizador
+        elif self.__timer is None:
+            self.__timer = l_loop.call_later(self.__f_max_delay, self.flush)
+
+        # return
+        return l_fut
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def f_max_delay(self):
+        """
+        get espera máxima do micro-lote (s)
+        """
+        return self.__f_max_delay
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def i_max_batch(self):
+        """
+        get tamanho máximo do micro-lote
+        """
+        return self.__i_max_batch
+
+# < class CServerStats >---------------------------------------------------------------------------
+
+class CServerStats(object):
+    """
+    estatísticas do servidor: requisições, lotes, vazão e percentis de latência
+    """
+    # ---------------------------------------------------------------------------------------------
+    def __init__(self, fi_samples=M_LAT_SAMPLES):
+        """
+        constructor
+
+        @param fi_samples: número de latências guardadas (as mais recentes)
+        """
+        # inicia a super classe
+        super(CServerStats, self).__init__()
+
+        # latências mais recentes (s)
+        self.__qu_lat = collections.deque(maxlen=fi_samples)
+
+        self.reset()
+
+    # ---------------------------------------------------------------------------------------------
+    def add_batch(self, fi_size):
+        """
+        registra um lote convertido
+
+        @param fi_size: número de requisições do lote
+        """
+        self.__i_batches += 1
+        self.__i_batched += fi_size
+
+    # ---------------------------------------------------------------------------------------------
+    def add_request(self, ff_lat, fv_err=False):
+        """
+        registra uma requisição respondida
+
+        @param ff_lat: latência (s)
+        @param fv_err: respondida com erro ?
+        """
+        self.__i_reqs += 1
+        self.__i_errors += int(fv_err)
+        self.__qu_lat.append(ff_lat)
+
+    # ---------------------------------------------------------------------------------------------
+    def reset(self):
+        """
+        zera as estatísticas
+        """
+        self.__qu_lat.clear()
+
+        self.__i_reqs = 0
+        self.__i_errors = 0
+        self.__i_batches = 0
+        self.__i_batched = 0
+
+        self.__f_start = time.perf_counter()
+
+    # ---------------------------------------------------------------------------------------------
+    def stats(self):
+        """
+        estatísticas
+
+        @return dicionário com requisições, erros, lotes, tamanho médio do lote, vazão (req/s) e
+                latências p50/p99/máxima (ms)
+        """
+        lf_elapsed = max(time.perf_counter() - self.__f_start, 1e-9)
+
+        # percentis de latência
+        if self.__qu_lat:
+            lf_p50, lf_p99 = np.percentile(np.fromiter(self.__qu_lat, dtype=np.float64), (50., 99.)) * 1000.
+            lf_max = max(self.__qu_lat) * 1000.
+
+        else:
+            lf_p50 = lf_p99 = lf_max = 0.
+
+        # return
+        return {"requests": self.__i_reqs,
+                "errors": self.__i_errors,
+                "batches": self.__i_batches,
+                "mean_batch": (self.__i_batched / self.__i_batches) if self.__i_batches else 0.,
+                "throughput": self.__i_reqs / lf_elapsed,
+                "p50_ms": float(lf_p50),
+                "p99_ms": float(lf_p99),
+                "max_ms": float(lf_max)}
+
+# < class CCoordServer >---------------------------------------------------------------------------
+
+class CCoordServer(object):
+    """
+    servidor de conversão de coordenadas (socket Unix, uma mensagem JSON por linha)
+    """
+    # ---------------------------------------------------------------------------------------------
+    def __init__(self, f_coord_sys, fs_path, fi_max_batch=M_MAX_BATCH, ff_max_delay=M_MAX_DELAY):
+        """
+        constructor
+
+        @param f_coord_sys: sistema de coordenadas (CCoordSys), já com os fixos carregados
+        @param fs_path: caminho do socket Unix
+        @param fi_max_batch: tamanho máximo do micro-lote
+        @param ff_max_delay: espera máxima do micro-lote (s)
+        """
+        # inicia a super classe
+        super(CCoordServer, self).__init__()
+
+        self.__coord_sys = f_coord_sys
+        self.__s_path = fs_path
+
+        # estatísticas
+        self.__stats = CServerStats()
+
+        # micro-lotes por operação (função em lote e validação de uma requisição)
+        ltup_op = (("geo2xyz", self.__batch_geo2xyz, self.__check_float),
+                   ("new_coord", self.__batch_new_coord, self.__check_new_coord),
+                   ("parse_ica", self.__batch_parse_ica, self.__check_parse_ica),
+                   ("xyz2geo", self.__batch_xyz2geo, self.__check_float))
+
+        self.__dct_batcher = {ls_op: CBatcher(lfn_batch, fi_max_batch, ff_max_delay, self.__stats, lfn_check)
+                              for ls_op, lfn_batch, lfn_check in ltup_op}
+
+        # servidor asyncio
+        self.__server = None
+
+    # ---------------------------------------------------------------------------------------------
+    def __batch_geo2xyz(self, flst_args):
+        """
+        geo2xyz em lote: (lat, lng[, alt]) -> [x, y, z]
+        """
+        la_lat, la_lng, la_alt = self.__columns(flst_args, 3, 0., np.float64)
+
+        # return
+        return self.__rows(self.__coord_sys.geo2xyz_vec(la_lat, la_lng, la_alt))
+
+    # ---------------------------------------------------------------------------------------------
+    def __batch_new_coord(self, flst_args):
+        """
+        new_coord em lote: (tipo, A[, B, C, D]) -> [rc, lat, lng]
+        """
+        llst_col = self.__columns(flst_args, 5, "", object)
+
+        # return
+        return self.__rows(self.__coord_sys.new_coord_vec(*llst_col))
+
+    # ---------------------------------------------------------------------------------------------
+    def __batch_parse_ica(self, flst_args):
+        """
+        parse_ica em lote: (str) -> graus (None se inválida)
+        """
+        la_deg, lv_ok = conv.parse_ica_vec([lt_args[0] for lt_args in flst_args])
+
+        # return
+        return [(lf_deg if lv_ok_i else None) for lf_deg, lv_ok_i in zip(la_deg.tolist(), lv_ok.tolist())]
+
+    # ---------------------------------------------------------------------------------------------
+    def __batch_xyz2geo(self, flst_args):
+        """
+        xyz2geo em lote: (x, y[, z]) -> [lat, lng, alt]
+        """
+        la_x, la_y, la_z = self.__columns(flst_args, 3, 0., np.float64)
+
+        # return
+        return self.__rows(self.__coord_sys.xyz2geo_vec(la_x, la_y, la_z))
+
+    # ---------------------------------------------------------------------------------------------
+    @staticmethod
+    def __check_float(ft_args):
+        """
+        valida uma requisição geo2xyz/xyz2geo: 2 ou 3 números
+
+        @return tupla de floats
+        """
+        if not 2 <= len(ft_args) <= 3:
+            raise ValueError("esperados 2 ou 3 argumentos, recebidos {}".format(len(ft_args)))
+
+        if not all(isinstance(l_arg, (int, float)) and not isinstance(l_arg, bool) for l_arg in ft_args):
+            raise TypeError("argumentos devem ser números: {}".format(list(ft_args)))
+
+        # return
+        return tuple(float(l_arg) for l_arg in ft_args)
+
+    # ---------------------------------------------------------------------------------------------
+    @staticmethod
+    def __check_new_coord(ft_args):
+        """
+        valida uma requisição new_coord: tipo (um caractere) e de 1 a 4 campos (texto ou número)
+
+        @return tupla de argumentos
+        """
+        if not 2 <= len(ft_args) <= 5:
+            raise ValueError("esperados de 2 a 5 argumentos, recebidos {}".format(len(ft_args)))
+
+        if not (isinstance(ft_args[0], str) and (1 == len(ft_args[0]))):
+            raise TypeError("tipo de coordenada inválido: {!r}".format(ft_args[0]))
+
+        if not all(isinstance(l_arg, (str, int, float)) and not isinstance(l_arg, bool)
+                   for l_arg in ft_args[1:]):
+            raise TypeError("campos devem ser texto ou números: {}".format(list(ft_args[1:])))
+
+        # return
+        return ft_args
+
+    # ---------------------------------------------------------------------------------------------
+    @staticmethod
+    def __check_parse_ica(ft_args):
+        """
+        valida uma requisição parse_ica: um texto
+
+        @return tupla de argumentos
+        """
+        if not ((1 == len(ft_args)) and isinstance(ft_args[0], str)):
+            raise TypeError("esperado um texto, recebido {}".format(list(ft_args)))
+
+        # return
+        return ft_args
+
+    # ---------------------------------------------------------------------------------------------
+    async def close(self):
+        """
+        encerra o servidor, convertendo os lotes pendentes, e remove o socket
+        """
+        # converte os lotes pendentes
+        for l_batcher in self.__dct_batcher.values():
+            l_batcher.flush()
+
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+
+            self.__server = None
+
+        # remove o socket
+        if os.path.exists(self.__s_path):
+            os.unlink(self.__s_path)
+
+    # ---------------------------------------------------------------------------------------------
+    @staticmethod
+    def __columns(flst_args, fi_ncol, f_fill, f_dtype):
+        """
+        transpõe as tuplas de argumentos em colunas, completando os argumentos ausentes com f_fill
+
+        @return lista de fi_ncol colunas (arrays)
+        """
+        llst_col = list(itertools.zip_longest(*[lt_args[:fi_ncol] for lt_args in flst_args], fillvalue=f_fill))
+
+        # colunas inteiramente ausentes
+        llst_col.extend([(f_fill,) * len(flst_args)] * (fi_ncol - len(llst_col)))
+
+        # return
+        return [np.array(lt_col, dtype=f_dtype) for lt_col in llst_col]
+
+    # ---------------------------------------------------------------------------------------------
+    async def __handle(self, f_reader, f_writer):
+        """
+        atende uma conexão. As requisições são despachadas sem aguardar as anteriores (pipeline)
+        """
+        # respostas em andamento
+        lset_task = set()
+
+        # lock de escrita da conexão
+        l_lock = asyncio.Lock()
+
+        try:
+            while True:
+                # lê uma requisição
+                try:
+                    lby_lin = await f_reader.readline()
+
+                # conexão perdida ou linha muito longa
+                except (ConnectionError, ValueError):
+                    break
+
+                # fim da conexão ?
+                if not lby_lin:
+                    break
+
+                # linha vazia ?
+                if not lby_lin.strip():
+                    continue
+
+                # responde em paralelo
+                l_task = asyncio.ensure_future(self.__reply(lby_lin, f_writer, l_lock, time.perf_counter()))
+
+                lset_task.add(l_task)
+                l_task.add_done_callback(lset_task.discard)
+
+            # aguarda as respostas em andamento
+            if lset_task:
+                await asyncio.gather(*lset_task, return_exceptions=True)
+
+        finally:
+            f_writer.close()
+
+            try:
+                await f_writer.wait_closed()
+
+            # conexão já perdida
+            except ConnectionError:
+                pass
+
+    # ---------------------------------------------------------------------------------------------
+    async def __reply(self, fby_lin, f_writer, f_lock, ff_t0):
+        """
+        converte uma requisição e envia a resposta
+        """
+        l_id = None
+        ldct_rsp = {}
+
+        try:
+            # decodifica a requisição
+            ldct_req = json.loads(fby_lin)
+            l_id = ldct_req.get("id", None)
+
+            ls_op = ldct_req["op"]
+
+            # estatísticas ? (sem micro-lote)
+            if "stats" == ls_op:
+                ldct_rsp["res"] = self.stats()
+
+            # senão, operação em micro-lote
+            else:
+                l_batcher = self.__dct_batcher.get(ls_op, None)
+
+                if l_batcher is None:
+                    raise ValueError("operação desconhecida: {}".format(ls_op))
+
+                ldct_rsp["res"] = await l_batcher.submit(tuple(ldct_req.get("args", ())))
+
+        # erro na requisição ou na conversão
+        except Exception as l_err:
+            ldct_rsp["error"] = "{}: {}".format(type(l_err).__name__, l_err)
+
+        ldct_rsp["id"] = l_id
+
+        # estatísticas
+        self.__stats.add_request(time.perf_counter() - ff_t0, "error" in ldct_rsp)
+
+        # envia a resposta
+        async with f_lock:
+            try:
+                f_writer.write(json.dumps(ldct_rsp).encode() + b"\n")
+                await f_writer.drain()
+
+            # cliente desconectado
+            except ConnectionError:
+                pass
+
+    # ---------------------------------------------------------------------------------------------
+    @staticmethod
+    def __rows(ft_cols):
+        """
+        transpõe as colunas de saída em linhas (tipos Python, serializáveis em JSON)
+        """
+        return [list(lt_row) for lt_row in zip(*(np.asarray(l_col).tolist() for l_col in ft_cols))]
+
+    # ---------------------------------------------------------------------------------------------
+    async def serve_forever(self):
+        """
+        atende até ser cancelado
+        """
+        if self.__server is None:
+            await self.start()
+
+        try:
+            await self.__server.serve_forever()
+
+        finally:
+            await self.close()
+
+    # ---------------------------------------------------------------------------------------------
+    async def start(self):
+        """
+        abre o socket Unix e passa a aceitar conexões
+        """
+        # remove um socket antigo
+        if os.path.exists(self.__s_path):
+            os.unlink(self.__s_path)
+
+        self.__server = await asyncio.start_unix_server(self.__handle, path=self.__s_path, limit=M_LINE_LIMIT)
+
+        # logger
+        M_LOG.info("start: servidor em {}.".format(self.__s_path))
+
+    # ---------------------------------------------------------------------------------------------
+    def stats(self):
+        """
+        estatísticas do servidor (ver CServerStats.stats)
+        """
+        return self.__stats.stats()
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def coord_sys(self):
+        """
+        get sistema de coordenadas
+        """
+        return self.__coord_sys
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def s_path(self):
+        """
+        get caminho do socket Unix
+        """
+        return self.__s_path
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def server_stats(self):
+        """
+        get estatísticas do servidor (CServerStats)
+        """
+        return self.__stats
+
+# < class CCoordClient >---------------------------------------------------------------------------
+
+class CCoordClient(object):
+    """
+    cliente asyncio do servidor de conversão. As chamadas concorrentes compartilham a conexão
+    """
+    # ---------------------------------------------------------------------------------------------
+    def __init__(self, fs_path):
+        """
+        constructor
+
+        @param fs_path: caminho do socket Unix
+        """
+        # inicia a super classe
+        super(CCoordClient, self).__init__()
+
+        self.__s_path = fs_path
+
+        # conexão, leitor de respostas e respostas aguardadas (id -> futuro)
+        self.__reader = None
+        self.__writer = None
+        self.__task = None
+        self.__dct_fut = {}
+
+        self.__ids = itertools.count()
+
+    # ---------------------------------------------------------------------------------------------
+    async def call(self, fs_op, *f_args):
+        """
+        envia uma requisição e aguarda a resposta
+
+        @param fs_op: operação
+        @param f_args: argumentos
+
+        @return resultado (RuntimeError se o servidor responde com erro)
+        """
+        li_id = next(self.__ids)
+
+        l_fut = self.__dct_fut[li_id] = asyncio.get_running_loop().create_future()
+
+        # envia a requisição
+        self.__writer.write(json.dumps({"id": li_id, "op": fs_op, "args": f_args}).encode() + b"\n")
+        await self.__writer.drain()
+
+        ldct_rsp = await l_fut
+
+        # erro ?
+        if "error" in ldct_rsp:
+            raise RuntimeError(ldct_rsp["error"])
+
+        # return
+        return ldct_rsp["res"]
+
+    # ---------------------------------------------------------------------------------------------
+    async def close(self):
+        """
+        fecha a conexão
+        """
+        if self.__writer is not None:
+            self.__writer.close()
+
+            try:
+                await self.__writer.wait_closed()
+
+            # conexão já perdida
+            except ConnectionError:
+                pass
+
+        if self.__task is not None:
+            await asyncio.gather(self.__task, return_exceptions=True)
+
+        self.__reader = self.__writer = self.__task = None
+
+    # ---------------------------------------------------------------------------------------------
+    async def connect(self):
+        """
+        conecta ao servidor
+        """
+        self.__reader, self.__writer = await asyncio.open_unix_connection(self.__s_path, limit=M_LINE_LIMIT)
+
+        self.__task = asyncio.ensure_future(self.__read_loop())
+
+        # return
+        return self
+
+    # ---------------------------------------------------------------------------------------------
+    async def __read_loop(self):
+        """
+        entrega as respostas às chamadas aguardando
+        """
+        try:
+            while True:
+                lby_lin = await self.__reader.readline()
+
+                # fim da conexão ?
+                if not lby_lin:
+                    break
+
+                ldct_rsp = json.loads(lby_lin)
+
+                l_fut = self.__dct_fut.pop(ldct_rsp.get("id"), None)
+
+                if (l_fut is not None) and not l_fut.done():
+                    l_fut.set_result(ldct_rsp)
+
+        finally:
+            # conexão encerrada: falha as chamadas pendentes
+            for l_fut in self.__dct_fut.values():
+                if not l_fut.done():
+                    l_fut.set_exception(ConnectionError("conexão encerrada"))
+
+            self.__dct_fut.clear()
+
+# -------------------------------------------------------------------------------------------------
+async def run_load(fs_path, fs_op, flst_args, fi_clients=8, fi_inflight=64):
+    """
+    gera carga no servidor e mede vazão e latência do lado do cliente
+
+    @param fs_path: caminho do socket Unix
+    @param fs_op: operação
+    @param flst_args: lista de tuplas de argumentos (uma por requisição)
+    @param fi_clients: número de conexões
+    @param fi_inflight: requisições simultâneas por conexão
+
+    @return dicionário com requisições, erros, tempo (s), vazão (req/s) e latências p50/p99/máxima
+            (ms)
+    """
+    # conexões
+    llst_cli = [await CCoordClient(fs_path).connect() for _ in range(fi_clients)]
+
+    # requisições a enviar e latências
+    l_it_args = iter(flst_args)
+    llst_lat = []
+    li_errors = 0
+
+    # -----------------------------------------------------------------------------------------
+    async def __worker(f_cli):
+        """
+        envia requisições em sequência pela conexão
+        """
+        nonlocal li_errors
+
+        for lt_args in l_it_args:
+            lf_t0 = time.perf_counter()
+
+            try:
+                await f_cli.call(fs_op, *lt_args)
+
+            # erro do servidor
+            except RuntimeError:
+                li_errors += 1
+
+            llst_lat.append(time.perf_counter() - lf_t0)
+
+    lf_t0 = time.perf_counter()
+
+    try:
+        # envia as requisições
+        await asyncio.gather(*(__worker(l_cli) for l_cli in llst_cli for _ in range(fi_inflight)))
+
+    finally:
+        for l_cli in llst_cli:
+            await l_cli.close()
+
+    lf_elapsed = max(time.perf_counter() - lf_t0, 1e-9)
+
+    # percentis de latência
+    la_lat = np.array(llst_lat, dtype=np.float64) * 1000.
+
+    lf_p50, lf_p99 = np.percentile(la_lat, (50., 99.)) if la_lat.size else (0., 0.)
+
+    # return
+    return {"requests": len(llst_lat),
+            "errors": li_errors,
+            "elapsed": lf_elapsed,
+            "throughput": len(llst_lat) / lf_elapsed,
+            "p50_ms": float(lf_p50),
+            "p99_ms": float(lf_p99),
+            "max_ms": float(la_lat.max()) if la_lat.size else 0.}
+
+# < the end >--------------------------------------------------------------------------------------
@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+coord_snap
+
+instantâneo binário (versionado, com checksum) de um sistema de coordenadas
+
+leiaute do arquivo (little-endian):
+
+    cabeçalho  M_HDR_FMT: assinatura, versão, CRC32 do restante do arquivo e tamanho dos metadados
+    metadados  JSON (UTF-8): escalares e, para cada array ou lista de nomes, tipo, forma,
+               deslocamento e tamanho
+    (zeros até o alinhamento M_ALIGN)
+    dados      arrays e listas de nomes (UTF-8 separados por "\\0"), cada um alinhado em M_ALIGN
+
+o arquivo é aberto por mapeamento em memória (mmap): os arrays carregados são views somente
+leitura do mapeamento, sem cópia
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import collections
+import io
+import json
+import mmap
+import os
+import struct
+import zlib
+
+# numpy
+import numpy as np
+
+# < module data >----------------------------------------------------------------------------------
+
+# assinatura do arquivo
+M_MAGIC = b"CRDSNAP\0"
+
+# versão do formato
+M_VERSION = 1
+
+# cabeçalho: assinatura, versão, reservado, CRC32 e tamanho dos metadados
+M_HDR_FMT = "<8sHHIQ"
+M_HDR_LEN = struct.calcsize(M_HDR_FMT)
+
+# alinhamento das seções
+M_ALIGN = 64
+
+# fixo recriado a partir de um instantâneo
+CFIX = collections.namedtuple("CFIX", "v_fix_ok f_fix_lat f_fix_lng")
+
+# < class CSnapshotError >-------------------------------------------------------------------------
+
+class CSnapshotError(ValueError):
+    """
+    instantâneo inválido (assinatura, versão, checksum ou leiaute)
+    """
+    pass
+
+# -------------------------------------------------------------------------------------------------
+def __align(fi_off):
+    """
+    arredonda o deslocamento para o alinhamento das seções
+    """
+    return -(-fi_off // M_ALIGN) * M_ALIGN
+
+# -------------------------------------------------------------------------------------------------
+def load(fs_path, fv_check=True):
+    """
+    carrega um instantâneo por mapeamento em memória
+
+    @param fs_path: arquivo
+    @param fv_check: verifica o checksum
+
+    @return escalares (dicionário) e seções (nome -> array ou lista de nomes)
+    """
+    with io.open(fs_path, "rb") as lfh_inp:
+        # arquivo vazio ?
+        if os.fstat(lfh_inp.fileno()).st_size < M_HDR_LEN:
+            raise CSnapshotError("{}: cabeçalho incompleto".format(fs_path))
+
+        # mapeia o arquivo (o mapeamento continua válido após fechar o arquivo)
+        l_map = mmap.mmap(lfh_inp.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # cabeçalho
+    ls_magic, li_ver, _, li_crc, li_meta = struct.unpack_from(M_HDR_FMT, l_map, 0)
+
+    if ls_magic != M_MAGIC:
+        raise CSnapshotError("{}: assinatura inválida".format(fs_path))
+
+    if li_ver != M_VERSION:
+        raise CSnapshotError("{}: versão {} não suportada".format(fs_path, li_ver))
+
+    # checksum
+    if fv_check and (zlib.crc32(memoryview(l_map)[M_HDR_LEN:]) != li_crc):
+        raise CSnapshotError("{}: checksum inválido".format(fs_path))
+
+    # metadados
+    try:
+        ldct_meta = json.loads(bytes(l_map[M_HDR_LEN:M_HDR_LEN + li_meta]).decode("utf-8"))
+
+    # metadados corrompidos (sem verificação do checksum)
+    except ValueError as l_err:
+        raise CSnapshotError("{}: metadados inválidos ({})".format(fs_path, l_err))
+
+    li_data = __align(M_HDR_LEN + li_meta)
+
+    # seções
+    ldct_sec = {}
+
+    for ls_sec, (ls_dtype, lt_shape, li_off, li_len) in ldct_meta["sections"].items():
+        li_off += li_data
+
+        if li_off + li_len > len(l_map):
+            raise CSnapshotError("{}: seção {} truncada".format(fs_path, ls_sec))
+
+        # lista de nomes ?
+        if "names" == ls_dtype:
+            lby_sec = l_map[li_off:li_off + li_len]
+            ldct_sec[ls_sec] = lby_sec.decode("utf-8").split("\0") if lt_shape[0] else []
+
+        # senão, array (view do mapeamento)
+        else:
+            l_dtype = np.dtype(ls_dtype)
+            ldct_sec[ls_sec] = np.frombuffer(l_map, dtype=l_dtype, count=li_len // l_dtype.itemsize,
+                                             offset=li_off).reshape(lt_shape)
+
+    # return
+    return ldct_meta["scalars"], ldct_sec
+
+# -------------------------------------------------------------------------------------------------
+def save(fs_path, fdct_scalar, fdct_sec):
+    """
+    salva um instantâneo. O arquivo é gravado em um temporário e renomeado (o destino nunca fica
+    incompleto)
+
+    @param fs_path: arquivo
+    @param fdct_scalar: escalares (serializáveis em JSON)
+    @param fdct_sec: seções (nome -> array numérico ou lista de nomes)
+    """
+    ldct_meta = {}
+    llst_blob = []
+
+    li_off = 0
+
+    # monta as seções
+    for ls_sec, l_sec in fdct_sec.items():
+        # lista de nomes ?
+        if isinstance(l_sec, list):
+            lby_sec = "\0".join(str(ls_nam) for ls_nam in l_sec).encode("utf-8")
+            ldct_meta[ls_sec] = ("names", (len(l_sec),), li_off, len(lby_sec))
+
+        # senão, array (little-endian, contíguo)
+        else:
+            la_sec = np.ascontiguousarray(l_sec)
+            la_sec = la_sec.astype(la_sec.dtype.newbyteorder("<"), copy=False)
+
+            lby_sec = la_sec.tobytes()
+            ldct_meta[ls_sec] = (la_sec.dtype.str, la_sec.shape, li_off, len(lby_sec))
+
+        llst_blob.append((li_off, lby_sec))
+        li_off = __align(li_off + len(lby_sec))
+
+    # metadados
+    lby_meta = json.dumps({"scalars": fdct_scalar, "sections": ldct_meta}).encode("utf-8")
+
+    li_data = __align(M_HDR_LEN + len(lby_meta))
+
+    # restante do arquivo (metadados e dados)
+    lba_body = bytearray(li_data - M_HDR_LEN + li_off)
+
+    lba_body[:len(lby_meta)] = lby_meta
+
+    for li_sec, lby_sec in llst_blob:
+        li_ini = li_data - M_HDR_LEN + li_sec
+        lba_body[li_ini:li_ini + len(lby_sec)] = lby_sec
+
+    # cabeçalho
+    lby_hdr = struct.pack(M_HDR_FMT, M_MAGIC, M_VERSION, 0, zlib.crc32(lba_body), len(lby_meta))
+
+    # grava e renomeia
+    ls_tmp = "{}.tmp{}".format(fs_path, os.getpid())
+
+    with io.open(ls_tmp, "wb") as lfh_out:
+        lfh_out.write(lby_hdr)
+        lfh_out.write(lba_body)
+
+    os.replace(ls_tmp, fs_path)
+
+# < the end >--------------------------------------------------------------------------------------
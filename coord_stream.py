@@ -0,0 +1,446 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+coord_stream
+
+conversão de arquivos de trilhas em fluxo (geradores), com memória limitada
+
+um fluxo é uma sequência de blocos. Cada bloco é um dicionário de colunas (nome -> array) com o
+mesmo número de linhas. As fontes (read_csv, read_bin) leem o arquivo sob demanda, bloco a bloco,
+os estágios (st_*) transformam cada bloco com as funções em lote de coord_conv, coord_geog e
+coord_geod e os destinos (write_csv, write_bin) gravam os blocos convertidos
+
+    l_src = read_csv("trk.csv", ["lat", "lng"])
+    l_ref = coord_sys.ref_frame
+
+    for ldct_blk in pipeline(l_src, st_parse_ica("lat", "lng"), st_geo2xyz(l_ref), st_decl_xyz(l_ref)):
+        ...
+
+linhas inválidas (coordenada não reconhecida) ficam com NaN e são propagadas pelos estágios
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import io
+import itertools
+import logging
+import os
+
+# numpy
+import numpy as np
+
+# libs
+import libs.coords.coord_conv as conv
+import libs.coords.coord_geod as geod
+import libs.coords.coord_geog as geog
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+M_LOG = logging.getLogger(__name__)
+M_LOG.setLevel(logging.DEBUG)
+
+# tamanho padrão do bloco (linhas)
+M_CHUNK = 1 << 16
+
+# tipo padrão dos campos do arquivo binário (float64 little-endian)
+M_BIN_DTYPE = "<f8"
+
+# -------------------------------------------------------------------------------------------------
+def __apply_valid(f_fn, flst_col, fi_nout):
+    """
+    aplica uma função em lote apenas às linhas válidas (todas as colunas finitas). As linhas
+    inválidas recebem NaN
+
+    @param f_fn: função em lote (colunas -> tupla de colunas)
+    @param flst_col: colunas de entrada
+    @param fi_nout: número de colunas de saída
+
+    @return lista de colunas de saída
+    """
+    llst_col = [np.asarray(la_col, dtype=np.float64) for la_col in flst_col]
+
+    # linhas válidas
+    lv_ok = np.logical_and.reduce([np.isfinite(la_col) for la_col in llst_col])
+
+    # todas válidas ?
+    if lv_ok.all():
+        return [np.asarray(la_out, dtype=np.float64) for la_out in f_fn(*llst_col)[:fi_nout]]
+
+    # saída (NaN nas linhas inválidas)
+    llst_out = [np.full(len(lv_ok), np.nan) for _ in range(fi_nout)]
+
+    if lv_ok.any():
+        for la_out, la_val in zip(llst_out, f_fn(*[la_col[lv_ok] for la_col in llst_col])[:fi_nout]):
+            la_out[lv_ok] = la_val
+
+    # return
+    return llst_out
+
+# -------------------------------------------------------------------------------------------------
+def pipeline(f_src, *flst_stage):
+    """
+    encadeia os estágios sobre os blocos de uma fonte
+
+    @param f_src: fonte (iterável de blocos)
+    @param flst_stage: estágios (bloco -> bloco), aplicados na ordem
+
+    @return gerador dos blocos convertidos
+    """
+    for ldct_blk in f_src:
+        # aplica os estágios
+        for lfn_stage in flst_stage:
+            ldct_blk = lfn_stage(ldct_blk)
+
+        yield ldct_blk
+
+# -------------------------------------------------------------------------------------------------
+def read_bin(fs_path, flst_col, fi_chunk=M_CHUNK, fs_dtype=M_BIN_DTYPE):
+    """
+    lê um arquivo binário de registros de tamanho fixo (len(flst_col) campos fs_dtype por
+    registro, sem cabeçalho), bloco a bloco
+
+    @param fs_path: arquivo
+    @param flst_col: nomes dos campos do registro
+    @param fi_chunk: registros por bloco
+    @param fs_dtype: tipo dos campos
+
+    @return gerador de blocos (colunas float64)
+    """
+    # check input
+    assert fi_chunk > 0
+
+    # registro
+    l_dtype = np.dtype([(ls_col, fs_dtype) for ls_col in flst_col])
+
+    with io.open(fs_path, "rb") as lfh_inp:
+        while True:
+            # lê um bloco de registros
+            la_rec = np.fromfile(lfh_inp, dtype=l_dtype, count=fi_chunk)
+
+            # fim do arquivo ?
+            if 0 == len(la_rec):
+                break
+
+            # return
+            yield {ls_col: la_rec[ls_col].astype(np.float64) for ls_col in flst_col}
+
+# -------------------------------------------------------------------------------------------------
+def read_csv(fs_path, flst_col, fi_chunk=M_CHUNK, fs_sep=",", fi_skip=0):
+    """
+    lê um arquivo texto (um registro por linha, campos separados por fs_sep), bloco a bloco. Os
+    campos são mantidos como texto (ver st_to_float e st_parse_ica)
+
+    @param fs_path: arquivo
+    @param flst_col: nomes dos campos (campos excedentes são ignorados, ausentes ficam vazios)
+    @param fi_chunk: linhas por bloco
+    @param fs_sep: separador de campos
+    @param fi_skip: linhas iniciais ignoradas (cabeçalho)
+
+    @return gerador de blocos (colunas de texto)
+    """
+    # check input
+    assert fi_chunk > 0
+
+    li_ncol = len(flst_col)
+
+    with io.open(fs_path, "r") as lfh_inp:
+        # linhas de dados (sem cabeçalho e linhas vazias)
+        l_lins = (ls_lin for ls_lin in itertools.islice(lfh_inp, fi_skip, None) if ls_lin.strip())
+
+        while True:
+            # lê um bloco de linhas
+            llst_fld = [ls_lin.rstrip("\r\n").split(fs_sep)[:li_ncol] for ls_lin in itertools.islice(l_lins, fi_chunk)]
+
+            # fim do arquivo ?
+            if not llst_fld:
+                break
+
+            # transpõe as linhas em colunas
+            llst_col = list(itertools.zip_longest(*llst_fld, fillvalue=""))
+            llst_col.extend([("",) * len(llst_fld)] * (li_ncol - len(llst_col)))
+
+            # return
+            yield {ls_col: np.array([ls_fld.strip() for ls_fld in lt_col]) for ls_col, lt_col in zip(flst_col, llst_col)}
+
+# -------------------------------------------------------------------------------------------------
+def st_decl_xyz(f_ref, fs_x="x", fs_y="y", fs_z="z"):
+    """
+    estágio: declinação magnética de (x, y, z), no lugar (coord_geog.decl_xyz_vec)
+
+    @param f_ref: referencial (CReferenceFrame, ver CCoordSys.ref_frame)
+    @param fs_x, fs_y, fs_z: colunas de entrada e saída
+
+    @return estágio
+    """
+    # ---------------------------------------------------------------------------------------------
+    def __stage(fdct_blk):
+        """
+        declina o bloco
+        """
+        lt_col = tuple(np.asarray(fdct_blk[ls_col], dtype=np.float64) for ls_col in (fs_x, fs_y, fs_z))
+
+        fdct_blk[fs_x], fdct_blk[fs_y], fdct_blk[fs_z] = geog.decl_xyz_vec(*lt_col, f_ref=f_ref)
+
+        # return
+        return fdct_blk
+
+    # return
+    return __stage
+
+# -------------------------------------------------------------------------------------------------
+def st_ecef2geod(fs_x="x", fs_y="y", fs_z="z", ft_out=("lat", "lng", "alt")):
+    """
+    estágio: ECEF (m) para geodésicas (coord_geod.ecef2geod_vec)
+
+    @param fs_x, fs_y, fs_z: colunas de entrada
+    @param ft_out: colunas de saída (lat, lng, alt)
+
+    @return estágio
+    """
+    return st_map(geod.ecef2geod_vec, (fs_x, fs_y, fs_z), ft_out)
+
+# -------------------------------------------------------------------------------------------------
+def st_geo2xyz(f_ref, fs_lat="lat", fs_lng="lng", fs_alt=None, ft_out=("x", "y", "z")):
+    """
+    estágio: geográficas para (x, y, z) em relação à referência (coord_geog.geo2xyz_3_vec)
+
+    @param f_ref: referencial (CReferenceFrame, ver CCoordSys.ref_frame)
+    @param fs_lat, fs_lng: colunas de entrada
+    @param fs_alt: coluna de altitude (None = 0.)
+    @param ft_out: colunas de saída (x, y, z)
+
+    @return estágio
+    """
+    # ---------------------------------------------------------------------------------------------
+    def __geo2xyz(fa_lat, fa_lng, fa_alt=0.):
+        """
+        conversão com o referencial do estágio
+        """
+        return geog.geo2xyz_3_vec(fa_lat, fa_lng, fa_alt, f_ref)
+
+    # return
+    return st_map(__geo2xyz, (fs_lat, fs_lng) + ((fs_alt,) if fs_alt else ()), ft_out)
+
+# -------------------------------------------------------------------------------------------------
+def st_geod2ecef(fs_lat="lat", fs_lng="lng", fs_alt=None, ft_out=("x", "y", "z")):
+    """
+    estágio: geodésicas para ECEF (m) (coord_geod.geod2ecef_vec)
+
+    @param fs_lat, fs_lng: colunas de entrada
+    @param fs_alt: coluna de altitude (None = 0.)
+    @param ft_out: colunas de saída (x, y, z)
+
+    @return estágio
+    """
+    return st_map(geod.geod2ecef_vec, (fs_lat, fs_lng) + ((fs_alt,) if fs_alt else ()), ft_out)
+
+# -------------------------------------------------------------------------------------------------
+def st_map(f_fn, ft_inp, ft_out):
+    """
+    estágio genérico: aplica uma função em lote às linhas válidas das colunas de entrada
+
+    @param f_fn: função em lote (colunas -> tupla de colunas)
+    @param ft_inp: colunas de entrada
+    @param ft_out: colunas de saída
+
+    @return estágio
+    """
+    # ---------------------------------------------------------------------------------------------
+    def __stage(fdct_blk):
+        """
+        converte o bloco
+        """
+        llst_out = __apply_valid(f_fn, [fdct_blk[ls_col] for ls_col in ft_inp], len(ft_out))
+
+        fdct_blk.update(zip(ft_out, llst_out))
+
+        # return
+        return fdct_blk
+
+    # return
+    return __stage
+
+# -------------------------------------------------------------------------------------------------
+def st_parse_ica(*flst_col):
+    """
+    estágio: coordenadas ICA (texto) para graus, no lugar (coord_conv.parse_ica_vec). Inválidas
+    ficam com NaN
+
+    @param flst_col: colunas convertidas
+
+    @return estágio
+    """
+    # ---------------------------------------------------------------------------------------------
+    def __stage(fdct_blk):
+        """
+        converte o bloco
+        """
+        for ls_col in flst_col:
+            la_deg, lv_ok = conv.parse_ica_vec(fdct_blk[ls_col])
+
+            fdct_blk[ls_col] = np.where(lv_ok, la_deg, np.nan)
+
+        # return
+        return fdct_blk
+
+    # return
+    return __stage
+
+# -------------------------------------------------------------------------------------------------
+def st_select(*flst_col):
+    """
+    estágio: mantém apenas as colunas dadas, na ordem dada
+
+    @param flst_col: colunas mantidas
+
+    @return estágio
+    """
+    return lambda fdct_blk: {ls_col: fdct_blk[ls_col] for ls_col in flst_col}
+
+# -------------------------------------------------------------------------------------------------
+def st_to_float(*flst_col):
+    """
+    estágio: colunas de texto para float64, no lugar. Campos inválidos ficam com NaN
+
+    @param flst_col: colunas convertidas
+
+    @return estágio
+    """
+    # ---------------------------------------------------------------------------------------------
+    def __stage(fdct_blk):
+        """
+        converte o bloco
+        """
+        for ls_col in flst_col:
+            la_col = fdct_blk[ls_col]
+
+            try:
+                # conversão direta (caso comum)
+                fdct_blk[ls_col] = np.asarray(la_col, dtype=np.float64)
+
+            # há campos inválidos ? converte campo a campo
+            except ValueError:
+                fdct_blk[ls_col] = np.array([__to_float(ls_fld) for ls_fld in la_col.tolist()], dtype=np.float64)
+
+        # return
+        return fdct_blk
+
+    # return
+    return __stage
+
+# -------------------------------------------------------------------------------------------------
+def __to_float(fs_fld):
+    """
+    converte um campo texto (NaN se inválido)
+    """
+    try:
+        return float(fs_fld)
+
+    # campo inválido
+    except ValueError:
+        return np.nan
+
+# -------------------------------------------------------------------------------------------------
+def write_bin(f_blks, fs_path, flst_col, fs_dtype=M_BIN_DTYPE):
+    """
+    grava os blocos em um arquivo binário de registros de tamanho fixo (ver read_bin)
+
+    @param f_blks: blocos
+    @param fs_path: arquivo
+    @param flst_col: colunas gravadas (campos do registro)
+    @param fs_dtype: tipo dos campos
+
+    @return número de registros gravados
+    """
+    l_dtype = np.dtype([(ls_col, fs_dtype) for ls_col in flst_col])
+
+    li_rec = 0
+
+    with io.open(fs_path, "wb") as lfh_out:
+        for ldct_blk in f_blks:
+            # monta os registros do bloco
+            la_rec = np.empty(len(ldct_blk[flst_col[0]]), dtype=l_dtype)
+
+            for ls_col in flst_col:
+                la_rec[ls_col] = ldct_blk[ls_col]
+
+            la_rec.tofile(lfh_out)
+            li_rec += len(la_rec)
+
+    # logger
+    M_LOG.debug("write_bin: {} registro(s) em {}.".format(li_rec, os.path.basename(fs_path)))
+
+    # return
+    return li_rec
+
+# -------------------------------------------------------------------------------------------------
+def write_csv(f_blks, fs_path, flst_col, fs_sep=",", fs_fmt="%.12g", fs_header=None):
+    """
+    grava os blocos em um arquivo texto (ver read_csv)
+
+    @param f_blks: blocos
+    @param fs_path: arquivo
+    @param flst_col: colunas gravadas
+    @param fs_sep: separador de campos
+    @param fs_fmt: formato dos campos reais
+    @param fs_header: linha de cabeçalho (None = sem cabeçalho)
+
+    @return número de linhas gravadas
+    """
+    li_lin = 0
+
+    with io.open(fs_path, "w") as lfh_out:
+        # cabeçalho
+        if fs_header is not None:
+            lfh_out.write(fs_header + "\n")
+
+        for ldct_blk in f_blks:
+            llst_col = [np.asarray(ldct_blk[ls_col]) for ls_col in flst_col]
+
+            # bloco vazio ?
+            if 0 == len(llst_col[0]):
+                continue
+
+            # formato de cada coluna
+            llst_fmt = [(fs_fmt if "f" == la_col.dtype.kind else "%d" if la_col.dtype.kind in "iub" else "%s")
+                        for la_col in llst_col]
+
+            # colunas de texto ? mantém os tipos de cada coluna
+            if "%s" in llst_fmt:
+                llst_col = [la_col.astype(object) for la_col in llst_col]
+
+            # grava o bloco
+            np.savetxt(lfh_out, np.column_stack(llst_col), delimiter=fs_sep, fmt=llst_fmt)
+
+            li_lin += len(llst_col[0])
+
+    # logger
+    M_LOG.debug("write_csv: {} linha(s) em {}.".format(li_lin, os.path.basename(fs_path)))
+
+    # return
+    return li_lin
+
+# < the end >--------------------------------------------------------------------------------------
@@ -35,15 +35,30 @@ __date__ = "2015/11"
 # python library
 import collections
 import logging
-import math
 import re
+import types
+
+# numpy
+import numpy as np
 
 # libs
 import libs.coords.coord_model as model
+import libs.coords.coord_cache as ccache
 import libs.coords.coord_conv as conv
 import libs.coords.coord_defs as cdefs
+import libs.coords.coord_fix_idx as fidx
+import libs.coords.coord_fix_tab as ftab
 import libs.coords.coord_geod as geod
+import libs.coords.coord_geodesic as gdsc
 import libs.coords.coord_geog as geog
+import libs.coords.coord_ref as cref
+import libs.coords.coord_snap as snap
+
+# < module data >----------------------------------------------------------------------------------
+
+# logger
+M_LOG = logging.getLogger(__name__)
+M_LOG.setLevel(logging.DEBUG)
 
 # < class CCoordSys >------------------------------------------------------------------------------
 
@@ -52,9 +67,14 @@ class CCoordSys(model.CCoordModel):
     mantém os detalhes de um sistema de coordenadas
     """
     # ---------------------------------------------------------------------------------------------
-    def __init__(self, ff_ref_lat=cdefs.M_REF_LAT, ff_ref_lng=cdefs.M_REF_LNG, ff_dcl_mag=cdefs.M_DCL_MAG):
+    def __init__(self, ff_ref_lat=cdefs.M_REF_LAT, ff_ref_lng=cdefs.M_REF_LNG, ff_dcl_mag=cdefs.M_DCL_MAG, fi_cache=0,
+                 fv_frd_exact=False):
         """
         constructor
+
+        @param fi_cache: tamanho do cache de new_coord (0 = sem cache)
+        @param fv_frd_exact: coordenadas distância/radial pela geodésica exata (Vincenty, iterativa)
+                             em vez da fórmula fechada (coord_geodesic.destination)
         """
         # init super class
         super(CCoordSys, self).__init__(ff_ref_lat, ff_ref_lng, ff_dcl_mag)
@@ -70,17 +90,47 @@ class CCoordSys(model.CCoordModel):
         self.__nt_ref = CREF(lat=ff_ref_lat, lng=ff_ref_lng, decl_mag=ff_dcl_mag)
         assert self.__nt_ref
 
-        # coordenadas de referência
-        cdefs.M_REF_LAT = ff_ref_lat
-        cdefs.M_REF_LNG = ff_ref_lng
-        cdefs.M_DCL_MAG = ff_dcl_mag
+        # referencial pré-calculado (recriado apenas quando a referência muda). As conversões
+        # usam a referência da instância, nunca os globais de coord_defs
+        self.__ref_frame = cref.CReferenceFrame.from_model(self)
 
         # dicionário de fixos
         self.__dct_fix = None
 
+        # índice espacial de fixos (criado na primeira consulta)
+        self.__fix_idx = None
+
+        # tabela compilada de fixos e indicativos (criada na primeira consulta)
+        self.__fix_tab = None
+
         # dicionário de indicativos
         self.__dct_fix_indc = None
 
+        # coordenadas (x, y, z) dos fixos: tabela e referencial com que foram calculadas
+        self.__t_fix_xyz = None
+
+        # dicionários de um instantâneo carregado (recriados no primeiro acesso)
+        self.__t_snap_dct = None
+
+        # versão dos fixos e indicativos: incrementada a cada alteração, invalida a tabela
+        # compilada e o cache de new_coord
+        self.__i_fix_ver = 0
+
+        # cache LRU de new_coord e referência / versão dos fixos com que foi preenchido
+        self.__cache = ccache.CLRUCache(fi_cache) if fi_cache > 0 else None
+        self.__t_cache_ref = None
+
+        # coordenadas distância/radial pela geodésica exata ?
+        self.__v_frd_exact = bool(fv_frd_exact)
+
+    # ---------------------------------------------------------------------------------------------
+    def __clear_cache(self):
+        """
+        esvazia o cache de new_coord (fixos ou referência alterados)
+        """
+        if self.__cache is not None:
+            self.__cache.clear()
+
     # ---------------------------------------------------------------------------------------------
     def decl_xyz(self, ff_x, ff_y, ff_z, ff_decl=0.):
         """
@@ -89,6 +139,46 @@ class CCoordSys(model.CCoordModel):
         # retorna a coordenada declinada x, y z
         return geog.decl_xyz(ff_x, ff_y, ff_z, ff_decl)
 
+    # ---------------------------------------------------------------------------------------------
+    def decl_xyz_vec(self, fa_x, fa_y, fa_z, ff_decl=0., ft_out=None):
+        """
+        declinação em lote de coordenadas (x, y, z)
+        """
+        # retorna as coordenadas declinadas x, y z
+        return geog.decl_xyz_vec(fa_x, fa_y, fa_z, ff_decl, ft_out)
+
+    # ---------------------------------------------------------------------------------------------
+    def del_fix(self, fs_fix):
+        """
+        remove um fixo do dicionário de fixos, atualizando o índice espacial
+
+        @param fs_fix: fixo
+        """
+        # dicionários de um instantâneo ?
+        self.__load_snap_dct()
+
+        # remove do dicionário
+        if self.__dct_fix is not None:
+            self.__dct_fix.pop(fs_fix, None)
+
+        # atualiza o índice (incremental)
+        if self.__fix_idx is not None:
+            self.__fix_idx.remove(fs_fix)
+
+        # a tabela compilada é recriada na próxima consulta
+        self.__fix_changed()
+
+    # ---------------------------------------------------------------------------------------------
+    def __fix_changed(self):
+        """
+        registra uma alteração dos fixos ou indicativos: nova versão, tabela compilada recriada na
+        próxima consulta e cache de new_coord esvaziado
+        """
+        self.__i_fix_ver += 1
+
+        self.__fix_tab = None
+        self.__clear_cache()
+
     # ---------------------------------------------------------------------------------------------
     def from_dict(self, f_dict):
         """
@@ -112,19 +202,55 @@ class CCoordSys(model.CCoordModel):
         # retorna a coordenada em latitude e longitude
         return lf_lat, lf_lng
 
+    # ---------------------------------------------------------------------------------------------
+    def from_dict_vec(self, f_recs):
+        """
+        conversão em lote de registros de coordenadas em latitude e longitude
+
+        @param f_recs: iterável de dicionários (tipo, cpoA, ..., cpoD) ou tabela colunar (dicionário
+                       de colunas com as mesmas chaves)
+
+        @return arrays de lat, long e código de retorno (0 se Ok), na ordem de entrada
+        """
+        # tabela colunar ?
+        if isinstance(f_recs, dict):
+            # colunas
+            l_tipo = f_recs["tipo"]
+            l_cpo_a = f_recs["cpoA"]
+            l_cpo_b = f_recs.get("cpoB", None)
+            l_cpo_c = f_recs.get("cpoC", None)
+            l_cpo_d = f_recs.get("cpoD", None)
+
+        # senão, sequência de registros
+        else:
+            # transpõe os registros em colunas
+            llst_recs = list(f_recs)
+
+            l_tipo = [ldct_rec["tipo"] for ldct_rec in llst_recs]
+            l_cpo_a = [ldct_rec["cpoA"] for ldct_rec in llst_recs]
+            l_cpo_b = [ldct_rec.get("cpoB", None) for ldct_rec in llst_recs]
+            l_cpo_c = [ldct_rec.get("cpoC", None) for ldct_rec in llst_recs]
+            l_cpo_d = [ldct_rec.get("cpoD", None) for ldct_rec in llst_recs]
+
+        # coordenadas
+        la_rc, la_lat, la_lng = self.new_coord_vec(l_tipo, l_cpo_a, l_cpo_b, l_cpo_c, l_cpo_d)
+
+        # retorna as coordenadas em latitude e longitude
+        return la_lat, la_lng, la_rc
+
     # ---------------------------------------------------------------------------------------------
     def __geo_fixo(self, fs_cpo_a, f_dct_fix=None):
         """
         encontra coordenada geográfica do fixo
 
         @param fs_cpo_a: fixo
-        @param f_dct_fix: dicionário de fixos
+        @param f_dct_fix: dicionário de fixos (None usa a tabela compilada)
 
         @return 0 se Ok, senão -1 = NOk
         """
         if f_dct_fix is None:
-            # dicionário de fixos
-            f_dct_fix = self.__dct_fix
+            # tabela compilada de fixos
+            return self.fix_tab.geo(fs_cpo_a)
 
         # indicativo do fixo
         ls_fix = str(fs_cpo_a).strip().upper()
@@ -146,43 +272,141 @@ class CCoordSys(model.CCoordModel):
         return -1, 0., 0.
 
     # ---------------------------------------------------------------------------------------------
-    def geo2xyz(self, f_lat, f_lng, f_alt=0.):
+    def __geo_fixo_vec(self, fa_cpo_a):
+        """
+        encontra as coordenadas geográficas de vários fixos, consultando cada fixo distinto uma
+        única vez
+
+        @param fa_cpo_a: array de fixos
+
+        @return arrays de código de retorno (0 se Ok, senão -1), lat e lng
+        """
+        # consulta a tabela compilada de fixos
+        return self.fix_tab.geo_vec(fa_cpo_a)
+
+    # ---------------------------------------------------------------------------------------------
+    def geo2xyz(self, f_lat, f_lng, f_alt=0., f_ref=None):
         """
         conversão de coordenadas geográficas em (x, y, z)
         """
         # retorna a coordenada em x, y z
         # return geog.geo2xyz(f_lat, f_lng, self.__nt_ref.lat, self.__nt_ref.lng)
         # return geod.geod2ecef(f_lat, f_lng, f_alt)
-        return geog.geo2xyz_3(f_lat, f_lng, f_alt)
+        return geog.geo2xyz_3(f_lat, f_lng, f_alt, self.ref_frame if f_ref is None else f_ref)
 
     # ---------------------------------------------------------------------------------------------
-    def __get_fixo_by_indc(self, fs_cpo_a, f_dct_fix_indc=None):
+    def geo2xyz_vec(self, fa_lat, fa_lng, fa_alt=0., f_ref=None):
         """
-        encontra o número do fixo pelo indicativo
+        conversão em lote de coordenadas geográficas em (x, y, z)
+        """
+        # retorna as coordenadas em x, y z
+        return geog.geo2xyz_3_vec(fa_lat, fa_lng, fa_alt, self.ref_frame if f_ref is None else f_ref)
+
+    # ---------------------------------------------------------------------------------------------
+    @classmethod
+    def load_snapshot(cls, fs_path, fi_cache=0, fv_check=True):
+        """
+        cria um sistema de coordenadas a partir de um instantâneo (ver save_snapshot). A tabela
+        compilada, o índice espacial e as coordenadas (x, y, z) dos fixos usam os arrays mapeados
+        do arquivo, sem recompilação. Os dicionários de fixos e de indicativos são recriados no
+        primeiro acesso (fixos como coord_snap.CFIX, chaves como texto)
 
-        @param fs_cpo_a: indicativo do fixo
-        @param f_dct_fix_indc: dicionário de indicativos de fixos
+        @param fs_path: arquivo
+        @param fi_cache: tamanho do cache de new_coord (0 = sem cache)
+        @param fv_check: verifica o checksum (coord_snap.CSnapshotError se inválido)
 
-        @return número do fixo ou -1
+        @return sistema de coordenadas
         """
-        # check input
-        assert fs_cpo_a
+        # carrega o instantâneo
+        ldct_scl, ldct_sec = snap.load(fs_path, fv_check)
 
-        if f_dct_fix_indc is None:
-            # dicionário de indicativos
-            f_dct_fix_indc = self.__dct_fix_indc
+        l_sys = cls(ldct_scl["f_ref_lat"], ldct_scl["f_ref_lng"], ldct_scl["f_dcl_mag"], fi_cache,
+                    ldct_scl.get("v_frd_exact", False))
 
-        # verifica condições de execução
-        assert f_dct_fix_indc is not None
-        
-        # indicativo do fixo
-        ls_fix = str(fs_cpo_a).strip().upper()
+        # tabela compilada
+        l_sys.__fix_tab = ftab.CFixTable.from_state({ls_key: ldct_sec["tab_" + ls_key]
+                                                     for ls_key in ("fix_keys", "fix_rows", "indc_keys", "indc_rows",
+                                                                    "a_lat", "a_lng", "a_ok")})
+
+        # índice espacial
+        l_sys.__fix_idx = fidx.CFixIndex.from_state({"f_cel": ldct_scl["idx_f_cel"],
+                                                     "i_ncel": ldct_scl["idx_i_ncel"],
+                                                     "lst_nam": ldct_sec["idx_lst_nam"],
+                                                     "a_xyz": ldct_sec["idx_a_xyz"],
+                                                     "a_srt": ldct_sec["idx_a_srt"],
+                                                     "a_key": ldct_sec["idx_a_key"],
+                                                     "a_ini": ldct_sec["idx_a_ini"]})
+
+        # coordenadas (x, y, z) dos fixos
+        l_sys.__t_fix_xyz = (l_sys.__fix_tab, l_sys.ref_frame,
+                             (ldct_sec["xyz_x"], ldct_sec["xyz_y"], ldct_sec["xyz_z"]))
+
+        # dicionários (recriados no primeiro acesso)
+        l_sys.__t_snap_dct = (ldct_sec["dct_fix_keys"], ldct_sec["dct_indc_keys"], ldct_sec["dct_indc_vals"])
+
+        # logger
+        M_LOG.debug("load_snapshot: {} fixo(s) de {}.".format(len(ldct_sec["dct_fix_keys"]), fs_path))
 
         # return
-        return f_dct_fix_indc.get(ls_fix, -1)
+        return l_sys
+
+    # ---------------------------------------------------------------------------------------------
+    def __load_snap_dct(self):
+        """
+        recria os dicionários de fixos e de indicativos de um instantâneo carregado
+        """
+        # nada pendente ?
+        if self.__t_snap_dct is None:
+            return
+
+        llst_fix, llst_indc, llst_num = self.__t_snap_dct
+        self.__t_snap_dct = None
+
+        l_tab = self.__fix_tab
+
+        # fixos (na ordem das linhas da tabela; a tabela guarda as coordenadas também dos inválidos)
+        la_ok, la_lat, la_lng = l_tab.a_ok.tolist(), l_tab.a_lat.tolist(), l_tab.a_lng.tolist()
+
+        self.__dct_fix = {ls_fix: snap.CFIX(la_ok[li_row], la_lat[li_row], la_lng[li_row])
+                          for li_row, ls_fix in enumerate(llst_fix)}
+
+        # indicativos
+        self.__dct_fix_indc = dict(zip(llst_indc, llst_num))
 
     # ---------------------------------------------------------------------------------------------
     def new_coord(self, fc_tipo, fs_cpo_a, fs_cpo_b="", fs_cpo_c="", fs_cpo_d=""):
+        """
+        cria uma coordenada, consultando o cache (se houver)
+        """
+        # sem cache ?
+        if self.__cache is None:
+            return self.__new_coord(fc_tipo, fs_cpo_a, fs_cpo_b, fs_cpo_c, fs_cpo_d)
+
+        # referência ou fixos alterados desde o preenchimento do cache ?
+        lt_ref = (self.f_ref_lat, self.f_ref_lng, self.__nt_ref, self.__i_fix_ver)
+
+        if lt_ref != self.__t_cache_ref:
+            # esvazia o cache
+            self.__cache.clear()
+            self.__t_cache_ref = lt_ref
+
+        # coordenada no cache ?
+        lt_key = (fc_tipo, fs_cpo_a, fs_cpo_b, fs_cpo_c, fs_cpo_d)
+        lt_coord = self.__cache.get(lt_key)
+
+        if lt_coord is None:
+            # cria a coordenada
+            lt_coord = self.__new_coord(fc_tipo, fs_cpo_a, fs_cpo_b, fs_cpo_c, fs_cpo_d)
+
+            # salva apenas coordenadas válidas (as inválidas continuam gerando log)
+            if 0 == lt_coord[0]:
+                self.__cache.put(lt_key, lt_coord)
+
+        # return
+        return lt_coord
+
+    # ---------------------------------------------------------------------------------------------
+    def __new_coord(self, fc_tipo, fs_cpo_a, fs_cpo_b="", fs_cpo_c="", fs_cpo_d=""):
         """
         cria uma coordenada
         """
@@ -216,21 +440,13 @@ class CCoordSys(model.CCoordModel):
                 # cai fora
                 return li_rc, lf_lat, lf_lng
 
-            # converte para cartesiana
-            lf_x, lf_y, _ = self.geo2xyz(lf_lat, lf_lng)
-
-            # distância(m)
-            l_vd = float(fs_cpo_b) * cdefs.D_CNV_NM2M
+            # ponto a partir do fixo: radial(graus) e distância(NM), pela geodésica exata ?
+            if self.__v_frd_exact:
+                lf_lat, lf_lng, _ = gdsc.direct(lf_lat, lf_lng, float(fs_cpo_c), float(fs_cpo_b))
 
-            # radial(radianos)
-            l_vr = math.radians(conv.azm2ang(float(fs_cpo_c)))
-
-            # x, y do ponto
-            lf_x += l_vd * math.cos(l_vr)
-            lf_y += l_vd * math.sin(l_vr)
-
-            # converte para geográfica
-            lf_lat, lf_lng, _ = self.xyz2geo(lf_x, lf_y)
+            # senão, pela fórmula fechada
+            else:
+                lf_lat, lf_lng = gdsc.destination(lf_lat, lf_lng, float(fs_cpo_c), float(fs_cpo_b))
 
             # ok
             return li_rc, lf_lat, lf_lng
@@ -262,10 +478,13 @@ class CCoordSys(model.CCoordModel):
 
         # coordenada indicativo de fixo
         elif 'I' == fc_tipo:
-            # obtém o número do fixo pelo indicativo
-            li_rc = self.__get_fixo_by_indc(fs_cpo_a)
-            
-            if li_rc < 0:
+            # check input
+            assert fs_cpo_a
+
+            # obtém a linha do fixo pelo indicativo
+            li_row = self.fix_tab.row_indc(fs_cpo_a)
+
+            if ftab.M_ROW_NO_INDC == li_row:
                 # logger
                 l_log = logging.getLogger("CCoordSys::new_coord")
                 l_log.setLevel(logging.ERROR)
@@ -275,7 +494,7 @@ class CCoordSys(model.CCoordModel):
                 return -1, -90., -180.
 
             # obtém as coordenadas geográficas do indicativo do fixo
-            li_rc, lf_lat, lf_lng = self.__geo_fixo(li_rc)
+            li_rc, lf_lat, lf_lng = self.fix_tab.geo_row(li_row)
 
             if li_rc < 0:
                 # logger
@@ -342,48 +561,428 @@ class CCoordSys(model.CCoordModel):
         return -1, -90., -180.
 
     # ---------------------------------------------------------------------------------------------
-    def xyz2geo(self, ff_x, ff_y, ff_z=0.):
+    def new_coord_frd_vec(self, fs_fix, fa_rad, fa_dst):
+        """
+        cria coordenadas distância/radial (tipo 'D') em lote em torno de um único fixo. O fixo é
+        consultado uma só vez e os seus termos são pré-calculados (CGeodesicOrigin)
+
+        @param fs_fix: fixo
+        @param fa_rad: radiais (azimutes verdadeiros) em graus
+        @param fa_dst: distâncias em NM
+
+        @return código de retorno (0 se Ok) e arrays de lat e lng
+        """
+        # obtém as coordenadas geográficas do fixo
+        li_rc, lf_lat, lf_lng = self.__geo_fixo(fs_fix)
+
+        if 0 != li_rc:
+            # logger
+            M_LOG.error(u"<E02: fixo {} inexistente.".format(fs_fix))
+
+            # cai fora
+            return li_rc, None, None
+
+        l_org = gdsc.CGeodesicOrigin(lf_lat, lf_lng)
+
+        # pontos a partir do fixo, pela geodésica exata ?
+        if self.__v_frd_exact:
+            la_lat, la_lng, _ = l_org.direct_vec(fa_rad, fa_dst)
+
+        # senão, pela fórmula fechada
+        else:
+            la_lat, la_lng = l_org.destination_vec(fa_rad, fa_dst)
+
+        # return
+        return 0, la_lat, la_lng
+
+    # ---------------------------------------------------------------------------------------------
+    def new_coord_vec(self, fa_tipo, fa_cpo_a, fa_cpo_b=None, fa_cpo_c=None, fa_cpo_d=None):
+        """
+        cria coordenadas em lote. Os registros são agrupados por tipo e cada grupo é convertido
+        de uma só vez
+
+        @param fa_tipo: coluna de tipos de coordenada
+        @param fa_cpo_a: coluna do campo A
+        @param fa_cpo_b: coluna do campo B
+        @param fa_cpo_c: coluna do campo C
+        @param fa_cpo_d: coluna do campo D (ignorada: nenhum tipo usa o campo D, aceita apenas pela
+                         simetria com new_coord)
+
+        @return arrays de código de retorno (0 se Ok), lat e lng, na ordem de entrada
+        """
+        # colunas
+        la_tipo = np.asarray(fa_tipo, dtype=object)
+        la_cpo_a = np.asarray(fa_cpo_a, dtype=object)
+        la_cpo_b = np.asarray(fa_cpo_b if fa_cpo_b is not None else [None] * len(la_tipo), dtype=object)
+        la_cpo_c = np.asarray(fa_cpo_c if fa_cpo_c is not None else [None] * len(la_tipo), dtype=object)
+
+        # inicia os valores de resposta (inválidos)
+        la_rc = np.full(len(la_tipo), -1, dtype=np.int64)
+        la_lat = np.full(len(la_tipo), -90., dtype=np.float64)
+        la_lng = np.full(len(la_tipo), -180., dtype=np.float64)
+
+        # tipos inválidos
+        lv_tipo = np.isin(la_tipo, cdefs.D_SET_COORD_VALIDAS)
+
+        if not lv_tipo.all():
+            # logger
+            M_LOG.critical(u"<E01: {} tipo(s) de coordenada inválido(s).".format(np.count_nonzero(~lv_tipo)))
+
+        # coordenada distância/radial
+        la_idx = np.flatnonzero('D' == la_tipo)
+
+        if la_idx.size > 0:
+            # obtém as coordenadas geográficas dos fixos(cpoA)
+            la_rc_g, la_lat_g, la_lng_g = self.__geo_fixo_vec(la_cpo_a[la_idx])
+
+            # distância(NM) e radial(graus)
+            la_vd, lv_vd = self.__to_float_vec(la_cpo_b[la_idx])
+            la_vr, lv_vr = self.__to_float_vec(la_cpo_c[la_idx])
+
+            lv_ok = (0 == la_rc_g) & lv_vd & lv_vr
+
+            if not lv_ok.all():
+                # logger
+                M_LOG.error(u"<E02: {} coordenada(s) D inválida(s).".format(np.count_nonzero(~lv_ok)))
+
+            la_idx = la_idx[lv_ok]
+
+            # pontos a partir dos fixos: radial(graus) e distância(NM), pela geodésica exata ?
+            if self.__v_frd_exact:
+                la_lat[la_idx], la_lng[la_idx], _ = gdsc.direct_vec(la_lat_g[lv_ok], la_lng_g[lv_ok], la_vr[lv_ok],
+                                                                    la_vd[lv_ok])
+
+            # senão, pela fórmula fechada
+            else:
+                la_lat[la_idx], la_lng[la_idx] = gdsc.destination_vec(la_lat_g[lv_ok], la_lng_g[lv_ok], la_vr[lv_ok],
+                                                                      la_vd[lv_ok])
+            la_rc[la_idx] = 0
+
+        # coordenada fixo
+        la_idx = np.flatnonzero('F' == la_tipo)
+
+        if la_idx.size > 0:
+            # obtém as coordenadas geográficas dos fixos(cpoA)
+            la_rc[la_idx], la_lat[la_idx], la_lng[la_idx] = self.__geo_fixo_vec(la_cpo_a[la_idx])
+
+            if (la_rc[la_idx] != 0).any():
+                # logger
+                M_LOG.error(u"<E03: {} fixo(s) inexistente(s).".format(np.count_nonzero(la_rc[la_idx])))
+
+        # coordenada geográfica formato ICA ?(formato GGGMM.mmmH)
+        la_idx = np.flatnonzero('G' == la_tipo)
+
+        if la_idx.size > 0:
+            # latitude e longitude
+            la_lat_g, lv_lat = conv.parse_ica_vec(la_cpo_a[la_idx])
+            la_lng_g, lv_lng = conv.parse_ica_vec(la_cpo_b[la_idx])
+
+            lv_ok = lv_lat & lv_lng
+            la_idx = la_idx[lv_ok]
+
+            la_rc[la_idx], la_lat[la_idx], la_lng[la_idx] = 0, la_lat_g[lv_ok], la_lng_g[lv_ok]
+
+        # coordenada indicativo de fixo
+        la_idx = np.flatnonzero('I' == la_tipo)
+
+        if la_idx.size > 0:
+            # obtém as linhas dos fixos pelos indicativos
+            la_row = self.fix_tab.rows_indc_vec(la_cpo_a[la_idx])
+
+            lv_ok = ftab.M_ROW_NO_INDC != la_row
+            la_idx = la_idx[lv_ok]
+
+            # obtém as coordenadas geográficas dos indicativos dos fixos
+            la_rc[la_idx], la_lat[la_idx], la_lng[la_idx] = self.fix_tab.geo_rows_vec(la_row[lv_ok])
+
+            if (~lv_ok).any() or (la_rc[la_idx] != 0).any():
+                # logger
+                M_LOG.error(u"<E04: {} indicativo(s) de fixo inexistente(s).".format(
+                            np.count_nonzero(~lv_ok) + np.count_nonzero(la_rc[la_idx])))
+
+        # coordenada geográfica formato AISWEB ?(formato X:999:99:99.99)
+        la_idx = np.flatnonzero('K' == la_tipo)
+
+        if la_idx.size > 0:
+            # latitude e longitude
+            la_lat_g, lv_lat = conv.parse_aisweb_vec(la_cpo_a[la_idx])
+            la_lng_g, lv_lng = conv.parse_aisweb_vec(la_cpo_b[la_idx])
+
+            lv_ok = lv_lat & lv_lng
+            la_idx = la_idx[lv_ok]
+
+            la_rc[la_idx], la_lat[la_idx], la_lng[la_idx] = 0, la_lat_g[lv_ok], la_lng_g[lv_ok]
+
+        # coordenada geográfica formato decimal ?(formato +/-999.9999)
+        la_idx = np.flatnonzero('L' == la_tipo)
+
+        if la_idx.size > 0:
+            # latitude e longitude
+            la_lat_g, lv_lat = self.__to_float_vec(la_cpo_a[la_idx])
+            la_lng_g, lv_lng = self.__to_float_vec(la_cpo_b[la_idx])
+
+            lv_ok = lv_lat & lv_lng
+            la_idx = la_idx[lv_ok]
+
+            la_rc[la_idx], la_lat[la_idx], la_lng[la_idx] = 0, la_lat_g[lv_ok], la_lng_g[lv_ok]
+
+        # coordenadas polar ('P') e desconhecida ('X') permanecem inválidas
+
+        # return
+        return la_rc, la_lat, la_lng
+
+    # ---------------------------------------------------------------------------------------------
+    def rebuild_fix(self):
+        """
+        recria a tabela compilada e o índice espacial de fixos (após alterar os próprios objetos
+        dos fixos, cujos atributos não são monitorados)
+        """
+        # dicionários de um instantâneo ?
+        self.__load_snap_dct()
+
+        # nova versão dos fixos (invalida o cache de new_coord)
+        self.__fix_changed()
+
+        self.__fix_tab = ftab.CFixTable(self.__dct_fix, self.__dct_fix_indc)
+        self.__fix_idx = fidx.CFixIndex(self.__dct_fix)
+
+    # ---------------------------------------------------------------------------------------------
+    def save_snapshot(self, fs_path):
+        """
+        salva um instantâneo binário (ver coord_snap) com a referência, o modo das coordenadas
+        distância/radial (v_frd_exact), a tabela compilada de fixos, o índice espacial e as
+        coordenadas (x, y, z) dos fixos. As chaves dos dicionários
+        são salvas como texto
+
+        @param fs_path: arquivo
+        """
+        # estados (compila o que ainda não foi compilado)
+        ldct_tab = self.fix_tab.to_state()
+        ldct_idx = self.fix_idx.to_state()
+
+        la_x, la_y, la_z = self.fix_xyz
+
+        ldct_fix_indc = self.dct_fix_indc or {}
+
+        # escalares
+        ldct_scl = {"f_ref_lat": self.f_ref_lat,
+                    "f_ref_lng": self.f_ref_lng,
+                    "f_dcl_mag": self.f_dcl_mag,
+                    "v_frd_exact": self.__v_frd_exact,
+                    "idx_f_cel": ldct_idx["f_cel"],
+                    "idx_i_ncel": ldct_idx["i_ncel"]}
+
+        # seções
+        ldct_sec = {"tab_" + ls_key: l_val for ls_key, l_val in ldct_tab.items()}
+        ldct_sec.update(("idx_" + ls_key, ldct_idx[ls_key]) for ls_key in ("lst_nam", "a_xyz", "a_srt", "a_key", "a_ini"))
+
+        ldct_sec["xyz_x"], ldct_sec["xyz_y"], ldct_sec["xyz_z"] = la_x, la_y, la_z
+
+        ldct_sec["dct_fix_keys"] = [str(l_key) for l_key in (self.dct_fix or {})]
+        ldct_sec["dct_indc_keys"] = [str(l_key) for l_key in ldct_fix_indc]
+        ldct_sec["dct_indc_vals"] = [str(l_val) for l_val in ldct_fix_indc.values()]
+
+        # salva
+        snap.save(fs_path, ldct_scl, ldct_sec)
+
+    # ---------------------------------------------------------------------------------------------
+    def set_fix(self, fs_fix, f_fix):
+        """
+        inclui ou substitui um fixo no dicionário de fixos, atualizando o índice espacial
+
+        @param fs_fix: fixo
+        @param f_fix: dados do fixo (v_fix_ok, f_fix_lat e f_fix_lng)
+        """
+        # dicionários de um instantâneo ?
+        self.__load_snap_dct()
+
+        # dicionário de fixos inexistente ?
+        if self.__dct_fix is None:
+            self.__dct_fix = {}
+
+        # salva no dicionário
+        self.__dct_fix[fs_fix] = f_fix
+
+        # atualiza o índice (incremental)
+        if self.__fix_idx is not None:
+            self.__fix_idx.update(fs_fix, f_fix)
+
+        # a tabela compilada é recriada na próxima consulta
+        self.__fix_changed()
+
+    # ---------------------------------------------------------------------------------------------
+    def __to_float_vec(self, fa_col):
+        """
+        converte uma coluna para float
+
+        @param fa_col: coluna (array de objetos)
+
+        @return valores (NaN se inválido) e máscara de validade
+        """
+        # caminho rápido: toda a coluna é numérica
+        try:
+            la_val = np.asarray(fa_col).astype(np.float64)
+
+        # senão, converte elemento a elemento
+        except (TypeError, ValueError):
+            la_val = np.full(len(fa_col), np.nan, dtype=np.float64)
+
+            for li_ndx, l_val in enumerate(fa_col):
+                try:
+                    la_val[li_ndx] = float(l_val)
+
+                except (TypeError, ValueError):
+                    pass
+
+        # return
+        return la_val, ~np.isnan(la_val)
+
+    # ---------------------------------------------------------------------------------------------
+    def xyz2geo(self, ff_x, ff_y, ff_z=0., f_ref=None):
         """
         conversão de coordenadas geográficas em (x, y, z)
         """
         # retorna a coordenada em latitude e longitude
         # return geog.xy2geo(ff_x, ff_y)
         # return geod.ecef2geod(ff_x, ff_y, ff_z)
-        return geog.xyz2geo_3(ff_x, ff_y, ff_z)
+        return geog.xyz2geo_3(ff_x, ff_y, ff_z, self.ref_frame if f_ref is None else f_ref)
+
+    # ---------------------------------------------------------------------------------------------
+    def xyz2geo_vec(self, fa_x, fa_y, fa_z=0., f_ref=None):
+        """
+        conversão em lote de coordenadas (x, y, z) em geográficas
+        """
+        # retorna as coordenadas em latitude e longitude
+        return geog.xyz2geo_3_vec(fa_x, fa_y, fa_z, self.ref_frame if f_ref is None else f_ref)
 
     # =============================================================================================
     # data
     # =============================================================================================
 
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def cache(self):
+        """
+        get cache de new_coord (None se desabilitado)
+        """
+        return self.__cache
+
     # ---------------------------------------------------------------------------------------------
     @property
     def dct_fix(self):
         """
-        get dicionário de fixos
+        get dicionário de fixos (somente leitura). A tabela compilada, o índice espacial e o cache
+        de new_coord são atualizados apenas por dct_fix = ..., set_fix, del_fix e rebuild_fix; por
+        isso o dicionário devolvido não aceita alterações (TypeError)
         """
-        return self.__dct_fix
+        # dicionários de um instantâneo ?
+        self.__load_snap_dct()
+
+        # return
+        return None if self.__dct_fix is None else types.MappingProxyType(self.__dct_fix)
 
     @dct_fix.setter
     def dct_fix(self, f_val):
         """
-        set dicionário de fixos
+        set dicionário de fixos. O dicionário é copiado: alterações posteriores no dicionário
+        original não afetam o sistema (use set_fix / del_fix)
         """
-        self.__dct_fix = f_val
+        # dicionários de um instantâneo ? (preserva o de indicativos)
+        self.__load_snap_dct()
+
+        self.__dct_fix = None if f_val is None else dict(f_val)
+
+        # invalida o índice espacial, a tabela compilada e o cache
+        self.__fix_idx = None
+        self.__fix_changed()
 
     # ---------------------------------------------------------------------------------------------
     @property
     def dct_fix_indc(self):
         """
-        get dicionário de indicativos
+        get dicionário de indicativos (somente leitura). A tabela compilada e o cache de new_coord
+        são atualizados apenas por dct_fix_indc = ...; por isso o dicionário devolvido não aceita
+        alterações (TypeError)
         """
-        return self.__dct_fix_indc
+        # dicionários de um instantâneo ?
+        self.__load_snap_dct()
+
+        # return
+        return None if self.__dct_fix_indc is None else types.MappingProxyType(self.__dct_fix_indc)
 
     @dct_fix_indc.setter
     def dct_fix_indc(self, f_val):
         """
-        set dicionário de indicativos
+        set dicionário de indicativos. O dicionário é copiado: alterações posteriores no
+        dicionário original não afetam o sistema (atribua um novo dicionário)
+        """
+        # dicionários de um instantâneo ? (preserva o de fixos)
+        self.__load_snap_dct()
+
+        self.__dct_fix_indc = None if f_val is None else dict(f_val)
+
+        # invalida a tabela compilada e o cache
+        self.__fix_changed()
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def fix_idx(self):
+        """
+        get índice espacial de fixos (montado na primeira consulta)
+        """
+        # índice inexistente ?
+        if self.__fix_idx is None:
+            self.__fix_idx = fidx.CFixIndex(self.__dct_fix)
+
+        # return
+        return self.__fix_idx
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def fix_tab(self):
+        """
+        get tabela compilada de fixos e indicativos (montada na primeira consulta)
         """
-        self.__dct_fix_indc = f_val
+        # tabela inexistente ?
+        if self.__fix_tab is None:
+            self.__fix_tab = ftab.CFixTable(self.__dct_fix, self.__dct_fix_indc)
+
+        # return
+        return self.__fix_tab
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def fix_xyz(self):
+        """
+        get coordenadas (x, y, z) dos fixos em relação à referência, por linha da tabela compilada
+        (NaN se fixo inválido). Recalculadas se a tabela ou a referência mudaram
+        """
+        l_tab = self.fix_tab
+        l_ref = self.ref_frame
+
+        # coordenadas inexistentes ou desatualizadas ?
+        if (self.__t_fix_xyz is None) or (self.__t_fix_xyz[0] is not l_tab) or (self.__t_fix_xyz[1] is not l_ref):
+            la_x = np.full(len(l_tab.a_ok), np.nan)
+            la_y = np.full(len(l_tab.a_ok), np.nan)
+            la_z = np.full(len(l_tab.a_ok), np.nan)
+
+            # fixos válidos
+            lv_ok = l_tab.a_ok
+
+            la_x[lv_ok], la_y[lv_ok], la_z[lv_ok] = self.geo2xyz_vec(l_tab.a_lat[lv_ok], l_tab.a_lng[lv_ok], 0., l_ref)
+
+            self.__t_fix_xyz = (l_tab, l_ref, (la_x, la_y, la_z))
+
+        # return
+        return self.__t_fix_xyz[2]
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def i_fix_ver(self):
+        """
+        get versão dos fixos e indicativos (incrementada a cada alteração)
+        """
+        return self.__i_fix_ver
 
     # ---------------------------------------------------------------------------------------------
     @property
@@ -400,4 +999,38 @@ class CCoordSys(model.CCoordModel):
         """
         self.__nt_ref = f_val
 
+        # esvazia o cache
+        self.__clear_cache()
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def ref_frame(self):
+        """
+        get referencial pré-calculado (recriado apenas se a referência mudou)
+        """
+        # referência alterada ?
+        if not self.__ref_frame.matches(self.f_ref_lat, self.f_ref_lng, self.f_dcl_mag):
+            self.__ref_frame = cref.CReferenceFrame.from_model(self)
+
+        # return
+        return self.__ref_frame
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def v_frd_exact(self):
+        """
+        get coordenadas distância/radial pela geodésica exata (Vincenty) ?
+        """
+        return self.__v_frd_exact
+
+    @v_frd_exact.setter
+    def v_frd_exact(self, f_val):
+        """
+        set coordenadas distância/radial pela geodésica exata (Vincenty) ?
+        """
+        self.__v_frd_exact = bool(f_val)
+
+        # esvazia o cache
+        self.__clear_cache()
+
 # < the end >--------------------------------------------------------------------------------------
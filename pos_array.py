@@ -0,0 +1,438 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+pos_array
+
+containers de posições (lat/lng ou x/y) armazenadas em colunas contíguas (float64)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+revision 0.1  2026/out  mlabru
+initial release (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import abc
+
+# numpy
+import numpy as np
+
+import pos_lat_lng as plat
+import pos_xy as pxy
+
+# < module data >----------------------------------------------------------------------------------
+
+# capacidade inicial de um container vazio
+M_CAP_INI = 16
+
+# < class CPosArray >------------------------------------------------------------------------------
+
+class CPosArray(object, metaclass=abc.ABCMeta):
+    """
+    container de N posições em 3 colunas float64 contíguas (struct-of-arrays)
+    """
+    # ---------------------------------------------------------------------------------------------
+    def __init__(self, fa_c0=None, fa_c1=None, fa_c2=0., fv_copy=True):
+        """
+        constructor
+
+        @param fa_c0: primeira coluna (lat ou x)
+        @param fa_c1: segunda coluna (lng ou y)
+        @param fa_c2: terceira coluna (alt ou z), array ou escalar
+        @param fv_copy: copia os dados (se False, usa as colunas sem cópia sempre que possível)
+        """
+        # inicia a super classe
+        super(CPosArray, self).__init__()
+
+        # buffer próprio (3 x capacidade) ou colunas externas
+        self.__a_buf = None
+        self.__lst_col = None
+
+        # container vazio ?
+        if fa_c0 is None:
+            self.__a_buf = np.zeros((3, M_CAP_INI), dtype=np.float64)
+            self.__i_len = 0
+
+        # senão, cria a partir das colunas
+        else:
+            la_c0 = np.asarray(fa_c0, dtype=np.float64).reshape(-1)
+            la_c1 = np.asarray(fa_c1, dtype=np.float64).reshape(-1)
+            la_c2 = np.asarray(fa_c2, dtype=np.float64)
+
+            # expande a terceira coluna (escalar), mantendo uma coluna completa como view gravável
+            if la_c2.shape != la_c0.shape:
+                la_c2 = np.broadcast_to(la_c2, la_c0.shape)
+
+            assert la_c0.shape == la_c1.shape
+
+            self.__i_len = len(la_c0)
+
+            if fv_copy:
+                # copia as colunas para o buffer
+                self.__a_buf = np.stack((la_c0, la_c1, la_c2))
+
+            else:
+                # usa as próprias colunas (views)
+                self.__lst_col = [la_c0, la_c1, np.ascontiguousarray(la_c2)]
+
+    # ---------------------------------------------------------------------------------------------
+    def __getitem__(self, f_key):
+        """
+        obtém uma posição (proxy) ou um novo container com as posições selecionadas (views das
+        colunas para fatias simples)
+        """
+        # índice inteiro ?
+        if isinstance(f_key, (int, np.integer)):
+            # índice negativo
+            if f_key < 0:
+                f_key += self.__i_len
+
+            if not 0 <= f_key < self.__i_len:
+                raise IndexError(f_key)
+
+            # return
+            return self._new_proxy(int(f_key))
+
+        # fatia ou máscara/índices
+        la_c0, la_c1, la_c2 = self.cols
+
+        # return
+        return self.__class__(la_c0[f_key], la_c1[f_key], la_c2[f_key], fv_copy=False)
+
+    # ---------------------------------------------------------------------------------------------
+    def __iter__(self):
+        """
+        itera sobre as posições (proxies)
+        """
+        for li_ndx in range(self.__i_len):
+            yield self._new_proxy(li_ndx)
+
+    # ---------------------------------------------------------------------------------------------
+    def __len__(self):
+        """
+        número de posições
+        """
+        return self.__i_len
+
+    # ---------------------------------------------------------------------------------------------
+    def append(self, ff_c0, ff_c1, ff_c2=0.):
+        """
+        acrescenta uma posição (crescimento amortizado)
+        """
+        # garante a capacidade
+        self.__reserve(self.__i_len + 1)
+
+        # salva a posição
+        self.__a_buf[:, self.__i_len] = (ff_c0, ff_c1, ff_c2)
+        self.__i_len += 1
+
+    # ---------------------------------------------------------------------------------------------
+    def extend(self, fa_c0, fa_c1, fa_c2=0.):
+        """
+        acrescenta várias posições (crescimento amortizado)
+        """
+        la_c0 = np.asarray(fa_c0, dtype=np.float64).reshape(-1)
+
+        # garante a capacidade
+        self.__reserve(self.__i_len + len(la_c0))
+
+        # salva as posições
+        li_fim = self.__i_len + len(la_c0)
+
+        self.__a_buf[0, self.__i_len:li_fim] = la_c0
+        self.__a_buf[1, self.__i_len:li_fim] = fa_c1
+        self.__a_buf[2, self.__i_len:li_fim] = fa_c2
+
+        self.__i_len = li_fim
+
+    # ---------------------------------------------------------------------------------------------
+    @abc.abstractmethod
+    def _new_proxy(self, fi_ndx):
+        """
+        cria o proxy da posição fi_ndx (CPosLatLngProxy ou CPosXYProxy, conforme a subclasse)
+        """
+
+    # ---------------------------------------------------------------------------------------------
+    def __reserve(self, fi_cap):
+        """
+        garante a capacidade do buffer, dobrando-o quando necessário
+        """
+        # container sem buffer próprio (colunas externas) ?
+        if self.__a_buf is None:
+            self.__a_buf = np.stack(self.__lst_col)
+            self.__lst_col = None
+
+        # capacidade suficiente ?
+        if fi_cap <= self.__a_buf.shape[1]:
+            return
+
+        # novo buffer
+        la_buf = np.zeros((3, max(fi_cap, 2 * self.__a_buf.shape[1], M_CAP_INI)), dtype=np.float64)
+        la_buf[:, :self.__i_len] = self.__a_buf[:, :self.__i_len]
+
+        self.__a_buf = la_buf
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def cols(self):
+        """
+        get colunas (views, sem cópia)
+        """
+        # colunas externas ?
+        if self.__a_buf is None:
+            return tuple(self.__lst_col)
+
+        # return
+        return self.__a_buf[0, :self.__i_len], self.__a_buf[1, :self.__i_len], self.__a_buf[2, :self.__i_len]
+
+# < class CPosLatLngArray >------------------------------------------------------------------------
+
+class CPosLatLngArray(CPosArray):
+    """
+    container de posições lat/lng/alt
+    """
+    # ---------------------------------------------------------------------------------------------
+    def _new_proxy(self, fi_ndx):
+        """
+        cria o proxy da posição fi_ndx
+        """
+        return CPosLatLngProxy(self, fi_ndx)
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def a_alt(self):
+        """
+        get altitudes
+        """
+        return self.cols[2]
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def a_lat(self):
+        """
+        get latitudes
+        """
+        return self.cols[0]
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def a_lng(self):
+        """
+        get longitudes
+        """
+        return self.cols[1]
+
+# < class CPosXYArray >----------------------------------------------------------------------------
+
+class CPosXYArray(CPosArray):
+    """
+    container de posições x/y/z
+    """
+    # ---------------------------------------------------------------------------------------------
+    def _new_proxy(self, fi_ndx):
+        """
+        cria o proxy da posição fi_ndx
+        """
+        return CPosXYProxy(self, fi_ndx)
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def a_x(self):
+        """
+        get coordenadas X
+        """
+        return self.cols[0]
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def a_y(self):
+        """
+        get coordenadas Y
+        """
+        return self.cols[1]
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def a_z(self):
+        """
+        get coordenadas Z
+        """
+        return self.cols[2]
+
+# < class CPosLatLngProxy >------------------------------------------------------------------------
+
+class CPosLatLngProxy(plat.CPosLatLng):
+    """
+    CPosLatLng que lê e escreve diretamente em uma posição de um CPosLatLngArray
+    """
+    # atributos (sem dicionário por instância)
+    __slots__ = ("__pos", "__ndx")
+
+    # ---------------------------------------------------------------------------------------------
+    def __init__(self, f_pos, fi_ndx):
+        """
+        constructor
+        """
+        # container e índice
+        self.__pos = f_pos
+        self.__ndx = fi_ndx
+
+    # ---------------------------------------------------------------------------------------------
+    def copy(self):
+        """
+        copy constructor (cópia desvinculada do container)
+        """
+        return plat.CPosLatLng.from_trusted(self.f_lat, self.f_lng)
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def f_lat(self):
+        """
+        get latitude
+        """
+        return float(self.__pos.cols[0][self.__ndx])
+
+    @f_lat.setter
+    def f_lat(self, f_val):
+        """
+        set latitude
+        """
+        # check input
+        assert -90. <= f_val <= 90.
+
+        # save latitude
+        self.__pos.cols[0][self.__ndx] = f_val
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def f_lng(self):
+        """
+        get longitude
+        """
+        return float(self.__pos.cols[1][self.__ndx])
+
+    @f_lng.setter
+    def f_lng(self, f_val):
+        """
+        set longitude
+        """
+        # check input
+        assert -180. <= f_val <= 180.
+
+        # save longitude
+        self.__pos.cols[1][self.__ndx] = f_val
+
+# < class CPosXYProxy >----------------------------------------------------------------------------
+
+class CPosXYProxy(pxy.CPosXY):
+    """
+    CPosXY que lê e escreve diretamente em uma posição de um CPosXYArray
+    """
+    # atributos (sem dicionário por instância)
+    __slots__ = ("__pos", "__ndx")
+
+    # ---------------------------------------------------------------------------------------------
+    def __init__(self, f_pos, fi_ndx):
+        """
+        constructor
+        """
+        # container e índice
+        self.__pos = f_pos
+        self.__ndx = fi_ndx
+
+    # ---------------------------------------------------------------------------------------------
+    def copy(self):
+        """
+        copy constructor (cópia desvinculada do container)
+        """
+        return pxy.CPosXY.from_trusted(self.f_x, self.f_y)
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def f_x(self):
+        """
+        get X
+        """
+        return float(self.__pos.cols[0][self.__ndx])
+
+    @f_x.setter
+    def f_x(self, f_val):
+        """
+        set X
+        """
+        self.__pos.cols[0][self.__ndx] = f_val
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def f_y(self):
+        """
+        get Y
+        """
+        return float(self.__pos.cols[1][self.__ndx])
+
+    @f_y.setter
+    def f_y(self, f_val):
+        """
+        set Y
+        """
+        self.__pos.cols[1][self.__ndx] = f_val
+
+# -------------------------------------------------------------------------------------------------
+def pos_cols(f_pos, fa_c1=None, fa_c2=0.):
+    """
+    obtém as colunas de um container de posições. Usada pelas funções em lote para aceitar tanto
+    um container quanto as colunas separadas
+
+    @param f_pos: container de posições (CPosArray), bloco em memória compartilhada (CPosShm) ou
+                  primeira coluna
+    @param fa_c1: segunda coluna (None se f_pos é um container)
+    @param fa_c2: terceira coluna
+
+    @return tupla com as três colunas
+    """
+    # container ? (duck typing: o módulo pode ser importado como pos_array ou libs.coords.pos_array,
+    # o que gera duas classes CPosArray distintas e invalida o isinstance)
+    if hasattr(f_pos, "cols"):
+        return f_pos.cols
+
+    # bloco em memória compartilhada ? (colunas são views do segmento)
+    if (fa_c1 is None) and hasattr(getattr(f_pos, "pos", None), "cols"):
+        return f_pos.pos.cols
+
+    # check input
+    assert fa_c1 is not None
+
+    # return
+    return f_pos, fa_c1, fa_c2
+
+# < the end >--------------------------------------------------------------------------------------
@@ -33,7 +33,7 @@ __date__ = "2016/01"
 # < imports >--------------------------------------------------------------------------------------
 
 # python library
-import copy
+import math
 
 # < class CPosLatLng >-----------------------------------------------------------------------------
 
@@ -41,6 +41,9 @@ class CPosLatLng(object):
     """
     DOCUMENT ME!
     """
+    # atributos (sem dicionário por instância)
+    __slots__ = ("__f_lat", "__f_lng")
+
     # ---------------------------------------------------------------------------------------------
     def __init__(self, ff_pos_lat=0., ff_pos_lng=0.):
         """
@@ -66,8 +69,52 @@ class CPosLatLng(object):
         """
         copy constructor
         """
+        # cria a cópia sem passar pelo construtor
+        l_pos = object.__new__(self.__class__)
+
+        l_pos.__f_lat = self.__f_lat
+        l_pos.__f_lng = self.__f_lng
+
         # return a copy
-        return copy.deepcopy(self)
+        return l_pos
+
+    # ---------------------------------------------------------------------------------------------
+    @classmethod
+    def from_arrays(cls, fa_lat, fa_lng):
+        """
+        cria uma lista de posições a partir de arrays (ou sequências) de lat/lng já validados
+
+        @param fa_lat: latitudes
+        @param fa_lng: longitudes
+
+        @return lista de posições
+        """
+        # converte arrays numpy em floats python
+        fa_lat = fa_lat.tolist() if hasattr(fa_lat, "tolist") else fa_lat
+        fa_lng = fa_lng.tolist() if hasattr(fa_lng, "tolist") else fa_lng
+
+        # return
+        return [cls.from_trusted(lf_lat, lf_lng) for lf_lat, lf_lng in zip(fa_lat, fa_lng)]
+
+    # ---------------------------------------------------------------------------------------------
+    @classmethod
+    def from_trusted(cls, ff_pos_lat, ff_pos_lng):
+        """
+        cria uma posição a partir de valores já validados (não verifica os intervalos)
+
+        @param ff_pos_lat: latitude
+        @param ff_pos_lng: longitude
+
+        @return posição
+        """
+        # cria a posição sem passar pelo construtor
+        l_pos = object.__new__(cls)
+
+        l_pos.__f_lat = ff_pos_lat
+        l_pos.__f_lng = ff_pos_lng
+
+        # return
+        return l_pos
 
     # =============================================================================================
     # dados
@@ -117,6 +164,9 @@ class CPosLatLngRef(CPosLatLng):
     """
     DOCUMENT ME!
     """
+    # atributos (sem dicionário por instância)
+    __slots__ = ()
+
     # ---------------------------------------------------------------------------------------------
     def __init__(self, f_ref, ff_variation, ff_track, ff_dcl_mag):
         """
@@ -0,0 +1,379 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+pos_mmap
+
+formato binário colunar de posições, lido por mapeamento em memória (numpy.memmap)
+
+leiaute do arquivo (little-endian):
+
+    cabeçalho  M_HDR_FMT: assinatura, versão, tamanho do campo (4 ou 8), número de colunas,
+               número de linhas, lat/lng da referência e declinação magnética (graus)
+    nomes      número de colunas x M_NAME_LEN bytes (ASCII, completados com zeros)
+    (zeros até o alinhamento M_ALIGN)
+    dados      colunas contíguas de campos float32 ou float64, uma após a outra
+
+um arquivo aberto não é lido nem interpretado: as colunas são views do mapeamento e apenas as
+páginas efetivamente acessadas são carregadas
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import io
+import os
+import shutil
+import struct
+import tempfile
+
+# numpy
+import numpy as np
+
+import coord_ref as cref
+import pos_array as parr
+
+# < module data >----------------------------------------------------------------------------------
+
+# assinatura do arquivo
+M_MAGIC = b"CRDCOLS\0"
+
+# versão do formato
+M_VERSION = 1
+
+# cabeçalho: assinatura, versão, tamanho do campo, número de colunas, número de linhas, lat, lng
+# e declinação da referência
+M_HDR_FMT = "<8sHBBQ3d"
+M_HDR_LEN = struct.calcsize(M_HDR_FMT)
+
+# tamanho do nome de uma coluna
+M_NAME_LEN = 16
+
+# alinhamento do início dos dados
+M_ALIGN = 64
+
+# tipos dos campos (tamanho -> dtype)
+M_DCT_DTYPE = {4: np.dtype("<f4"), 8: np.dtype("<f8")}
+
+# < class CPosMmap >-------------------------------------------------------------------------------
+
+class CPosMmap(object):
+    """
+    arquivo colunar de posições aberto por mapeamento em memória
+    """
+    # ---------------------------------------------------------------------------------------------
+    def __init__(self, fs_path, fs_mode="r"):
+        """
+        constructor
+
+        @param fs_path: arquivo
+        @param fs_mode: modo do mapeamento ("r" somente leitura, "r+" leitura e escrita, "c" cópia
+                        na escrita)
+        """
+        # inicia a super classe
+        super(CPosMmap, self).__init__()
+
+        self.__s_path = fs_path
+
+        # lê o cabeçalho
+        with io.open(fs_path, "rb") as lfh_inp:
+            lby_hdr = lfh_inp.read(M_HDR_LEN)
+
+            # check input
+            if len(lby_hdr) < M_HDR_LEN:
+                raise ValueError("{}: cabeçalho incompleto".format(fs_path))
+
+            ls_magic, li_ver, li_size, li_ncol, li_len, lf_lat, lf_lng, lf_dcl = struct.unpack(M_HDR_FMT, lby_hdr)
+
+            if ls_magic != M_MAGIC:
+                raise ValueError("{}: assinatura inválida".format(fs_path))
+
+            if li_ver != M_VERSION:
+                raise ValueError("{}: versão {} não suportada".format(fs_path, li_ver))
+
+            if li_size not in M_DCT_DTYPE:
+                raise ValueError("{}: tamanho de campo {} inválido".format(fs_path, li_size))
+
+            # nomes das colunas
+            self.__lst_col = [lby_name.rstrip(b"\0").decode("ascii")
+                              for lby_name in struct.unpack("{}s".format(M_NAME_LEN) * li_ncol,
+                                                            lfh_inp.read(M_NAME_LEN * li_ncol))]
+
+        # referência
+        self.__f_ref_lat = lf_lat
+        self.__f_ref_lng = lf_lng
+        self.__f_dcl_mag = lf_dcl
+
+        self.__i_len = li_len
+        self.__dtype = M_DCT_DTYPE[li_size]
+
+        # início dos dados
+        li_off = data_offset(li_ncol)
+
+        if os.path.getsize(fs_path) < li_off + li_ncol * li_len * li_size:
+            raise ValueError("{}: arquivo truncado".format(fs_path))
+
+        # mapeia as colunas (colunas x linhas), sem ler o arquivo
+        if (li_len > 0) and (li_ncol > 0):
+            self.__a_map = np.memmap(fs_path, dtype=self.__dtype, mode=fs_mode, offset=li_off, shape=(li_ncol, li_len))
+
+        else:
+            self.__a_map = np.zeros((li_ncol, li_len), dtype=self.__dtype)
+
+    # ---------------------------------------------------------------------------------------------
+    def __enter__(self):
+        """
+        entra no bloco with
+        """
+        return self
+
+    # ---------------------------------------------------------------------------------------------
+    def __exit__(self, f_typ, f_val, f_tb):
+        """
+        sai do bloco with
+        """
+        self.close()
+
+    # ---------------------------------------------------------------------------------------------
+    def __getitem__(self, fs_col):
+        """
+        coluna (view do mapeamento)
+        """
+        return self.__a_map[self.__lst_col.index(fs_col)]
+
+    # ---------------------------------------------------------------------------------------------
+    def __len__(self):
+        """
+        número de linhas
+        """
+        return self.__i_len
+
+    # ---------------------------------------------------------------------------------------------
+    def close(self):
+        """
+        grava as alterações (modo "r+") e solta o mapeamento. As views já obtidas mantêm o
+        mapeamento até serem coletadas
+        """
+        if isinstance(self.__a_map, np.memmap):
+            self.__a_map.flush()
+
+        self.__a_map = None
+
+    # ---------------------------------------------------------------------------------------------
+    def pos(self, fs_c0, fs_c1, fs_c2=None, f_slice=slice(None), fcls_pos=parr.CPosLatLngArray):
+        """
+        container de posições sobre as colunas dadas, sem cópia se os campos são float64 (aceito
+        pelas funções em lote de coord_geog e coord_geod)
+
+        @param fs_c0, fs_c1: primeira e segunda colunas (lat/lng ou x/y)
+        @param fs_c2: terceira coluna (None = 0.)
+        @param f_slice: fatia das linhas
+        @param fcls_pos: classe do container (CPosLatLngArray ou CPosXYArray)
+
+        @return container de posições
+        """
+        la_c2 = self[fs_c2][f_slice] if fs_c2 is not None else 0.
+
+        # return
+        return fcls_pos(self[fs_c0][f_slice], self[fs_c1][f_slice], la_c2, fv_copy=False)
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def a_map(self):
+        """
+        get colunas mapeadas (colunas x linhas)
+        """
+        return self.__a_map
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def dtype(self):
+        """
+        get tipo dos campos
+        """
+        return self.__dtype
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def f_dcl_mag(self):
+        """
+        get declinação magnética da referência
+        """
+        return self.__f_dcl_mag
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def f_ref_lat(self):
+        """
+        get latitude da referência
+        """
+        return self.__f_ref_lat
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def f_ref_lng(self):
+        """
+        get longitude da referência
+        """
+        return self.__f_ref_lng
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def lst_col(self):
+        """
+        get nomes das colunas
+        """
+        return list(self.__lst_col)
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def ref_frame(self):
+        """
+        get referencial do arquivo (CReferenceFrame)
+        """
+        return cref.CReferenceFrame(self.__f_ref_lat, self.__f_ref_lng, self.__f_dcl_mag)
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def s_path(self):
+        """
+        get arquivo
+        """
+        return self.__s_path
+
+# -------------------------------------------------------------------------------------------------
+def data_offset(fi_ncol):
+    """
+    início dos dados de um arquivo com fi_ncol colunas
+
+    @param fi_ncol: número de colunas
+
+    @return deslocamento em bytes (múltiplo de M_ALIGN)
+    """
+    li_off = M_HDR_LEN + M_NAME_LEN * fi_ncol
+
+    # return
+    return -(-li_off // M_ALIGN) * M_ALIGN
+
+# -------------------------------------------------------------------------------------------------
+def __header(flst_col, fi_len, fi_size, f_ref):
+    """
+    monta o cabeçalho (com os nomes e o alinhamento)
+
+    @return bytes do cabeçalho
+    """
+    # check input
+    assert fi_size in M_DCT_DTYPE
+    assert all(0 < len(ls_col.encode("ascii")) <= M_NAME_LEN for ls_col in flst_col)
+    assert len(set(flst_col)) == len(flst_col)
+
+    lby_hdr = struct.pack(M_HDR_FMT, M_MAGIC, M_VERSION, fi_size, len(flst_col), fi_len,
+                          f_ref.f_lat, f_ref.f_lng, f_ref.f_dcl_mag)
+
+    lby_hdr += b"".join(struct.pack("{}s".format(M_NAME_LEN), ls_col.encode("ascii")) for ls_col in flst_col)
+
+    # return
+    return lby_hdr.ljust(data_offset(len(flst_col)), b"\0")
+
+# -------------------------------------------------------------------------------------------------
+def write(fs_path, fdct_col, f_ref, fs_dtype="<f8"):
+    """
+    grava colunas em memória
+
+    @param fs_path: arquivo
+    @param fdct_col: dicionário de colunas (nome -> array), todas do mesmo tamanho
+    @param f_ref: referencial (CReferenceFrame, ver CCoordSys.ref_frame)
+    @param fs_dtype: tipo dos campos ("<f4" ou "<f8")
+
+    @return número de linhas gravadas
+    """
+    return write_blocks(fs_path, [fdct_col], list(fdct_col), f_ref, fs_dtype)
+
+# -------------------------------------------------------------------------------------------------
+def write_blocks(fs_path, f_blks, flst_col, f_ref, fs_dtype="<f8"):
+    """
+    grava uma sequência de blocos (ver coord_stream) sem mantê-los na memória. Cada coluna é
+    acumulada em um arquivo temporário e as colunas são concatenadas ao final
+
+    @param fs_path: arquivo
+    @param f_blks: blocos (dicionários de colunas, todas do mesmo tamanho em cada bloco; senão,
+                   ValueError e o destino não é criado)
+    @param flst_col: colunas gravadas
+    @param f_ref: referencial (CReferenceFrame, ver CCoordSys.ref_frame)
+    @param fs_dtype: tipo dos campos ("<f4" ou "<f8")
+
+    @return número de linhas gravadas
+    """
+    l_dtype = np.dtype(fs_dtype)
+
+    # check input
+    assert l_dtype in M_DCT_DTYPE.values()
+
+    li_len = 0
+
+    # diretório de trabalho junto ao destino
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(fs_path))) as ls_tmp:
+        llst_fh = [io.open(os.path.join(ls_tmp, str(li_col)), "w+b") for li_col in range(len(flst_col))]
+
+        try:
+            # acumula as colunas
+            for li_blk, ldct_blk in enumerate(f_blks):
+                llst_arr = [np.asarray(ldct_blk[ls_col], dtype=l_dtype).reshape(-1) for ls_col in flst_col]
+
+                # colunas do bloco com o mesmo número de linhas ?
+                li_rows = len(llst_arr[0])
+
+                if any(len(la_col) != li_rows for la_col in llst_arr):
+                    raise ValueError("{}: bloco {} com colunas de tamanhos diferentes ({})".format(
+                                     fs_path, li_blk, ", ".join("{}={}".format(ls_col, len(la_col))
+                                                                for ls_col, la_col in zip(flst_col, llst_arr))))
+
+                for lfh_col, la_col in zip(llst_fh, llst_arr):
+                    la_col.tofile(lfh_col)
+
+                li_len += li_rows
+
+            # grava em um arquivo temporário e renomeia (o destino nunca fica incompleto)
+            ls_out = os.path.join(ls_tmp, "out")
+
+            with io.open(ls_out, "wb") as lfh_out:
+                lfh_out.write(__header(flst_col, li_len, l_dtype.itemsize, f_ref))
+
+                for lfh_col in llst_fh:
+                    lfh_col.seek(0)
+                    shutil.copyfileobj(lfh_col, lfh_out, 1 << 20)
+
+        finally:
+            for lfh_col in llst_fh:
+                lfh_col.close()
+
+        os.replace(ls_out, fs_path)
+
+    # return
+    return li_len
+
+# < the end >--------------------------------------------------------------------------------------
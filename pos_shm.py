@@ -0,0 +1,307 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+pos_shm
+
+blocos de posições em memória compartilhada (multiprocessing.shared_memory)
+
+o bloco tem o mesmo leiaute do buffer de CPosArray (3 colunas float64 contíguas) e é visto como
+um container de posições sem cópia. Um bloco serializado (pickle) é reaberto pelo nome no processo
+de destino, apenas o nome e o tamanho trafegam entre os processos
+
+ciclo de vida: o processo que cria o bloco é o dono e o remove (unlink) ao sair do bloco with, ao
+chamar release() ou ao terminar (finalizador). Se o dono morre sem remover o bloco, o
+resource_tracker do multiprocessing remove o segmento. Quem apenas abre o bloco não o registra no
+seu resource_tracker, senão o segmento do dono seria removido quando esse processo terminasse
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import inspect
+import multiprocessing.resource_tracker as rtrk
+import multiprocessing.shared_memory as shm
+import os
+import weakref
+
+# numpy
+import numpy as np
+
+import pos_array as parr
+
+# < module data >----------------------------------------------------------------------------------
+
+# bytes por posição (3 colunas float64)
+M_POS_BYTES = 3 * np.dtype(np.float64).itemsize
+
+# blocos já abertos neste processo (nome -> bloco), evita reabrir a cada bloco de trabalho
+M_DCT_ATTACH = weakref.WeakValueDictionary()
+
+# SharedMemory aceita track=False (python 3.13+) ?
+M_V_TRACK = "track" in inspect.signature(shm.SharedMemory).parameters
+
+# < class CPosShm >--------------------------------------------------------------------------------
+
+class CPosShm(object):
+    """
+    bloco de N posições em memória compartilhada
+    """
+    # ---------------------------------------------------------------------------------------------
+    def __init__(self, fi_len=0, fs_name=None, fcls_pos=parr.CPosLatLngArray, ft_tracker=None):
+        """
+        constructor
+
+        @param fi_len: número de posições (obrigatório ao criar)
+        @param fs_name: nome do segmento existente (None cria um novo segmento)
+        @param fcls_pos: classe do container (CPosLatLngArray ou CPosXYArray)
+        @param ft_tracker: resource_tracker do dono (ver tracker_id), None se desconhecido
+        """
+        # inicia a super classe
+        super(CPosShm, self).__init__()
+
+        # cria o segmento ?
+        if fs_name is None:
+            # check input
+            assert fi_len > 0
+
+            self.__shm = shm.SharedMemory(create=True, size=fi_len * M_POS_BYTES)
+
+            # resource_tracker que remove o segmento se o dono morrer
+            ft_tracker = tracker_id()
+
+        # senão, abre o segmento existente (sem registrá-lo no resource_tracker)
+        else:
+            self.__shm = open_shm(fs_name, ft_tracker)
+
+            # tamanho pelo segmento (pode ter sido arredondado para páginas)
+            fi_len = fi_len or (self.__shm.size // M_POS_BYTES)
+
+            assert fi_len * M_POS_BYTES <= self.__shm.size
+
+        # dono do segmento (quem criou)
+        self.__v_owner = fs_name is None
+        self.__i_pid = os.getpid()
+
+        self.__i_len = fi_len
+        self.__cls_pos = fcls_pos
+        self.__t_tracker = ft_tracker
+
+        # colunas (views do segmento) e container
+        self.__a_buf = np.ndarray((3, fi_len), dtype=np.float64, buffer=self.__shm.buf)
+        self.__pos = fcls_pos(self.__a_buf[0], self.__a_buf[1], self.__a_buf[2], fv_copy=False)
+
+        # libera o segmento quando o objeto for coletado ou o processo terminar
+        self.__fin = weakref.finalize(self, release_shm, self.__shm, self.__v_owner, self.__i_pid)
+
+    # ---------------------------------------------------------------------------------------------
+    def __enter__(self):
+        """
+        entra no bloco with
+        """
+        return self
+
+    # ---------------------------------------------------------------------------------------------
+    def __exit__(self, f_typ, f_val, f_tb):
+        """
+        sai do bloco with (fecha e, se dono, remove o segmento)
+        """
+        self.release()
+
+    # ---------------------------------------------------------------------------------------------
+    def __len__(self):
+        """
+        número de posições
+        """
+        return self.__i_len
+
+    # ---------------------------------------------------------------------------------------------
+    def __reduce__(self):
+        """
+        serialização (pickle): apenas nome, tamanho, classe do container e resource_tracker do
+        dono. O destino reabre o segmento sem ser dono
+        """
+        return attach, (self.__shm.name, self.__i_len, self.__cls_pos, self.__t_tracker)
+
+    # ---------------------------------------------------------------------------------------------
+    def release(self):
+        """
+        fecha o segmento neste processo e, se dono, remove-o do sistema
+        """
+        # solta as views antes de fechar o mapeamento
+        self.__pos = None
+        self.__a_buf = None
+
+        self.__fin()
+
+    # =============================================================================================
+    # data
+    # =============================================================================================
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def cols(self):
+        """
+        get colunas (views do segmento)
+        """
+        return self.__pos.cols
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def pos(self):
+        """
+        get container de posições (views do segmento, sem cópia)
+        """
+        return self.__pos
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def s_name(self):
+        """
+        get nome do segmento
+        """
+        return self.__shm.name
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def v_alive(self):
+        """
+        get segmento aberto neste processo ?
+        """
+        return self.__fin.alive
+
+    # ---------------------------------------------------------------------------------------------
+    @property
+    def v_owner(self):
+        """
+        get dono do segmento ?
+        """
+        return self.__v_owner
+
+# -------------------------------------------------------------------------------------------------
+def attach(fs_name, fi_len=0, fcls_pos=parr.CPosLatLngArray, ft_tracker=None):
+    """
+    abre um segmento existente, reaproveitando o bloco se já aberto neste processo
+
+    @param fs_name: nome do segmento
+    @param fi_len: número de posições
+    @param fcls_pos: classe do container
+    @param ft_tracker: resource_tracker do dono (ver tracker_id), None se desconhecido
+
+    @return bloco (CPosShm)
+    """
+    # bloco já aberto ?
+    l_blk = M_DCT_ATTACH.get(fs_name, None)
+
+    if (l_blk is None) or (not l_blk.v_alive):
+        # abre o segmento
+        l_blk = M_DCT_ATTACH[fs_name] = CPosShm(fi_len, fs_name, fcls_pos, ft_tracker)
+
+    # return
+    return l_blk
+
+# -------------------------------------------------------------------------------------------------
+def open_shm(fs_name, ft_tracker=None):
+    """
+    abre um segmento existente sem deixá-lo registrado no resource_tracker deste processo. O
+    registro faria o resource_tracker remover o segmento do dono quando este processo terminasse
+
+    @param fs_name: nome do segmento
+    @param ft_tracker: resource_tracker do dono (ver tracker_id), None se desconhecido
+
+    @return segmento (SharedMemory)
+    """
+    # python 3.13+ ?
+    if M_V_TRACK:
+        # return
+        return shm.SharedMemory(name=fs_name, track=False)
+
+    # abre o segmento (registra-o no resource_tracker)
+    l_shm = shm.SharedMemory(name=fs_name)
+
+    # desfaz o registro, exceto se o resource_tracker é o do dono (processo filho que o herdou):
+    # ali o registro é o do próprio dono e não pode ser desfeito
+    if shm._USE_POSIX and ((ft_tracker is None) or (ft_tracker != tracker_id())):
+        rtrk.unregister(l_shm._name, "shared_memory")
+
+    # return
+    return l_shm
+
+# -------------------------------------------------------------------------------------------------
+def release_shm(f_shm, fv_owner, fi_pid):
+    """
+    fecha o segmento e, se dono (no processo que o criou), remove-o do sistema
+
+    @param f_shm: segmento (SharedMemory)
+    @param fv_owner: dono do segmento ?
+    @param fi_pid: processo que abriu o segmento
+    """
+    # o mapeamento fica com as views ainda vivas (numpy referencia o mmap, sem exportar o buffer):
+    # fechá-lo deixaria as views apontando para memória desmapeada. É desfeito quando a última view
+    # for coletada
+    f_shm._mmap = None
+
+    # fecha o buffer e o descritor
+    try:
+        f_shm.close()
+
+    # ainda há views exportadas (o mapeamento é liberado com elas)
+    except BufferError:
+        pass
+
+    # remove o segmento (apenas o dono, e não em um processo filho criado por fork)
+    if fv_owner and (os.getpid() == fi_pid):
+        try:
+            f_shm.unlink()
+
+        # já removido
+        except FileNotFoundError:
+            pass
+
+# -------------------------------------------------------------------------------------------------
+def tracker_id():
+    """
+    identifica o resource_tracker deste processo pelo pipe de comandos (o mesmo em processos filhos
+    que o herdam do pai)
+
+    @return tupla (dispositivo, inode) do pipe, None se não há resource_tracker
+    """
+    # descritor do pipe do resource_tracker
+    li_fd = getattr(rtrk._resource_tracker, "_fd", None)
+
+    if li_fd is None:
+        # cai fora
+        return None
+
+    try:
+        l_stat = os.fstat(li_fd)
+
+    # descritor inválido
+    except OSError:
+        # cai fora
+        return None
+
+    # return
+    return l_stat.st_dev, l_stat.st_ino
+
+# < the end >--------------------------------------------------------------------------------------
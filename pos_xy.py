@@ -47,6 +47,9 @@ class CPosXY(object):
     """
     DOCUMENT ME!
     """
+    # atributos (sem dicionário por instância)
+    __slots__ = ("__f_x", "__f_y")
+
     # ---------------------------------------------------------------------------------------------
 
     def __init__(self, ff_x=0., ff_y=0.):
@@ -71,6 +74,58 @@ class CPosXY(object):
         # logger
         # M_LOG.info("__init__:<<")
 
+    # ---------------------------------------------------------------------------------------------
+    def copy(self):
+        """
+        copy constructor
+        """
+        # cria a cópia sem passar pelo construtor
+        l_pos = object.__new__(self.__class__)
+
+        l_pos.__f_x = self.__f_x
+        l_pos.__f_y = self.__f_y
+
+        # return a copy
+        return l_pos
+
+    # ---------------------------------------------------------------------------------------------
+    @classmethod
+    def from_arrays(cls, fa_x, fa_y):
+        """
+        cria uma lista de posições a partir de arrays (ou sequências) de x/y
+
+        @param fa_x: coordenadas X
+        @param fa_y: coordenadas Y
+
+        @return lista de posições
+        """
+        # converte arrays numpy em floats python
+        fa_x = fa_x.tolist() if hasattr(fa_x, "tolist") else fa_x
+        fa_y = fa_y.tolist() if hasattr(fa_y, "tolist") else fa_y
+
+        # return
+        return [cls.from_trusted(lf_x, lf_y) for lf_x, lf_y in zip(fa_x, fa_y)]
+
+    # ---------------------------------------------------------------------------------------------
+    @classmethod
+    def from_trusted(cls, ff_x, ff_y):
+        """
+        cria uma posição sem passar pelo construtor
+
+        @param ff_x: X
+        @param ff_y: Y
+
+        @return posição
+        """
+        # cria a posição
+        l_pos = object.__new__(cls)
+
+        l_pos.__f_x = ff_x
+        l_pos.__f_y = ff_y
+
+        # return
+        return l_pos
+
     # =============================================================================================
     # dados
     # =============================================================================================
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+conftest
+
+configuração dos testes: o repositório é o pacote libs.coords, importado tanto como libs.coords.*
+quanto pelos nomes simples dos módulos (import coord_defs as cdefs)
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import importlib.util
+import os
+import sys
+import types
+
+# < module data >----------------------------------------------------------------------------------
+
+# raiz do repositório (pacote libs.coords)
+M_DIR_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# módulos importados pelo nome simples
+if M_DIR_ROOT not in sys.path:
+    sys.path.insert(0, M_DIR_ROOT)
+
+# pacote libs.coords apontando para a raiz do repositório
+if "libs.coords" not in sys.modules:
+    # pacote libs
+    l_libs = sys.modules.setdefault("libs", types.ModuleType("libs"))
+    l_libs.__path__ = getattr(l_libs, "__path__", [])
+
+    # pacote libs.coords
+    l_spec = importlib.util.spec_from_file_location("libs.coords", os.path.join(M_DIR_ROOT, "__init__.py"),
+                                                    submodule_search_locations=[M_DIR_ROOT])
+    l_coords = importlib.util.module_from_spec(l_spec)
+    sys.modules["libs.coords"] = l_coords
+    l_spec.loader.exec_module(l_coords)
+
+    l_libs.coords = l_coords
+
+# < the end >--------------------------------------------------------------------------------------
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+test_coord_bulk
+
+conversão em lote: o pool de processos reproduz exatamente o caminho no próprio processo
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import collections
+
+# numpy
+import numpy as np
+
+# pytest
+import pytest
+
+# libs
+import libs.coords.coord_bulk as cblk
+import libs.coords.coord_sys as csys
+
+# < module data >----------------------------------------------------------------------------------
+
+# dados de um fixo
+M_NT_FIX = collections.namedtuple("CFix", "v_fix_ok f_fix_lat f_fix_lng")
+
+# -------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize("fv_exact", [False, True])
+def test_new_coord_vec_workers(fv_exact):
+    """
+    new_coord_vec com 1 e 2 processos dá o mesmo resultado, nos dois modos distância/radial
+    """
+    l_sys = csys.CCoordSys(-22., -43., -21., fv_frd_exact=fv_exact)
+    l_sys.set_fix("ABC", M_NT_FIX(True, -20., -40.))
+
+    la_rad = [str(lf_rad) for lf_rad in (0., 45., 90., 180., 275.5, 359.)]
+    la_dst = [str(lf_dst) for lf_dst in (1., 10., 50., 100., 250., 500.)]
+
+    lt_cols = (["D"] * len(la_rad), ["ABC"] * len(la_rad), la_dst, la_rad)
+
+    lt_one = cblk.convert_vec("new_coord_vec", lt_cols, l_sys, fi_workers=1, fi_chunk=2)
+    lt_two = cblk.convert_vec("new_coord_vec", lt_cols, l_sys, fi_workers=2, fi_chunk=2)
+
+    for la_one, la_two in zip(lt_one, lt_two):
+        np.testing.assert_array_equal(la_one, la_two)
+
+    # o caminho no próprio processo segue o modo do sistema
+    np.testing.assert_allclose(lt_one[1:], l_sys.new_coord_vec(*lt_cols)[1:], rtol=0., atol=1e-9)
+
+# < the end >--------------------------------------------------------------------------------------
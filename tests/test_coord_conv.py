@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+test_coord_conv
+
+formatação em lote: arrays 0-d (escalares) e 1-d coincidem com as versões escalares
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import io
+
+# numpy
+import numpy as np
+
+# libs
+import libs.coords.coord_conv as conv
+
+# -------------------------------------------------------------------------------------------------
+def test_format_vec_0d():
+    """
+    um array 0-d gera uma linha, igual à versão escalar
+    """
+    assert [conv.deg2str(12.5)] == conv.deg2str_vec(np.array(12.5))
+    assert [conv.format_ica_lat(-23.5)] == conv.format_ica_lat_vec(np.array(-23.5))
+    assert [conv.format_ica_lng(-46.6)] == conv.format_ica_lng_vec(np.array(-46.6))
+
+    l_out = io.StringIO()
+
+    assert 1 == conv.deg2str_vec(np.array(12.5), l_out)
+    assert conv.deg2str(12.5) + "\n" == l_out.getvalue()
+
+# -------------------------------------------------------------------------------------------------
+def test_format_vec_1d():
+    """
+    arrays 1-d: uma linha por valor
+    """
+    la_deg = np.array([12.5, -3.25, 0.])
+
+    assert [conv.deg2str(lf_deg) for lf_deg in la_deg.tolist()] == conv.deg2str_vec(la_deg)
+    assert [conv.format_ica_lng(lf_deg) for lf_deg in la_deg.tolist()] == conv.format_ica_lng_vec(la_deg)
+
+# < the end >--------------------------------------------------------------------------------------
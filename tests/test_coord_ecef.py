@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+test_coord_ecef
+
+ECEF -> geodésicas: olson na origem (escalar igual ao lote) e desempate da escolha "auto" pela
+precisão
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import math
+
+# numpy
+import numpy as np
+
+# pytest
+import pytest
+
+# libs
+import libs.coords.coord_ecef as cecef
+
+# -------------------------------------------------------------------------------------------------
+@pytest.fixture
+def bench():
+    """
+    benchmark fixo (restaura o estado do módulo ao final)
+    """
+    ldct_bench = dict(cecef.M_DCT_BENCH)
+    ldct_choice = dict(cecef.M_DCT_CHOICE)
+
+    cecef.M_DCT_BENCH.clear()
+    cecef.M_DCT_CHOICE.clear()
+
+    yield cecef.M_DCT_BENCH
+
+    cecef.M_DCT_BENCH.clear()
+    cecef.M_DCT_BENCH.update(ldct_bench)
+    cecef.M_DCT_CHOICE.clear()
+    cecef.M_DCT_CHOICE.update(ldct_choice)
+
+# -------------------------------------------------------------------------------------------------
+def test_olson_origin():
+    """
+    olson no centro da Terra: NaN como olson_vec (sem ZeroDivisionError)
+    """
+    lt_geo = cecef.olson(0., 0., 0.)
+    la_lat, _, la_alt = cecef.olson_vec(np.zeros(1), np.zeros(1), np.zeros(1))
+
+    assert math.isnan(lt_geo[0]) and math.isnan(lt_geo[2])
+    assert np.isnan(la_lat[0]) and np.isnan(la_alt[0])
+
+# -------------------------------------------------------------------------------------------------
+def test_select_tie(bench):
+    """
+    dentro de M_BENCH_TIE do mais rápido vence o mais preciso; fora dela, o mais rápido
+    """
+    bench[True] = [{"method": "iter", "max_err_m": 1e-4, "us_per_pt": 0.100},
+                   {"method": "olson", "max_err_m": 1e-9, "us_per_pt": 0.110},
+                   {"method": "vermeille", "max_err_m": 1e-10, "us_per_pt": 0.200}]
+
+    assert "olson" == cecef.select(1e-3, fv_vec=True)
+
+    bench[False] = [{"method": "iter", "max_err_m": 1e-4, "us_per_pt": 0.100},
+                    {"method": "olson", "max_err_m": 1e-9, "us_per_pt": 0.150}]
+
+    assert "iter" == cecef.select(1e-3, fv_vec=False)
+
+# < the end >--------------------------------------------------------------------------------------
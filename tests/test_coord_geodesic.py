@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+test_coord_geodesic
+
+geodésicas (Vincenty): as versões em lote devem coincidir com as escalares, inclusive quando as
+entradas são escalares
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# numpy
+import numpy as np
+
+# pytest
+import pytest
+
+# libs
+import libs.coords.coord_geodesic as gdsc
+
+# < module data >----------------------------------------------------------------------------------
+
+# pares de pontos (lat1, lng1, lat2, lng2)
+M_LST_PAIRS = [(0., 0., 0., 90.),
+               (-22., -43., -22.5, -43.5),
+               (-15.8, -47.9, -23.4, -46.5),
+               (10., 170., -10., -170.),
+               (60., 0., 60., 1.)]
+
+# -------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize("ft_pair", M_LST_PAIRS)
+def test_inverse_vec_scalar_parity(ft_pair):
+    """
+    inverse_vec com entradas escalares itera como inverse
+    """
+    lt_ref = gdsc.inverse(*ft_pair)
+    lt_vec = gdsc.inverse_vec(*ft_pair)
+
+    assert all(np.ndim(l_val) == 0 for l_val in lt_vec)
+    np.testing.assert_allclose(lt_vec, lt_ref, rtol=1e-9, atol=1e-9)
+
+# -------------------------------------------------------------------------------------------------
+def test_inverse_vec_known_values():
+    """
+    distâncias conhecidas, com e sem origem pré-calculada
+    """
+    # um quarto do equador
+    assert abs(gdsc.inverse_vec(0., 0., 0., 90.)[0] - 5409.69) < 0.01
+
+    # origem pré-calculada
+    assert abs(gdsc.CGeodesicOrigin(-22., -43.).inverse_vec(-22.5, -43.5)[0] - 40.844) < 0.001
+
+# -------------------------------------------------------------------------------------------------
+def test_inverse_vec_array_parity():
+    """
+    inverse_vec em lote (origem única e pares) coincide com inverse ponto a ponto
+    """
+    l_rng = np.random.default_rng(22)
+
+    la_lat = l_rng.uniform(-60., 60., 200)
+    la_lng = l_rng.uniform(-180., 180., 200)
+
+    lt_ref = np.array([gdsc.inverse(-22., -43., lf_lat, lf_lng) for lf_lat, lf_lng in zip(la_lat, la_lng)]).T
+
+    np.testing.assert_allclose(gdsc.inverse_vec(-22., -43., la_lat, la_lng), lt_ref, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(gdsc.CGeodesicOrigin(-22., -43.).inverse_vec(la_lat, la_lng), lt_ref,
+                               rtol=1e-9, atol=1e-9)
+
+    # broadcast de formas (2, 1) x (3,)
+    assert (2, 3) == gdsc.inverse_vec([[0.], [10.]], 0., [0., 20., 30.], 90.)[0].shape
+
+# -------------------------------------------------------------------------------------------------
+def test_inverse_vec_antipodal():
+    """
+    pontos quase antípodas (não converge): NaN, inclusive com entradas escalares
+    """
+    assert np.isnan(gdsc.inverse(0., 0., 0.5, 179.7)[0])
+    assert np.isnan(gdsc.inverse_vec(0., 0., 0.5, 179.7)[0])
+
+# -------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize("ff_lat", [-89.9, -60., -22., 0., 45., 80.])
+def test_destination_accuracy(ff_lat):
+    """
+    fórmula fechada: erro em relação ao problema direto exato (Vincenty) dentro do documentado
+    """
+    l_rng = np.random.default_rng(int(ff_lat) + 100)
+
+    la_azi = l_rng.uniform(0., 360., 2000)
+    la_dst = l_rng.uniform(0., 100., 2000)
+
+    la_lat_v, la_lng_v, _ = gdsc.direct_vec(ff_lat, 179.9, la_azi, la_dst)
+    la_lat_f, la_lng_f = gdsc.destination_vec(ff_lat, 179.9, la_azi, la_dst)
+
+    # erro (m)
+    la_err = gdsc.inverse_vec(la_lat_v, la_lng_v, la_lat_f, la_lng_f)[0] * 1852.
+
+    assert la_err[la_dst <= 50.].max() < 1.5
+    assert la_err.max() < 5.
+
+    # longitude em [-180, 180)
+    assert ((-180. <= la_lng_f) & (la_lng_f < 180.)).all()
+
+# -------------------------------------------------------------------------------------------------
+def test_destination_parity():
+    """
+    fórmula fechada: escalar, lote e origem pré-calculada dão o mesmo resultado
+    """
+    l_rng = np.random.default_rng(23)
+
+    la_azi = l_rng.uniform(0., 360., 200)
+    la_dst = l_rng.uniform(0., 250., 200)
+
+    lt_ref = np.array([gdsc.destination(-22., -43., lf_azi, lf_dst) for lf_azi, lf_dst in zip(la_azi, la_dst)]).T
+
+    np.testing.assert_allclose(gdsc.destination_vec(-22., -43., la_azi, la_dst), lt_ref, rtol=0., atol=1e-12)
+    np.testing.assert_allclose(gdsc.CGeodesicOrigin(-22., -43.).destination_vec(la_azi, la_dst), lt_ref,
+                               rtol=0., atol=1e-12)
+
+# < the end >--------------------------------------------------------------------------------------
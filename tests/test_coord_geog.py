@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+test_coord_geog
+
+declinação magnética: decl_xyz gira o ponto (x e y a partir das coordenadas originais) e coincide
+com decl_xyz_vec
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import math
+
+# numpy
+import numpy as np
+
+# pytest
+import pytest
+
+# libs
+import libs.coords.coord_geog as geog
+import libs.coords.coord_ref as cref
+
+# -------------------------------------------------------------------------------------------------
+def test_decl_xyz_rotation():
+    """
+    y é calculado a partir do x original, não do x já girado
+    """
+    lf_x, lf_y, lf_z = geog.decl_xyz(100., 200., 0., -21.3)
+
+    assert lf_x == pytest.approx(165.8194, abs=1e-4)
+    assert lf_y == pytest.approx(150.0131, abs=1e-4)
+    assert 0. == lf_z
+
+    # rotação preserva a distância
+    assert math.hypot(lf_x, lf_y) == pytest.approx(math.hypot(100., 200.), abs=1e-9)
+
+# -------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize("ff_dcl", [-21.3, 0., 15.])
+def test_decl_xyz_vec_parity(ff_dcl):
+    """
+    decl_xyz e decl_xyz_vec coincidem
+    """
+    la_x = np.array([100., -50., 0., 3.5])
+    la_y = np.array([200., 25., -80., 0.])
+    la_z = np.array([0., 1., 2., 3.])
+
+    lt_ref = np.array([geog.decl_xyz(lf_x, lf_y, lf_z, ff_dcl) for lf_x, lf_y, lf_z in zip(la_x, la_y, la_z)]).T
+
+    np.testing.assert_allclose(geog.decl_xyz_vec(la_x, la_y, la_z, ff_dcl), lt_ref, rtol=0., atol=1e-9)
+
+# -------------------------------------------------------------------------------------------------
+def test_geo2xyz_3_ref_scale():
+    """
+    geo2xyz_3 / xyz2geo_3 com o referencial usam os seus fatores de escala e fazem o caminho de
+    ida e volta
+    """
+    l_ref = cref.CReferenceFrame(-22., -43., -21.)
+
+    assert l_ref.f_cnv_gr2m * l_ref.f_cnv_m2gr == pytest.approx(1., abs=1e-15)
+
+    lt_xyz = geog.geo2xyz_3(-20., -40., 100., l_ref)
+
+    assert lt_xyz == pytest.approx((3. * l_ref.f_cnv_gr2m, 2. * l_ref.f_cnv_gr2m, 100.))
+    assert geog.xyz2geo_3(*lt_xyz, f_ref=l_ref) == pytest.approx((-20., -40., 100.), abs=1e-12)
+
+    la_lat = np.array([-20., -22., -25.5])
+    la_lng = np.array([-40., -43., -47.25])
+
+    lt_vec = geog.geo2xyz_3_vec(la_lat, la_lng, 0., l_ref)
+
+    np.testing.assert_allclose(geog.xyz2geo_3_vec(*lt_vec, f_ref=l_ref)[:2], (la_lat, la_lng), rtol=0., atol=1e-12)
+
+# < the end >--------------------------------------------------------------------------------------
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+test_coord_server
+
+micro-lotes do servidor: uma requisição inválida recebe o erro sozinha, as demais requisições do
+mesmo lote são convertidas normalmente
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import asyncio
+import collections
+import os
+
+# pytest
+import pytest
+
+# libs
+import libs.coords.coord_server as srv
+import libs.coords.coord_sys as csys
+
+# < module data >----------------------------------------------------------------------------------
+
+# dados de um fixo
+M_NT_FIX = collections.namedtuple("CFix", "v_fix_ok f_fix_lat f_fix_lng")
+
+# -------------------------------------------------------------------------------------------------
+def test_batcher_isolates_failed_request():
+    """
+    lote que falha: as requisições são convertidas uma a uma e só a culpada recebe o erro
+    """
+    def __double(flst_args):
+        if any(lt_args[0] < 0 for lt_args in flst_args):
+            raise ValueError("negativo")
+
+        return [2 * lt_args[0] for lt_args in flst_args]
+
+    async def __run():
+        l_batcher = srv.CBatcher(__double, fi_max_batch=8, ff_max_delay=0.001)
+
+        return await asyncio.gather(*[l_batcher.submit((li_val,)) for li_val in (1, 2, -3, 4)],
+                                    return_exceptions=True)
+
+    llst_res = asyncio.run(__run())
+
+    assert [2, 4, 8] == [llst_res[0], llst_res[1], llst_res[3]]
+    assert isinstance(llst_res[2], ValueError)
+
+# -------------------------------------------------------------------------------------------------
+@pytest.mark.skipif(not hasattr(asyncio, "open_unix_connection"), reason="sem socket Unix")
+def test_server_malformed_request(tmp_path):
+    """
+    requisição malformada no meio de um micro-lote: só ela recebe o erro
+    """
+    ls_path = os.path.join(str(tmp_path), "coord.sock")
+
+    l_sys = csys.CCoordSys(-22., -43., -21.)
+    l_sys.set_fix("ABC", M_NT_FIX(True, -20., -40.))
+
+    async def __call(f_cli, fs_op, *f_args):
+        try:
+            return await f_cli.call(fs_op, *f_args)
+
+        except Exception as l_err:
+            return l_err
+
+    async def __run():
+        l_srv = srv.CCoordServer(l_sys, ls_path, fi_max_batch=64, ff_max_delay=0.005)
+        await l_srv.start()
+
+        l_cli = await srv.CCoordClient(ls_path).connect()
+
+        try:
+            llst_geo = await asyncio.gather(*[__call(l_cli, "geo2xyz", -22.1, -43.1) for _ in range(5)],
+                                            __call(l_cli, "geo2xyz", "abc", 1),
+                                            *[__call(l_cli, "geo2xyz", -22.1, -43.1) for _ in range(5)])
+
+            llst_new = await asyncio.gather(__call(l_cli, "new_coord", "F", "ABC"),
+                                            __call(l_cli, "new_coord", "F"),
+                                            __call(l_cli, "new_coord", "F", "ABC"))
+
+            llst_ica = await asyncio.gather(__call(l_cli, "parse_ica", "2230S"),
+                                            __call(l_cli, "parse_ica", 5))
+
+        finally:
+            await l_cli.close()
+            await l_srv.close()
+
+        return llst_geo, llst_new, llst_ica
+
+    llst_geo, llst_new, llst_ica = asyncio.run(__run())
+
+    # geo2xyz: só a sexta requisição falha
+    assert [5] == [li_ndx for li_ndx, l_res in enumerate(llst_geo) if isinstance(l_res, Exception)]
+    assert all(l_res == llst_geo[0] for li_ndx, l_res in enumerate(llst_geo) if li_ndx != 5)
+
+    # new_coord: a requisição sem campo A falha, as outras encontram o fixo
+    assert [0, -20., -40.] == llst_new[0] == llst_new[2]
+    assert isinstance(llst_new[1], Exception)
+
+    # parse_ica: texto convertido, número recusado
+    assert -22.5 == llst_ica[0]
+    assert isinstance(llst_ica[1], Exception)
+
+# < the end >--------------------------------------------------------------------------------------
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+test_coord_sys
+
+coordenadas distância/radial (tipo 'D'): fórmula fechada por padrão, geodésica exata (Vincenty)
+com v_frd_exact, nas versões escalar e em lote
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import collections
+
+# pytest
+import pytest
+
+# numpy
+import numpy as np
+
+# libs
+import libs.coords.coord_geodesic as gdsc
+import libs.coords.coord_sys as csys
+
+# < module data >----------------------------------------------------------------------------------
+
+# dados de um fixo
+M_NT_FIX = collections.namedtuple("CFix", "v_fix_ok f_fix_lat f_fix_lng")
+
+# -------------------------------------------------------------------------------------------------
+def __new_sys(**fdct_kw):
+    """
+    sistema de coordenadas com um fixo
+    """
+    l_sys = csys.CCoordSys(-22., -43., -21., **fdct_kw)
+    l_sys.set_fix("ABC", M_NT_FIX(True, -20., -40.))
+
+    # return
+    return l_sys
+
+# -------------------------------------------------------------------------------------------------
+def test_new_coord_frd_modes():
+    """
+    fórmula fechada por padrão, geodésica exata com v_frd_exact (o cache é esvaziado na troca)
+    """
+    l_sys = __new_sys(fi_cache=16)
+
+    assert not l_sys.v_frd_exact
+    assert (0, ) + gdsc.destination(-20., -40., 90., 50.) == l_sys.new_coord('D', "ABC", "50", "90")
+
+    l_sys.v_frd_exact = True
+    assert (0, ) + gdsc.direct(-20., -40., 90., 50.)[:2] == l_sys.new_coord('D', "ABC", "50", "90")
+
+    assert __new_sys(fv_frd_exact=True).v_frd_exact
+
+# -------------------------------------------------------------------------------------------------
+def test_new_coord_frd_vec_parity():
+    """
+    new_coord_vec e new_coord_frd_vec coincidem com new_coord, nos dois modos
+    """
+    la_rad = np.array([0., 45., 90., 180., 275.5])
+    la_dst = np.array([1., 10., 50., 100., 250.])
+
+    for lv_exact in (False, True):
+        l_sys = __new_sys(fv_frd_exact=lv_exact)
+
+        lt_ref = np.array([l_sys.new_coord('D', "ABC", str(lf_dst), str(lf_rad))[1:]
+                           for lf_rad, lf_dst in zip(la_rad, la_dst)]).T
+
+        la_rc, la_lat, la_lng = l_sys.new_coord_vec(["D"] * len(la_rad), ["ABC"] * len(la_rad),
+                                                    [str(lf_dst) for lf_dst in la_dst],
+                                                    [str(lf_rad) for lf_rad in la_rad])
+
+        assert (0 == la_rc).all()
+        np.testing.assert_allclose((la_lat, la_lng), lt_ref, rtol=0., atol=1e-9)
+
+        li_rc, la_lat, la_lng = l_sys.new_coord_frd_vec("ABC", la_rad, la_dst)
+
+        assert 0 == li_rc
+        np.testing.assert_allclose((la_lat, la_lng), lt_ref, rtol=0., atol=1e-9)
+
+# -------------------------------------------------------------------------------------------------
+def test_dct_fix_read_only():
+    """
+    os dicionários de fixos e de indicativos não aceitam alterações no lugar, e o dicionário
+    atribuído é copiado (new_coord nunca vê dados desatualizados)
+    """
+    ldct_fix = {"ABC": M_NT_FIX(True, -20., -40.)}
+
+    l_sys = csys.CCoordSys(-22., -43., -21.)
+    l_sys.dct_fix = ldct_fix
+    l_sys.dct_fix_indc = {"A1": "ABC"}
+
+    assert (0, -20., -40.) == l_sys.new_coord('F', "ABC")
+    assert (0, -20., -40.) == l_sys.new_coord('I', "A1")
+
+    # alterações no lugar falham
+    with pytest.raises(TypeError):
+        l_sys.dct_fix["ABC"] = M_NT_FIX(True, -10., -30.)
+
+    with pytest.raises(TypeError):
+        l_sys.dct_fix_indc["A2"] = "ABC"
+
+    # o dicionário original não é o do sistema
+    ldct_fix["ABC"] = M_NT_FIX(True, -10., -30.)
+    assert (0, -20., -40.) == l_sys.new_coord('F', "ABC")
+
+    # alterações pelos métodos do sistema
+    l_sys.set_fix("ABC", M_NT_FIX(True, -10., -30.))
+    assert (0, -10., -30.) == l_sys.new_coord('F', "ABC")
+    assert (0, -10., -30.) == l_sys.new_coord('I', "A1")
+
+    l_sys.del_fix("ABC")
+    assert -1 == l_sys.new_coord('F', "ABC")[0]
+
+# -------------------------------------------------------------------------------------------------
+def test_new_coord_cache_fix_version():
+    """
+    o cache de new_coord segue a versão dos fixos: nenhuma coordenada salva sobrevive a uma
+    alteração dos fixos, mesmo de um objeto alterado no lugar e recompilado com rebuild_fix
+    """
+    class CFixMut(object):
+        """
+        fixo alterável
+        """
+        def __init__(self, ff_lat, ff_lng):
+            self.v_fix_ok, self.f_fix_lat, self.f_fix_lng = True, ff_lat, ff_lng
+
+    l_fix = CFixMut(-20., -40.)
+
+    l_sys = csys.CCoordSys(-22., -43., -21., fi_cache=16)
+    l_sys.set_fix("ABC", l_fix)
+
+    li_ver = l_sys.i_fix_ver
+    assert (0, -20., -40.) == l_sys.new_coord('F', "ABC")
+
+    # objeto do fixo alterado no lugar, recompilado
+    l_fix.f_fix_lat = -10.
+    l_sys.rebuild_fix()
+
+    assert l_sys.i_fix_ver > li_ver
+    assert (0, -10., -40.) == l_sys.new_coord('F', "ABC")
+
+    # novo dicionário de indicativos
+    l_sys.dct_fix_indc = {"A1": "ABC"}
+    assert (0, -10., -40.) == l_sys.new_coord('I', "A1")
+
+    l_sys.dct_fix = {"ABC": M_NT_FIX(True, -5., -35.)}
+    assert (0, -5., -35.) == l_sys.new_coord('F', "ABC")
+    assert (0, -5., -35.) == l_sys.new_coord('I', "A1")
+
+# -------------------------------------------------------------------------------------------------
+def test_snapshot_round_trip(tmp_path):
+    """
+    o instantâneo preserva os fixos inválidos (com as suas coordenadas) e o modo distância/radial
+    """
+    ls_path = str(tmp_path / "sys.snap")
+
+    l_sys = csys.CCoordSys(-22., -43., -21., fv_frd_exact=True)
+    l_sys.dct_fix = {"ABC": M_NT_FIX(True, -20., -40.), "OFF": M_NT_FIX(False, -4., -4.)}
+    l_sys.dct_fix_indc = {"A1": "ABC"}
+
+    l_sys.save_snapshot(ls_path)
+
+    l_new = csys.CCoordSys.load_snapshot(ls_path)
+
+    assert l_new.v_frd_exact
+    assert {ls_fix: tuple(l_fix) for ls_fix, l_fix in l_new.dct_fix.items()} == \
+           {"ABC": (True, -20., -40.), "OFF": (False, -4., -4.)}
+    assert {"A1": "ABC"} == dict(l_new.dct_fix_indc)
+
+    assert l_sys.new_coord('D', "ABC", "50", "90") == l_new.new_coord('D', "ABC", "50", "90")
+    assert -1 == l_new.new_coord('F', "OFF")[0]
+
+# < the end >--------------------------------------------------------------------------------------
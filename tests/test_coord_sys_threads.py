@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+test_coord_sys_threads
+
+conversões concorrentes: várias instâncias de CCoordSys, cada uma com a sua referência, usadas ao
+mesmo tempo por threads devem dar os mesmos resultados que a execução serial. As conversões
+geo2xyz / xyz2geo dependem da referência da instância, também quando ela muda durante a execução
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import collections
+import sys
+import threading
+
+# numpy
+import numpy as np
+
+# libs
+import libs.coords.coord_geog as geog
+import libs.coords.coord_ref as cref
+import libs.coords.coord_sys as csys
+
+# < module data >----------------------------------------------------------------------------------
+
+# número de threads (uma instância de CCoordSys por thread)
+M_THREADS = 8
+
+# repetições por thread
+M_ROUNDS = 50
+
+# dados de um fixo
+M_NT_FIX = collections.namedtuple("CFix", "v_fix_ok f_fix_lat f_fix_lng")
+
+# -------------------------------------------------------------------------------------------------
+def __new_sys(fi_ndx):
+    """
+    cria o sistema de coordenadas da thread fi_ndx, com referência e declinação próprias
+    """
+    l_sys = csys.CCoordSys(-15. - fi_ndx, -47. + fi_ndx, -21. + fi_ndx, fi_cache=64)
+    l_sys.set_fix("FIX", M_NT_FIX(True, -22. + 0.1 * fi_ndx, -43. - 0.1 * fi_ndx))
+
+    # return
+    return l_sys
+
+# -------------------------------------------------------------------------------------------------
+def __run(f_sys, fi_ndx):
+    """
+    executa as conversões de uma thread e retorna os resultados
+    """
+    # pontos da thread
+    la_lat = np.linspace(-30., -10., 200) + fi_ndx
+    la_lng = np.linspace(-55., -35., 200) - fi_ndx
+
+    llst_res = []
+
+    for li_rnd in range(M_ROUNDS):
+        # conversões em lote
+        la_x, la_y, la_z = f_sys.geo2xyz_vec(la_lat, la_lng, 1000.)
+        llst_res.append(np.stack((la_x, la_y, la_z)))
+        llst_res.append(np.stack(f_sys.xyz2geo_vec(la_x, la_y, la_z)))
+
+        # conversões escalares
+        llst_res.append(f_sys.geo2xyz(la_lat[li_rnd], la_lng[li_rnd], 500.))
+        llst_res.append(f_sys.xyz2geo(*llst_res[-1]))
+
+        # coordenadas distância/radial (cache de new_coord)
+        llst_res.append(f_sys.new_coord('D', "FIX", str(li_rnd % 10), str(li_rnd * 7 % 360)))
+
+    # return
+    return llst_res
+
+# -------------------------------------------------------------------------------------------------
+def test_threads_match_serial():
+    """
+    threads com instâncias de referências distintas dão os mesmos resultados que a execução serial
+    """
+    # resultados seriais
+    llst_serial = [__run(__new_sys(li_ndx), li_ndx) for li_ndx in range(M_THREADS)]
+
+    # resultados concorrentes (troca de thread frequente para forçar a intercalação)
+    llst_conc = [None] * M_THREADS
+    l_barrier = threading.Barrier(M_THREADS)
+
+    def __worker(fi_ndx):
+        l_sys = __new_sys(fi_ndx)
+        l_barrier.wait()
+        llst_conc[fi_ndx] = __run(l_sys, fi_ndx)
+
+    lf_switch = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    try:
+        llst_thr = [threading.Thread(target=__worker, args=(li_ndx,)) for li_ndx in range(M_THREADS)]
+
+        for l_thr in llst_thr:
+            l_thr.start()
+
+        for l_thr in llst_thr:
+            l_thr.join()
+
+    finally:
+        sys.setswitchinterval(lf_switch)
+
+    # compara thread a thread
+    for li_ndx in range(M_THREADS):
+        assert llst_conc[li_ndx] is not None
+
+        for l_ser, l_con in zip(llst_serial[li_ndx], llst_conc[li_ndx]):
+            np.testing.assert_array_equal(np.asarray(l_ser), np.asarray(l_con))
+
+# -------------------------------------------------------------------------------------------------
+def test_shared_cache_threads():
+    """
+    uma única instância com cache usada por várias threads dá os mesmos resultados que a serial
+    """
+    l_sys = __new_sys(0)
+
+    # resultados seriais (instância própria)
+    l_ref = __new_sys(0)
+    ldct_serial = {li_key: l_ref.new_coord('D', "FIX", str(li_key % 10), str(li_key * 7 % 360))
+                   for li_key in range(200)}
+
+    llst_err = []
+
+    def __worker(fi_ndx):
+        for li_key in range(fi_ndx, 200 + fi_ndx):
+            li_key %= 200
+
+            if l_sys.new_coord('D', "FIX", str(li_key % 10), str(li_key * 7 % 360)) != ldct_serial[li_key]:
+                llst_err.append(li_key)
+
+    llst_thr = [threading.Thread(target=__worker, args=(li_ndx,)) for li_ndx in range(M_THREADS)]
+
+    for l_thr in llst_thr:
+        l_thr.start()
+
+    for l_thr in llst_thr:
+        l_thr.join()
+
+    assert not llst_err
+
+# -------------------------------------------------------------------------------------------------
+def test_threads_reference_change():
+    """
+    threads trocam a referência das suas instâncias enquanto convertem: cada conversão usa a
+    referência corrente da própria instância
+    """
+    # pontos
+    la_lat = np.linspace(-30., -10., 100)
+    la_lng = np.linspace(-55., -35., 100)
+
+    # duas referências por thread e os resultados esperados de cada uma
+    llst_ref = [((-15. - li_ndx, -47. + li_ndx, 0.), (-5. - li_ndx, -60. + li_ndx, 0.)) for li_ndx in range(M_THREADS)]
+
+    ldct_exp = {lt_ref: geog.geo2xyz_3_vec(la_lat, la_lng, 0., cref.CReferenceFrame(*lt_ref))
+                for lt_pair in llst_ref for lt_ref in lt_pair}
+
+    # as referências produzem resultados distintos
+    assert len({la_exp[0][0] for la_exp in ldct_exp.values()}) == len(ldct_exp)
+
+    llst_err = []
+    l_barrier = threading.Barrier(M_THREADS)
+
+    def __worker(fi_ndx):
+        l_sys = csys.CCoordSys(*llst_ref[fi_ndx][0])
+        l_barrier.wait()
+
+        for li_rnd in range(M_ROUNDS):
+            # troca a referência da instância
+            lt_ref = llst_ref[fi_ndx][li_rnd % 2]
+            l_sys.f_ref_lat, l_sys.f_ref_lng = lt_ref[:2]
+
+            la_x, la_y, la_z = l_sys.geo2xyz_vec(la_lat, la_lng)
+            lt_xyz = l_sys.geo2xyz(la_lat[li_rnd], la_lng[li_rnd])
+
+            la_exp = ldct_exp[lt_ref]
+
+            if not (np.array_equal(la_x, la_exp[0]) and np.array_equal(la_y, la_exp[1])):
+                llst_err.append((fi_ndx, li_rnd, "geo2xyz_vec"))
+
+            if lt_xyz[:2] != (la_exp[0][li_rnd], la_exp[1][li_rnd]):
+                llst_err.append((fi_ndx, li_rnd, "geo2xyz"))
+
+            if not np.allclose(l_sys.xyz2geo_vec(la_x, la_y, la_z)[:2], (la_lat, la_lng), rtol=0., atol=1e-9):
+                llst_err.append((fi_ndx, li_rnd, "xyz2geo_vec"))
+
+            if not np.allclose(l_sys.xyz2geo(*lt_xyz)[:2], (la_lat[li_rnd], la_lng[li_rnd]), rtol=0., atol=1e-9):
+                llst_err.append((fi_ndx, li_rnd, "xyz2geo"))
+
+    lf_switch = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    try:
+        llst_thr = [threading.Thread(target=__worker, args=(li_ndx,)) for li_ndx in range(M_THREADS)]
+
+        for l_thr in llst_thr:
+            l_thr.start()
+
+        for l_thr in llst_thr:
+            l_thr.join()
+
+    finally:
+        sys.setswitchinterval(lf_switch)
+
+    assert not llst_err
+
+# < the end >--------------------------------------------------------------------------------------
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+test_pos_mmap
+
+arquivo colunar mapeado: gravação em blocos e rejeição de blocos com colunas desalinhadas
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import os
+
+# numpy
+import numpy as np
+
+# pytest
+import pytest
+
+# libs
+import libs.coords.coord_ref as cref
+import libs.coords.pos_mmap as pmap
+
+# -------------------------------------------------------------------------------------------------
+def test_write_blocks(tmp_path):
+    """
+    os blocos são concatenados coluna a coluna
+    """
+    ls_path = str(tmp_path / "pos.bin")
+
+    llst_blk = [{"a": [1., 2., 3.], "b": [4., 5., 6.]}, {"a": [7.], "b": [8.]}]
+
+    assert 4 == pmap.write_blocks(ls_path, llst_blk, ["a", "b"], cref.CReferenceFrame(-22., -43., -21.))
+
+    with pmap.CPosMmap(ls_path) as l_map:
+        assert 4 == len(l_map)
+
+        np.testing.assert_array_equal(l_map["a"], [1., 2., 3., 7.])
+        np.testing.assert_array_equal(l_map["b"], [4., 5., 6., 8.])
+
+# -------------------------------------------------------------------------------------------------
+def test_write_blocks_ragged(tmp_path):
+    """
+    bloco com colunas de tamanhos diferentes: ValueError e o destino não é criado
+    """
+    ls_path = str(tmp_path / "pos.bin")
+
+    llst_blk = [{"a": [1., 2., 3.], "b": [4., 5.]}, {"a": [6., 7.], "b": [8., 9., 10.]}]
+
+    with pytest.raises(ValueError):
+        pmap.write_blocks(ls_path, llst_blk, ["a", "b"], cref.CReferenceFrame(-22., -43., -21.))
+
+    assert not os.path.exists(ls_path)
+
+# < the end >--------------------------------------------------------------------------------------
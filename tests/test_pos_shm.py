@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+---------------------------------------------------------------------------------------------------
+test_pos_shm
+
+ciclo de vida dos blocos em memória compartilhada: um processo que apenas abre o bloco não pode
+removê-lo ao terminar (resource_tracker), o segmento é do dono
+
+revision 0.1  2026/out  mlabru
+initial version (Linux/Python)
+---------------------------------------------------------------------------------------------------
+"""
+__version__ = "$revision: 0.1$"
+__author__ = "Milton Abrunhosa"
+__date__ = "2026/10"
+
+# < imports >--------------------------------------------------------------------------------------
+
+# python library
+import os
+import subprocess
+import sys
+import textwrap
+
+# pytest
+import pytest
+
+# < module data >----------------------------------------------------------------------------------
+
+# raiz do repositório (módulos importados pelo nome simples)
+M_DIR_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# dono: cria o bloco, deixa outro processo abri-lo e verifica que o segmento sobrevive
+M_S_OWNER = textwrap.dedent("""
+    import multiprocessing as mp
+    import os
+    import subprocess
+    import sys
+
+    import pos_shm
+
+    def child(f_blk):
+        assert f_blk.cols[0][3] == 7.
+
+    if "__main__" == __name__:
+        l_blk = pos_shm.CPosShm(10)
+        l_blk.cols[0][:] = 7.
+        ls_path = "/dev/shm/" + l_blk.s_name.lstrip("/")
+
+        # processo independente (resource_tracker próprio)
+        if "proc" == sys.argv[1]:
+            ls_code = "import pos_shm; assert pos_shm.attach({!r}).cols[0][3] == 7.".format(l_blk.s_name)
+            subprocess.run([sys.executable, "-c", ls_code], check=True)
+
+        # processo filho (herda o resource_tracker do dono)
+        else:
+            l_prc = mp.get_context(sys.argv[1]).Process(target=child, args=(l_blk,))
+            l_prc.start()
+            l_prc.join()
+            assert 0 == l_prc.exitcode
+
+        # o segmento continua do dono
+        assert os.path.exists(ls_path)
+        assert l_blk.cols[0][3] == 7.
+
+        l_blk.release()
+        assert not os.path.exists(ls_path)
+""")
+
+# -------------------------------------------------------------------------------------------------
+@pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="sem /dev/shm")
+@pytest.mark.parametrize("fs_mode", ["proc", "spawn", "fork"])
+def test_attach_keeps_owner_segment(fs_mode, tmp_path):
+    """
+    o segmento sobrevive ao término de um processo que apenas o abriu, sem avisos do
+    resource_tracker (segmento vazado ou removido duas vezes)
+    """
+    l_env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [M_DIR_ROOT, os.environ.get("PYTHONPATH")])))
+
+    # script do dono (spawn reimporta o __main__ pelo arquivo)
+    l_path = tmp_path / "owner.py"
+    l_path.write_text(M_S_OWNER)
+
+    l_res = subprocess.run([sys.executable, str(l_path), fs_mode], env=l_env, capture_output=True, text=True,
+                           timeout=120)
+
+    assert 0 == l_res.returncode, l_res.stderr
+    assert "" == l_res.stderr
+
+# < the end >--------------------------------------------------------------------------------------